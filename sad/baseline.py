@@ -0,0 +1,140 @@
+"""
+Baseline Runs
+=============
+
+Incremental re-analysis of a revised document against a previous run.
+
+Every run stores page and chunk content hashes in its chunk plan
+(chunk_plan.json). Given the output directory of an earlier run on a
+previous revision of the same report, seed_journal copies into the new
+run's checkpoint journal the units whose inputs did not change:
+
+- phase1: (analyst, chunk) results of chunks with the same pages and
+  content hash;
+- phase2: reviews of the issues from those chunks whose context pages
+  (see PageIndex.pages_for_issue) are all unchanged;
+- phase3: judgments of unchanged chunks. Their unit key includes a digest
+  of the judge's input, so a judgment is only reused if the chunk's
+  confirmed issues and scores are the same.
+
+The phases then run as a resumed run: only changed chunks are analyzed,
+reviewed and judged again.
+
+Usage:
+    baseline = load_baseline("./results/v1")
+    journal = open_journal("./results/v2", resume=False, phases=[...])
+    stats = seed_journal(baseline, journal, "report_v2.json", config)
+"""
+
+import os
+from typing import Any, Dict, List, Optional
+
+from csrd_council_2.config.models import CouncilConfig
+from csrd_council_2.utils.checkpoint import CheckpointJournal, JOURNAL_FILENAME
+from csrd_council_2.utils.chunking import load_chunk_plan, plan_chunks
+from csrd_council_2.utils.page_index import load_page_index
+
+
+class Baseline:
+    """Chunk plan and journaled units of a previous run."""
+
+    def __init__(self, run_dir: str, plan: Dict, records: Dict[str, List[tuple]]):
+        self.run_dir = run_dir
+        self.plan = plan
+        self.records = records
+
+
+def load_baseline(run_dir: str) -> Optional[Baseline]:
+    """
+    Read a previous run's chunk plan and checkpoint journal (in memory, so
+    the new run may write to the same directory).
+
+    Returns:
+        The baseline, or None if the run has no page hashes or no journal
+    """
+    plan = load_chunk_plan(run_dir)
+    journal_path = os.path.join(run_dir, JOURNAL_FILENAME)
+    if not plan or "page_hashes" not in plan or not os.path.exists(journal_path):
+        return None
+
+    journal = CheckpointJournal(journal_path)
+    records = {phase: journal.items(phase) for phase in ("phase1", "phase2", "phase3")}
+    return Baseline(run_dir, plan, records)
+
+
+def _chunk_signature(entry: Dict) -> tuple:
+    return (entry["chunk_id"], entry["page_start"], entry["page_end"], entry.get("content_hash"))
+
+
+def seed_journal(
+    baseline: Baseline,
+    journal: CheckpointJournal,
+    document_path: str,
+    config: CouncilConfig,
+    verbose: bool = True
+) -> Dict[str, Any]:
+    """
+    Copy the baseline's still-valid units into ``journal``.
+
+    Units already in ``journal`` (e.g. a resumed run) are left alone.
+
+    Returns:
+        Reuse stats: unchanged/total chunks, changed pages and units seeded per phase
+    """
+    page_index = load_page_index(document_path)
+    plan = plan_chunks(page_index.pages, config)
+
+    old_hashes = baseline.plan.get("page_hashes", {})
+    changed_pages = {
+        int(n) for n, h in plan["page_hashes"].items() if old_hashes.get(n) != h
+    }
+    old_chunks = {_chunk_signature(c) for c in baseline.plan.get("chunks", [])}
+    unchanged = [c for c in plan["chunks"] if _chunk_signature(c) in old_chunks]
+    unchanged_keys = {f"{c['chunk_id']}:{c['page_start']}-{c['page_end']}" for c in unchanged}
+
+    seeded = {"phase1": 0, "phase2": 0, "phase3": 0}
+
+    def seed(phase: str, actor: str, unit: str, result: Any) -> None:
+        if journal.get(phase, actor, unit) is None:
+            journal.record(phase, actor, unit, result)
+            seeded[phase] += 1
+
+    # Phase 1: analyses of unchanged chunks (and the issues they found)
+    reusable_issues = {}
+    for actor, unit, result in baseline.records["phase1"]:
+        if unit in unchanged_keys:
+            seed("phase1", actor, unit, result)
+            for issue in result.get("issues", []):
+                reusable_issues[issue.get("issue_id")] = issue
+
+    # Phase 2: reviews whose context pages are all unchanged
+    context_unchanged = {}
+    for actor, unit, result in baseline.records["phase2"]:
+        issue = reusable_issues.get(unit)
+        if issue is None:
+            continue
+        if unit not in context_unchanged:
+            pages = page_index.pages_for_issue(issue)
+            context_unchanged[unit] = not any(p["page_number"] in changed_pages for p in pages)
+        if context_unchanged[unit]:
+            seed("phase2", actor, unit, result)
+
+    # Phase 3: judgments of unchanged chunks (the key pins the judge input)
+    for actor, unit, result in baseline.records["phase3"]:
+        if unit.rsplit(":", 1)[0] in unchanged_keys:
+            seed("phase3", actor, unit, result)
+
+    stats = {
+        "baseline_run": baseline.run_dir,
+        "chunks_unchanged": len(unchanged),
+        "chunks_total": len(plan["chunks"]),
+        "pages_changed": len(changed_pages),
+        "units_seeded": seeded
+    }
+
+    if verbose:
+        print(f"📎 Baseline {baseline.run_dir}: {len(unchanged)}/{len(plan['chunks'])} chunk(s) unchanged, "
+              f"{len(changed_pages)} page(s) changed")
+        print(f"   Reused units: {seeded['phase1']} analysis, {seeded['phase2']} review, {seeded['phase3']} judgment")
+
+    return stats
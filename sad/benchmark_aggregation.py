@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Phase 3 Review Aggregation Micro-Benchmark
+==========================================
+
+Times enrich_issues_with_reviews on synthetic issues/reviews to check
+that review aggregation scales linearly with the number of reviews.
+The legacy per-issue scan (aggregate_reviews_for_issue in a loop) is
+timed alongside it for the smaller sizes.
+
+Usage:
+    python benchmark_aggregation.py
+    python benchmark_aggregation.py --sizes 1000 10000 100000 --reviewers 4
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+from typing import Dict, List, Tuple
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from csrd_council_2.phases.phase3_judgment import (
+    enrich_issues_with_reviews, aggregate_reviews_for_issue
+)
+
+
+ISSUE_TYPES = ["NUMERIC_INCONSISTENCY", "MISSING_INFORMATION", "AMBIGUOUS_STATEMENT", "GREENWASHING"]
+RISKS = ["HIGH", "MEDIUM", "LOW", "NONE"]
+
+# Above this many reviews the quadratic legacy scan is skipped
+LEGACY_MAX_REVIEWS = 20000
+
+
+def make_dataset(num_reviews: int, num_reviewers: int, seed: int = 42) -> Tuple[List[Dict], List[Dict]]:
+    """Build ``num_reviews / num_reviewers`` issues, each reviewed by every reviewer."""
+    rng = random.Random(seed)
+    num_issues = max(1, num_reviews // num_reviewers)
+    issues = [
+        {"issue_id": f"A-C{i // 20}-{i:06d}", "type": rng.choice(ISSUE_TYPES), "title": f"Issue {i}"}
+        for i in range(num_issues)
+    ]
+    reviews = [
+        {
+            "issue_id": issue["issue_id"],
+            "reviewer_id": f"Reviewer-{r}",
+            "high_fp_risk": issue["type"] in ISSUE_TYPES[1:3],
+            "evaluation": {
+                "validity_score": rng.random(),
+                "evidence_score": rng.random(),
+                "cross_section_risk": rng.choice(RISKS)
+            }
+        }
+        for r in range(num_reviewers)
+        for issue in issues
+    ]
+    return issues, reviews
+
+
+def time_call(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Phase 3 review aggregation")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 10000, 20000, 50000, 100000],
+                        help="Numbers of reviews to benchmark")
+    parser.add_argument("--reviewers", type=int, default=4, help="Reviewers per issue")
+    args = parser.parse_args()
+
+    print(f"{'reviews':>10} {'issues':>8} {'indexed (s)':>12} {'µs/review':>10} {'legacy (s)':>11}")
+    for size in args.sizes:
+        issues, reviews = make_dataset(size, args.reviewers)
+        indexed = time_call(lambda: enrich_issues_with_reviews(issues, reviews))
+
+        legacy = "skipped"
+        if size <= LEGACY_MAX_REVIEWS:
+            seconds = time_call(lambda: [aggregate_reviews_for_issue(i["issue_id"], reviews) for i in issues])
+            legacy = f"{seconds:.3f}"
+
+        print(f"{size:>10} {len(issues):>8} {indexed:>12.4f} {indexed / size * 1e6:>10.2f} {legacy:>11}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
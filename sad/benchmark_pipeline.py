@@ -0,0 +1,510 @@
+#!/usr/bin/env python3
+"""
+Full Pipeline Benchmark
+=======================
+
+Runs run_full_pipeline end to end on synthetic CSRD documents with a
+synthetic LLM, to measure the local cost of the pipeline at realistic
+scale (50 / 300 / 1000 pages by default).
+
+SyntheticLLMClient answers analyst, reviewer (single and batched) and
+judge prompts with well-formed JSON built from the document itself
+(evidence quotes are real sentences of the cited page), with a
+configurable issue density and simulated latency. Answers are seeded
+from the prompt, so every run of a case makes the same calls. With
+``--stream`` the client streams its answers (see utils/llm_stream.py),
+and ``--ramble-chars`` appends prose after the JSON object, as chatty
+models do, to measure what stopping the stream at the object's end saves.
+
+For each document size the benchmark reports:
+- per-phase wall time and process CPU time (the LLM latency is a sleep,
+  so CPU time is the pipeline's own overhead);
+- peak Python heap (tracemalloc) and the process peak RSS;
+- LLM calls and tokens per phase (from utils/telemetry.py).
+
+Results are written to a JSON file; ``--compare`` checks them against a
+previous results file and exits with 1 when CPU time or peak memory grew
+by more than ``--tolerance``.
+
+Usage:
+    python benchmark_pipeline.py -c config.json
+    python benchmark_pipeline.py -c config.json --sizes 50 300 --issue-density 0.5 --latency-ms 20
+    python benchmark_pipeline.py -c config.json --latency-ms 50 --ramble-chars 800 --stream
+    python benchmark_pipeline.py -c config.json --compare benchmark_baseline.json
+"""
+
+import io
+import os
+import re
+import sys
+import json
+import time
+import random
+import hashlib
+import argparse
+import platform
+import tempfile
+import threading
+import tracemalloc
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from csrd_council_2.config.models import CouncilConfig, ModelConfig
+from csrd_council_2.run_council import run_full_pipeline
+from csrd_council_2.utils.helpers import save_json, get_timestamp
+from csrd_council_2.utils.llm_cache import create_llm_client
+from csrd_council_2.utils.telemetry import SYSTEM_PROMPT_PHASES, get_telemetry
+
+
+DEFAULT_SIZES = [50, 300, 1000]
+DEFAULT_OUTPUT = "benchmark_pipeline.json"
+
+# Relative growth of cpu_s / peak memory reported as a regression by --compare
+DEFAULT_TOLERANCE = 0.2
+
+ISSUE_TYPES = ["DATA_INTEGRITY", "COMPLIANCE_GAP", "COHERENCE_BREAK", "CLARITY_RISK", "GREENWASHING", "BUSINESS_LOGIC_GAP"]
+SEVERITIES = ["CRITICAL", "HIGH", "MEDIUM", "LOW"]
+LEVELS = ["HIGH", "MEDIUM", "LOW"]
+RISKS = ["HIGH", "MEDIUM", "LOW", "NONE"]
+
+# Streamed answers: characters per piece, share of the latency before the first piece
+STREAM_PIECE_CHARS = 64
+TIME_TO_FIRST_PIECE = 0.3
+
+RAMBLE = "\n\nRemarque : cette analyse repose uniquement sur les extraits fournis et devrait être complétée. "
+
+TOPICS = [
+    ("E1", "Changement climatique"), ("E2", "Pollution"), ("E3", "Ressources aquatiques"),
+    ("E4", "Biodiversité"), ("E5", "Économie circulaire"), ("S1", "Effectifs de l'entreprise"),
+    ("S2", "Travailleurs de la chaîne de valeur"), ("G1", "Conduite des affaires")
+]
+
+SENTENCES = [
+    "Les émissions de scope {a} s'élèvent à {n} tCO2e en {y}, soit une variation de {p} % par rapport à {y0}.",
+    "La consommation d'énergie du site {site} atteint {n} MWh, dont {p} % d'origine renouvelable.",
+    "Le groupe emploie {n} collaborateurs au 31 décembre {y}, avec un taux de rotation de {p} %.",
+    "Notre engagement pour une planète durable guide chacune de nos décisions stratégiques.",
+    "Les politiques relatives à ce thème sont décrites à la section {a}.{b} du présent rapport.",
+    "Les prélèvements d'eau représentent {n} m3 sur l'exercice {y}, en baisse de {p} %.",
+    "Le taux de fréquence des accidents du travail s'établit à {p} pour le périmètre consolidé.",
+    "Un plan de transition aligné sur une trajectoire de {a},5 °C a été validé par le conseil d'administration.",
+    "Les déchets non dangereux valorisés atteignent {p} % du total, soit {n} tonnes.",
+    "Aucune procédure de sanction pour corruption n'a été engagée au cours de l'exercice {y}."
+]
+
+SITES = ["Lyon", "Lille", "Nantes", "Bordeaux", "Toulouse", "Rennes"]
+
+
+# ============================================================================
+# SYNTHETIC DOCUMENT
+# ============================================================================
+
+def make_document(num_pages: int, sentences_per_page: int = 24, seed: int = 42) -> List[Dict]:
+    """Build ``num_pages`` pages of CSRD-style French text (page_number, content)."""
+    rng = random.Random(seed)
+    pages = []
+    for page_num in range(1, num_pages + 1):
+        code, topic = TOPICS[(page_num - 1) * len(TOPICS) // num_pages]
+        lines = [f"## {code} — {topic}", ""]
+        for _ in range(sentences_per_page):
+            y = rng.randint(2021, 2024)
+            lines.append(rng.choice(SENTENCES).format(
+                a=rng.randint(1, 3), b=rng.randint(1, 9), n=rng.randint(100, 999999),
+                p=rng.randint(1, 99), y=y, y0=y - 1, site=rng.choice(SITES)
+            ))
+        pages.append({"page_number": page_num, "content": "\n".join(lines)})
+    return pages
+
+
+# ============================================================================
+# SYNTHETIC LLM
+# ============================================================================
+
+def prompt_role(system_prompt: Optional[str]) -> str:
+    """"analyst", "reviewer", "judge" or "other", from a call's system prompt."""
+    return {"phase1": "analyst", "phase2": "reviewer", "phase3": "judge"}.get(
+        SYSTEM_PROMPT_PHASES.get(system_prompt), "other"
+    )
+
+
+@dataclass
+class SyntheticResponse:
+    """Response of the synthetic LLM (same fields the phases read from LLMClient)."""
+    answer: str
+    success: bool = True
+    error: Optional[str] = None
+
+
+class SyntheticLLMClient:
+    """
+    Stand-in for LLMClient answering the council's prompts from the
+    document's pages (or, without ``pages``, from the document text quoted
+    in the prompt).
+
+    Args:
+        pages: The benchmark document (optional)
+        issue_density: Issues reported per analyzed page (per analyst)
+        latency_ms: Mean simulated latency of a call
+        latency_jitter_ms: Latency is uniform in mean ± jitter
+        confirm_rate: Share of issues the judge confirms
+        seed: Seed mixed into every call's random generator
+        stream: Offer ``generate_stream``
+        ramble_chars: Prose appended after every JSON answer (the latency
+            covers the whole output, prose included)
+    """
+
+    def __init__(
+        self,
+        pages: Optional[List[Dict]] = None,
+        issue_density: float = 0.3,
+        latency_ms: float = 0.0,
+        latency_jitter_ms: float = 0.0,
+        confirm_rate: float = 0.7,
+        seed: int = 42,
+        stream: bool = False,
+        ramble_chars: int = 0
+    ):
+        self.sentences = {
+            p["page_number"]: [line for line in p["content"].split("\n") if line.endswith(".")]
+            for p in pages or []
+        }
+        self.issue_density = issue_density
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.confirm_rate = confirm_rate
+        self.seed = seed
+        self.supports_streaming = stream
+        self.ramble = (RAMBLE * (ramble_chars // len(RAMBLE) + 1))[:ramble_chars]
+        self.calls = {"analyst": 0, "reviewer": 0, "judge": 0, "other": 0}
+        self._lock = threading.Lock()
+
+    def _rng(self, model_name: str, user_prompt: str) -> random.Random:
+        digest = hashlib.sha256(f"{self.seed}\0{model_name}\0{user_prompt}".encode("utf-8")).digest()
+        return random.Random(int.from_bytes(digest[:8], "big"))
+
+    def _latency(self, model_name: str, user_prompt: str) -> float:
+        if self.latency_ms <= 0:
+            return 0.0
+        rng = self._rng(model_name, user_prompt)
+        delay = rng.uniform(self.latency_ms - self.latency_jitter_ms, self.latency_ms + self.latency_jitter_ms)
+        return max(0.0, delay) / 1000
+
+    def _count(self, system_prompt: Optional[str]) -> None:
+        with self._lock:
+            self.calls[prompt_role(system_prompt)] += 1
+
+    def generate(self, model: ModelConfig, user_prompt: str, system_prompt: str = None, **kwargs):
+        self._count(system_prompt)
+        time.sleep(self._latency(model.name, user_prompt))
+        return SyntheticResponse(answer=self.respond(model.name, user_prompt, system_prompt) + self.ramble)
+
+    def generate_stream(self, model: ModelConfig, user_prompt: str, system_prompt: str = None, **kwargs):
+        """Yield the answer in pieces, spreading the latency over the output."""
+        self._count(system_prompt)
+        delay = self._latency(model.name, user_prompt)
+        answer = self.respond(model.name, user_prompt, system_prompt) + self.ramble
+        pieces = [answer[i:i + STREAM_PIECE_CHARS] for i in range(0, len(answer), STREAM_PIECE_CHARS)]
+        time.sleep(delay * TIME_TO_FIRST_PIECE)
+        for piece in pieces:
+            yield piece
+            time.sleep(delay * (1 - TIME_TO_FIRST_PIECE) / len(pieces))
+
+    def respond(self, model_name: str, user_prompt: str, system_prompt: Optional[str] = None) -> str:
+        """The JSON answer to a prompt (no latency, not counted)."""
+        rng = self._rng(model_name, user_prompt)
+        role = prompt_role(system_prompt)
+        if role == "analyst":
+            answer = self._analyst_answer(user_prompt, rng)
+        elif role == "reviewer":
+            answer = self._reviewer_answer(user_prompt, rng)
+        elif role == "judge":
+            answer = self._judge_answer(user_prompt, rng)
+        else:
+            answer = {}
+        return json.dumps(answer, ensure_ascii=False)
+
+    def _quotes(self, page_num: int, user_prompt: str) -> List[str]:
+        if page_num in self.sentences:
+            return self.sentences[page_num]
+        match = re.search(r"=== (?:CONTENU DU DOCUMENT|CONTEXTE DOCUMENT).*?===\n(.*?)=== FIN DU", user_prompt, re.S)
+        lines = [line.strip() for line in (match.group(1) if match else "").split("\n")]
+        return [line for line in lines if line.endswith(".")] or ["(page vide)"]
+
+    def _analyst_answer(self, user_prompt: str, rng: random.Random) -> Dict:
+        analyst = re.search(r"analyst_id: (.+)", user_prompt).group(1).strip()
+        chunk_id = int(re.search(r"chunk_id: (\d+)", user_prompt).group(1))
+        page_start, page_end = map(int, re.search(r"pages_analyzed: (\d+)-(\d+)", user_prompt).groups())
+
+        num_pages = page_end - page_start + 1
+        num_issues = int(self.issue_density * num_pages + rng.random())
+        issues = []
+        for i in range(num_issues):
+            page_num = rng.randint(page_start, page_end)
+            issue_type = rng.choice(ISSUE_TYPES)
+            quote = rng.choice(self._quotes(page_num, user_prompt))
+            issues.append({
+                "issue_id": f"{analyst}-{chunk_id}-{i + 1}",
+                "type": issue_type,
+                "severity": rng.choice(SEVERITIES),
+                "confidence": rng.choice(LEVELS),
+                "title": f"{issue_type.replace('_', ' ').title()} page {page_num}",
+                "description": f"Incohérence possible dans l'affirmation : {quote}",
+                "page_references": [f"page {page_num}"],
+                "evidence": [quote],
+                "why_this_is_an_issue": "Le lecteur ne peut pas vérifier le chiffre annoncé.",
+                "recommendation": "Préciser le périmètre et la méthode de calcul.",
+                "cross_section_check_needed": rng.random() < 0.3,
+                "cross_section_note": ""
+            })
+        return {
+            "analyst_id": analyst,
+            "chunk_id": chunk_id,
+            "pages_analyzed": f"{page_start}-{page_end}",
+            "chunk_context": "Rapport de durabilité (document synthétique)",
+            "issues": issues,
+            "sections_analyzed": f"Pages {page_start} à {page_end}",
+            "potential_greenwashing_signals": [],
+            "analysis_limitations": ""
+        }
+
+    def _evaluation(self, rng: random.Random) -> Dict:
+        validity = round(rng.uniform(0.2, 1.0), 2)
+        return {
+            "is_valid": validity >= 0.5,
+            "validity_score": validity,
+            "validity_reasoning": "Évaluation synthétique.",
+            "evidence_found_in_context": True,
+            "evidence_score": round(rng.uniform(0.5, 1.0), 2),
+            "evidence_notes": "",
+            "categorization_correct": True,
+            "suggested_category": None,
+            "severity_appropriate": True,
+            "recommended_severity": rng.choice(SEVERITIES),
+            "severity_reasoning": "",
+            "potential_false_positive_reasons": [],
+            "cross_section_risk": rng.choice(RISKS),
+            "cross_section_reasoning": "",
+            "overall_assessment": "VALID" if validity >= 0.5 else "INVALID",
+            "final_recommendation": "CONFIRM" if validity >= 0.5 else "DISMISS"
+        }
+
+    def _reviewer_answer(self, user_prompt: str, rng: random.Random) -> Dict:
+        reviewer = re.search(r"Reviewer: (.+)", user_prompt).group(1).strip()
+        issue_ids = re.findall(r"Issue ID: (\S+)", user_prompt)
+        if "=== ISSUES À ÉVALUER" in user_prompt:
+            return {
+                "reviewer_id": reviewer,
+                "evaluations": [{"issue_id": i, "evaluation": self._evaluation(rng)} for i in issue_ids]
+            }
+        return {"reviewer_id": reviewer, "issue_id": issue_ids[0], "evaluation": self._evaluation(rng)}
+
+    def _judge_answer(self, user_prompt: str, rng: random.Random) -> Dict:
+        call = user_prompt.split("=== ISSUES À VÉRIFIER")[-1]
+        chunk_id = int(re.search(r"chunk_id: (\d+)", call).group(1))
+        issues = json.loads(call[call.index("["):call.rindex("]") + 1])
+
+        confirmed, dismissed = [], []
+        for issue in issues:
+            if rng.random() < self.confirm_rate:
+                confirmed.append({
+                    "final_id": f"CHUNK{chunk_id}-{len(confirmed) + 1:03d}",
+                    "grouped_issue_ids": [issue["issue_id"]],
+                    "type": issue.get("type"),
+                    "final_severity": issue.get("severity") or "MEDIUM",
+                    "title": issue.get("title"),
+                    "description": issue.get("description"),
+                    "evidence_verified": True,
+                    "evidence_location": ", ".join(issue.get("page_references", [])),
+                    "grouping_rationale": "",
+                    "validation_notes": "Vérification synthétique."
+                })
+            else:
+                dismissed.append({
+                    "issue_id": issue["issue_id"],
+                    "reason": "NOT_AN_ISSUE",
+                    "detailed_explanation": "Rejet synthétique."
+                })
+        return {
+            "chunk_validation": {
+                "chunk_id": chunk_id,
+                "issues_received": len(issues),
+                "issues_confirmed": len(confirmed),
+                "issues_dismissed": len(dismissed)
+            },
+            "confirmed_issues": confirmed,
+            "dismissed_issues": dismissed
+        }
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def _max_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _run_pipeline(pages: List[Dict], config: CouncilConfig, args: argparse.Namespace) -> None:
+    client = SyntheticLLMClient(
+        pages, args.issue_density, args.latency_ms, args.latency_jitter_ms, seed=args.seed,
+        stream=args.stream, ramble_chars=args.ramble_chars
+    )
+    llm_client = create_llm_client(mock_mode=True, base_client=client)
+
+    with tempfile.TemporaryDirectory(prefix="csrd_bench_") as work_dir:
+        document_path = os.path.join(work_dir, "document.json")
+        save_json({"pages": pages}, document_path)
+        with redirect_stdout(sys.stdout if args.verbose else io.StringIO()):
+            run_full_pipeline(
+                document_path=document_path,
+                config=config,
+                output_dir=os.path.join(work_dir, "results"),
+                mock_mode=True,
+                verbose=args.verbose,
+                max_workers=args.workers,
+                pipelined=args.pipelined,
+                review_batch_size=args.review_batch_size,
+                llm_client=llm_client
+            )
+
+
+def run_case(num_pages: int, config: CouncilConfig, args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Run the full pipeline on a ``num_pages`` synthetic document and collect
+    its metrics. With ``args.tracemalloc`` the pipeline is run a second
+    time under tracemalloc for the peak heap (tracing slows Python down
+    several times, so it is kept out of the timed run).
+    """
+    pages = make_document(num_pages, seed=args.seed)
+
+    peak_heap = None
+    if args.tracemalloc:
+        tracemalloc.start()
+        _run_pipeline(pages, config, args)
+        peak_heap = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 1)
+        tracemalloc.stop()
+
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    _run_pipeline(pages, config, args)
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    telemetry = get_telemetry()
+    llm_calls: Dict[str, int] = {}
+    tokens: Dict[str, int] = {}
+    for row in telemetry.summarize():
+        if row["kind"] == "llm":
+            llm_calls[row["phase"]] = llm_calls.get(row["phase"], 0) + row["calls"]
+            tokens[row["phase"]] = tokens.get(row["phase"], 0) + row["prompt_tokens"] + row["completion_tokens"]
+
+    return {
+        "pages": num_pages,
+        "wall_s": round(wall, 3),
+        "cpu_s": round(cpu, 3),
+        "phase_wall_s": telemetry.phase_durations(),
+        "phase_cpu_s": telemetry.phase_durations("cpu_s"),
+        "peak_heap_mb": peak_heap,
+        "max_rss_mb": _max_rss_mb(),
+        "llm_calls": llm_calls,
+        "llm_tokens": tokens
+    }
+
+
+def compare_results(results: List[Dict], previous: Dict, tolerance: float) -> List[str]:
+    """Regressions of cpu_s / peak_heap_mb against a previous results file (same page counts only)."""
+    previous_by_pages = {r["pages"]: r for r in previous.get("results", [])}
+    regressions = []
+    for result in results:
+        before = previous_by_pages.get(result["pages"])
+        if not before:
+            continue
+        for metric in ("cpu_s", "peak_heap_mb"):
+            old, new = before.get(metric), result.get(metric)
+            if old and new and new > old * (1 + tolerance):
+                regressions.append(f"{result['pages']} pages: {metric} {old} → {new} (+{(new / old - 1):.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the full pipeline on synthetic documents")
+    parser.add_argument("-c", "--config", required=True, help="Council config JSON (models are not called)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Document sizes in pages")
+    parser.add_argument("--issue-density", type=float, default=0.3, help="Issues per page per analyst")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Mean simulated LLM latency")
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0, help="Latency spread (uniform ±)")
+    parser.add_argument("--stream", action="store_true", help="Stream the synthetic answers")
+    parser.add_argument("--ramble-chars", type=int, default=0, help="Prose after each JSON answer")
+    parser.add_argument("--workers", type=int, default=None, help="Worker pool size")
+    parser.add_argument("--pipelined", action="store_true", help="Benchmark the pipelined mode")
+    parser.add_argument("--review-batch-size", type=int, default=None, help="Issues per reviewer call")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-tracemalloc", dest="tracemalloc", action="store_false",
+                        help="Skip the heap-tracing run (no peak_heap_mb)")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help="Results JSON file")
+    parser.add_argument("--compare", default=None, help="Previous results file to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed relative growth of cpu_s / peak_heap_mb")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Show pipeline output")
+    args = parser.parse_args()
+
+    config = CouncilConfig.from_json(args.config)
+
+    print(f"{'pages':>6} {'wall s':>8} {'cpu s':>8} {'heap MB':>8} {'calls':>7}   phase wall s")
+    results = []
+    for size in args.sizes:
+        result = run_case(size, config, args)
+        results.append(result)
+        phases = "  ".join(f"{k}={v:.2f}" for k, v in result["phase_wall_s"].items())
+        print(f"{size:>6} {result['wall_s']:>8.2f} {result['cpu_s']:>8.2f} {result['peak_heap_mb'] or 0:>8.1f} "
+              f"{sum(result['llm_calls'].values()):>7}   {phases}")
+
+    report = {
+        "benchmark": "pipeline",
+        "timestamp": get_timestamp(),
+        "python": platform.python_version(),
+        "settings": {
+            "config": args.config,
+            "issue_density": args.issue_density,
+            "latency_ms": args.latency_ms,
+            "latency_jitter_ms": args.latency_jitter_ms,
+            "stream": args.stream,
+            "ramble_chars": args.ramble_chars,
+            "workers": args.workers,
+            "pipelined": args.pipelined,
+            "review_batch_size": args.review_batch_size,
+            "seed": args.seed,
+            "tracemalloc": args.tracemalloc
+        },
+        "results": results
+    }
+    save_json(report, args.output)
+    print(f"\n💾 Saved: {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            regressions = compare_results(results, json.load(f), args.tolerance)
+        if regressions:
+            print(f"\n❌ Regressions vs {args.compare}:")
+            for line in regressions:
+                print(f"   {line}")
+            return 1
+        print(f"\n✅ No regression vs {args.compare} (tolerance {args.tolerance:.0%})")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+Checkpoint Journal
+==================
+
+Append-only JSONL journal of completed pipeline work units.
+
+Every (phase, actor, unit) result is appended as soon as it returns,
+e.g. ("phase1", "Analyst-A", "3:61-90") for one analyst × chunk call or
+("phase2", "Reviewer-1", <issue_id>) for one review. A resumed run
+replays the journal, skips units already recorded and rebuilds the phase
+output files from the restored results.
+
+Only successful units are recorded, so failed LLM calls are retried on
+resume.
+"""
+
+import os
+import json
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+JOURNAL_FILENAME = "checkpoint_journal.jsonl"
+
+
+class CheckpointJournal:
+    """Thread-safe append-only journal of completed work units."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._records: Dict[Tuple[str, str, str], Any] = {}
+        if os.path.exists(path):
+            self._load()
+
+    def _load(self) -> None:
+        # Cut a torn trailing write so new records start on a fresh line
+        with open(self.path, "rb+") as f:
+            data = f.read()
+            if data and not data.endswith(b"\n"):
+                f.truncate(data.rfind(b"\n") + 1)
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Torn write from a crash: ignore the partial line
+                    continue
+                key = (record["phase"], record["actor"], record["unit"])
+                self._records[key] = record["result"]
+
+    def discard(self, phases: Iterable[str]) -> None:
+        """Drop all records of ``phases`` (used when starting those phases fresh)."""
+        phases = set(phases)
+        with self._lock:
+            self._records = {k: v for k, v in self._records.items() if k[0] not in phases}
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                for (phase, actor, unit), result in self._records.items():
+                    f.write(self._encode(phase, actor, unit, result))
+
+    @staticmethod
+    def _encode(phase: str, actor: str, unit: str, result: Any) -> str:
+        return json.dumps(
+            {"phase": phase, "actor": actor, "unit": unit, "result": result},
+            ensure_ascii=False
+        ) + "\n"
+
+    def get(self, phase: str, actor: str, unit: str) -> Optional[Any]:
+        """Return the recorded result of a unit, or None."""
+        with self._lock:
+            return self._records.get((phase, actor, str(unit)))
+
+    def record(self, phase: str, actor: str, unit: str, result: Any) -> None:
+        """Append a completed unit and flush it to disk immediately."""
+        line = self._encode(phase, actor, str(unit), result)
+        with self._lock:
+            self._records[(phase, actor, str(unit))] = result
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+
+    def items(self, phase: str) -> List[Tuple[str, str, Any]]:
+        """(actor, unit, result) of every recorded unit of a phase."""
+        with self._lock:
+            return [(k[1], k[2], v) for k, v in self._records.items() if k[0] == phase]
+
+    def count(self, phase: str) -> int:
+        """Number of recorded units for a phase."""
+        with self._lock:
+            return sum(1 for key in self._records if key[0] == phase)
+
+
+def open_journal(output_dir: str, resume: bool, phases: Iterable[str]) -> CheckpointJournal:
+    """
+    Open the run journal in ``output_dir``.
+
+    Without ``resume``, previous records of ``phases`` are discarded so
+    those phases start from scratch.
+    """
+    journal = CheckpointJournal(os.path.join(output_dir, JOURNAL_FILENAME))
+    if not resume:
+        journal.discard(phases)
+    return journal
+
+
+def run_checkpointed(
+    journal: Optional[CheckpointJournal],
+    phase: str,
+    actor: str,
+    unit: str,
+    compute: Callable[[], Any],
+    succeeded: Callable[[Any], bool] = lambda result: True
+) -> Any:
+    """
+    Return a unit's journaled result, or compute it and journal it.
+
+    Args:
+        journal: Run journal (None disables checkpointing)
+        phase, actor, unit: Unit identity
+        compute: Produces the unit result
+        succeeded: Only results passing this check are recorded
+
+    Returns:
+        Unit result
+    """
+    if journal is None:
+        return compute()
+
+    restored = journal.get(phase, actor, unit)
+    if restored is not None:
+        return restored
+
+    result = compute()
+    if succeeded(result):
+        journal.record(phase, actor, unit, result)
+    return result
@@ -0,0 +1,331 @@
+"""
+Chunk Planning
+==============
+
+Token-budget-aware document chunking shared by Phase 1 and Phase 3.
+
+Pages are measured in tokens and packed into chunks up to a per-model
+token budget, so dense table pages do not overflow the context window
+and prose-heavy sections do not waste calls. Consecutive chunks overlap
+by up to ``overlap`` tokens worth of whole pages.
+
+The budget is the smallest one among the analysts and the judge, read
+from ModelConfig:
+- ``chunk_token_budget``: explicit budget for the document text of a chunk
+- otherwise ``context_window`` × CONTEXT_BUDGET_FRACTION (room is left
+  for the prompt template, issues and the answer)
+
+When no model declares either, the legacy fixed page-count chunking
+(``config.pages_per_chunk`` / ``config.chunk_overlap_pages``) is used.
+
+Phase 1 saves the plan to chunk_plan.json; Phase 3 rebuilds its chunks
+from that file, so ``source_chunk`` ids always refer to the same pages.
+
+The plan also stores a content hash of every page and chunk, so a later
+run on a revised document can tell which chunks are unchanged (see
+utils/baseline.py).
+
+Pages in an overlap are analyzed by two chunks. Each page is owned by
+exactly one of them (see page_owners), and resolve_overlap_issues moves
+every issue to the chunk owning its first referenced page, dropping it
+when the owning chunk already reported the same finding.
+"""
+
+import os
+import json
+import hashlib
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from csrd_council_2.config.models import CouncilConfig, ModelConfig
+from csrd_council_2.utils.helpers import chunk_by_pages, save_json
+from csrd_council_2.utils.page_index import extract_page_numbers_from_refs
+from csrd_council_2.utils.issue_clustering import (
+    issue_shingles, jaccard, DEFAULT_SIMILARITY_THRESHOLD
+)
+
+
+CHUNK_PLAN_FILENAME = "chunk_plan.json"
+
+# Share of a model's context window given to the document text of a chunk
+CONTEXT_BUDGET_FRACTION = 0.5
+
+# Overlap between chunks, as a share of the budget (unless configured)
+DEFAULT_OVERLAP_FRACTION = 0.1
+
+# Token estimate when tiktoken is not installed
+CHARS_PER_TOKEN = 4
+
+_encoding_lock = threading.Lock()
+_encoding: Any = None
+
+
+def _get_encoding() -> Any:
+    """tiktoken's cl100k_base encoding, or False when unavailable."""
+    global _encoding
+    with _encoding_lock:
+        if _encoding is None:
+            try:
+                import tiktoken
+                _encoding = tiktoken.get_encoding("cl100k_base")
+            except Exception:
+                _encoding = False
+        return _encoding
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens with tiktoken when available, else estimate from length."""
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding:
+        return len(encoding.encode(text, disallowed_special=()))
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def get_chunk_token_budget(model: ModelConfig) -> Optional[int]:
+    """Token budget for a chunk's document text sent to ``model`` (None = not configured)."""
+    budget = getattr(model, "chunk_token_budget", None)
+    if isinstance(budget, int) and budget > 0:
+        return budget
+    context_window = getattr(model, "context_window", None)
+    if isinstance(context_window, int) and context_window > 0:
+        return int(context_window * CONTEXT_BUDGET_FRACTION)
+    return None
+
+
+def get_plan_token_budget(config: CouncilConfig) -> Optional[int]:
+    """Smallest budget among the analysts and the judge (None = none configured)."""
+    models = list(config.analysts) + ([config.judge] if config.judge else [])
+    budgets = [b for b in (get_chunk_token_budget(m) for m in models) if b]
+    return min(budgets) if budgets else None
+
+
+def pack_pages(page_tokens: List[int], budget: int, overlap: int) -> List[tuple]:
+    """
+    Group consecutive pages into chunks of at most ``budget`` tokens.
+
+    A page larger than the budget becomes a chunk of its own. Each chunk
+    after the first starts with the trailing pages of the previous one,
+    up to ``overlap`` tokens (never the whole previous chunk).
+
+    Returns:
+        (start, end) page index ranges, end exclusive
+    """
+    ranges = []
+    start = 0
+    while start < len(page_tokens):
+        end = start + 1
+        total = page_tokens[start]
+        while end < len(page_tokens) and total + page_tokens[end] <= budget:
+            total += page_tokens[end]
+            end += 1
+        ranges.append((start, end))
+        if end >= len(page_tokens):
+            break
+
+        next_start = end
+        carried = 0
+        while next_start - 1 > start and carried + page_tokens[next_start - 1] <= overlap:
+            carried += page_tokens[next_start - 1]
+            next_start -= 1
+        start = next_start
+    return ranges
+
+
+def page_hash(content: str) -> str:
+    """Content hash of a page (hex, 16 chars)."""
+    return hashlib.sha256((content or "").encode("utf-8")).hexdigest()[:16]
+
+
+def chunk_content_hash(page_hashes: Dict[str, str], page_start: int, page_end: int) -> str:
+    """Content hash of a page range, from its page hashes."""
+    joined = ",".join(page_hashes.get(str(n), "") for n in range(page_start, page_end + 1))
+    return hashlib.sha256(joined.encode("utf-8")).hexdigest()[:16]
+
+
+def _build_chunk(pages: List[Dict], chunk_id: int) -> Dict:
+    """Chunk dict for a run of pages, in chunk_by_pages' format."""
+    chunk = chunk_by_pages(pages, pages_per_chunk=len(pages), overlap_pages=0)[0]
+    chunk["chunk_id"] = chunk_id
+    return chunk
+
+
+def plan_chunks(pages: List[Dict], config: CouncilConfig) -> Dict:
+    """
+    Build the document's chunk plan.
+
+    Returns:
+        Plan dict: "strategy" ("token_budget" or "pages"), "token_budget",
+        "overlap_tokens", "page_hashes" (page number → hash) and "chunks"
+        (chunk_id, page_start, page_end, tokens, content_hash)
+    """
+    page_tokens = [count_tokens(p.get("content", "")) for p in pages]
+    budget = get_plan_token_budget(config)
+
+    if budget is None:
+        chunks = chunk_by_pages(pages, config.pages_per_chunk, config.chunk_overlap_pages)
+        strategy, overlap = "pages", None
+    else:
+        overlap = getattr(config, "chunk_overlap_tokens", None)
+        if not isinstance(overlap, int) or overlap < 0:
+            overlap = int(budget * DEFAULT_OVERLAP_FRACTION)
+        ranges = pack_pages(page_tokens, budget, overlap)
+        chunks = [_build_chunk(pages[s:e], i + 1) for i, (s, e) in enumerate(ranges)]
+        strategy = "token_budget"
+
+    tokens_by_page = {p["page_number"]: t for p, t in zip(pages, page_tokens)}
+    page_hashes = {str(p["page_number"]): page_hash(p.get("content", "")) for p in pages}
+    return {
+        "strategy": strategy,
+        "token_budget": budget,
+        "overlap_tokens": overlap,
+        "page_hashes": page_hashes,
+        "chunks": [
+            {
+                "chunk_id": c["chunk_id"],
+                "page_start": c["page_start"],
+                "page_end": c["page_end"],
+                "tokens": sum(t for n, t in tokens_by_page.items() if c["page_start"] <= n <= c["page_end"]),
+                "content_hash": chunk_content_hash(page_hashes, c["page_start"], c["page_end"])
+            }
+            for c in chunks
+        ]
+    }
+
+
+def chunks_from_plan(pages: List[Dict], plan: Dict) -> List[Dict]:
+    """Rebuild chunk dicts (with text) from a plan."""
+    chunks = []
+    for entry in plan["chunks"]:
+        chunk_pages = [p for p in pages if entry["page_start"] <= p["page_number"] <= entry["page_end"]]
+        if chunk_pages:
+            chunks.append(_build_chunk(chunk_pages, entry["chunk_id"]))
+    return chunks
+
+
+def save_chunk_plan(plan: Dict, output_dir: str) -> str:
+    """Write chunk_plan.json to ``output_dir``."""
+    path = os.path.join(output_dir, CHUNK_PLAN_FILENAME)
+    save_json(plan, path)
+    return path
+
+
+def load_chunk_plan(directory: str) -> Optional[Dict]:
+    """Read chunk_plan.json from ``directory`` (None if absent or unreadable)."""
+    path = os.path.join(directory, CHUNK_PLAN_FILENAME)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def get_document_chunks(pages: List[Dict], config: CouncilConfig, plan_dir: Optional[str] = None) -> List[Dict]:
+    """
+    Chunks for a document: from the chunk plan saved in ``plan_dir`` when
+    there is one, otherwise planned from ``config``.
+    """
+    plan = load_chunk_plan(plan_dir) if plan_dir else None
+    if plan is None:
+        plan = plan_chunks(pages, config)
+    return chunks_from_plan(pages, plan)
+
+
+def page_owners(chunks: List[Dict]) -> Dict[int, int]:
+    """
+    Owning chunk of every page.
+
+    A page belongs to the chunk in which it lies furthest from the chunk
+    edges (the most surrounding context); ties go to the earlier chunk.
+
+    Returns:
+        page_number → chunk_id
+    """
+    owners = {}
+    margins = {}
+    for chunk in chunks:
+        for page_num in range(chunk["page_start"], chunk["page_end"] + 1):
+            margin = min(page_num - chunk["page_start"], chunk["page_end"] - page_num)
+            if page_num not in owners or margin > margins[page_num]:
+                owners[page_num] = chunk["chunk_id"]
+                margins[page_num] = margin
+    return owners
+
+
+def issue_owner_chunk(issue: Dict, chunk: Dict, owners: Dict[int, int]) -> int:
+    """
+    Chunk that owns an issue reported in ``chunk``: the owner of its first
+    referenced page inside the chunk (the reporting chunk if none is).
+    """
+    in_chunk = [
+        n for n in extract_page_numbers_from_refs(issue.get("page_references", []) or [])
+        if chunk["page_start"] <= n <= chunk["page_end"]
+    ]
+    if not in_chunk:
+        return chunk["chunk_id"]
+    return owners.get(in_chunk[0], chunk["chunk_id"])
+
+
+def resolve_overlap_issues(
+    issues_by_chunk: List[List[Dict]],
+    chunks: List[Dict],
+    threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+) -> Tuple[List[List[Dict]], Dict[int, Dict[str, int]]]:
+    """
+    Give each of one analyst's overlap-region issues to exactly one chunk.
+
+    An issue whose owner is another chunk is dropped if that chunk
+    reported a near-duplicate (same type, shingle Jaccard ≥ ``threshold``);
+    otherwise it is moved to the owner's list (after the owner's own
+    issues) with ``source_chunk`` set to the owner and the reporting chunk
+    kept in ``overlap_source_chunk``, so it is reviewed and judged once,
+    with the chunk that owns its pages, and the lists stay in chunk order.
+
+    Args:
+        issues_by_chunk: The analyst's issues, one list per chunk (in chunk order)
+        chunks: Chunks, aligned with ``issues_by_chunk``
+
+    Returns:
+        (issue lists aligned with ``chunks``, per chunk_id counts of
+        "overlap_issues_reassigned" (issues moved into the chunk) and
+        "overlap_issues_removed" (duplicates the chunk reported))
+    """
+    owners = page_owners(chunks)
+    owned = [
+        [issue_owner_chunk(issue, chunk, owners) for issue in issues]
+        for issues, chunk in zip(issues_by_chunk, chunks)
+    ]
+
+    # Issues each chunk reported on pages it owns (what duplicates are checked against)
+    native: Dict[int, List[Tuple[str, set]]] = {}
+    for issues, owners_of, chunk in zip(issues_by_chunk, owned, chunks):
+        for issue, owner in zip(issues, owners_of):
+            if owner == chunk["chunk_id"]:
+                native.setdefault(owner, []).append((issue.get("type"), issue_shingles(issue)))
+
+    position = {chunk["chunk_id"]: k for k, chunk in enumerate(chunks)}
+    kept: List[List[Dict]] = [[] for _ in chunks]
+    moved_in: List[List[Dict]] = [[] for _ in chunks]
+    stats: Dict[int, Dict[str, int]] = {}
+
+    def count(chunk_id: int, name: str) -> None:
+        counts = stats.setdefault(chunk_id, {"overlap_issues_reassigned": 0, "overlap_issues_removed": 0})
+        counts[name] += 1
+
+    for k, (issues, owners_of, chunk) in enumerate(zip(issues_by_chunk, owned, chunks)):
+        for issue, owner in zip(issues, owners_of):
+            if owner == chunk["chunk_id"] or owner not in position:
+                kept[k].append(issue)
+                continue
+
+            shingles = issue_shingles(issue)
+            if any(t == issue.get("type") and jaccard(shingles, other) >= threshold
+                   for t, other in native.get(owner, [])):
+                count(chunk["chunk_id"], "overlap_issues_removed")
+            else:
+                moved_in[position[owner]].append(dict(issue, source_chunk=owner, overlap_source_chunk=chunk["chunk_id"]))
+                count(owner, "overlap_issues_reassigned")
+    return [own + moved for own, moved in zip(kept, moved_in)], stats
@@ -0,0 +1,260 @@
+"""
+Concurrency Utilities
+=====================
+
+Bounded-concurrency execution of independent LLM work units.
+
+Each phase fans its work out as a list of (model, payload) units, e.g.
+(analyst, chunk) pairs in Phase 1. Units run on a shared thread pool; a
+per-model semaphore caps how many requests hit the same model at once.
+Results are always returned in the order the units were submitted, so
+the phase outputs stay deterministic regardless of completion order.
+
+LLM calls made from workers can additionally go through a per-endpoint
+token bucket and retry with exponential backoff on 429/5xx errors.
+"""
+
+import re
+import time
+import random
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from csrd_council_2.config.models import ModelConfig
+from csrd_council_2.utils.telemetry import SYSTEM_PROMPT_PHASES, get_telemetry
+
+
+# Pool size when neither the caller nor the config specifies one
+DEFAULT_MAX_WORKERS = 8
+
+# Concurrent requests allowed per model when ModelConfig has no limit
+DEFAULT_MODEL_CONCURRENCY = 4
+
+# Retry policy for rate-limited / server-side failures
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 30.0
+
+# Matches HTTP 429 / 5xx status codes and common rate-limit wording in error strings
+RETRYABLE_ERROR_PATTERN = re.compile(r"\b(429|5\d\d)\b|rate.?limit|too many requests|overloaded", re.IGNORECASE)
+
+
+def get_model_concurrency(model: ModelConfig, default: int = DEFAULT_MODEL_CONCURRENCY) -> int:
+    """Return the concurrency limit configured on a model (``max_concurrency``)."""
+    limit = getattr(model, "max_concurrency", None)
+    if isinstance(limit, int) and limit > 0:
+        return limit
+    return default
+
+
+def get_max_workers(config: Any, max_workers: Optional[int] = None) -> int:
+    """Resolve the worker pool size: explicit value, then config, then default."""
+    if max_workers and max_workers > 0:
+        return max_workers
+    configured = getattr(config, "max_workers", None)
+    if isinstance(configured, int) and configured > 0:
+        return configured
+    return DEFAULT_MAX_WORKERS
+
+
+class ModelLimiter:
+    """Hands out one semaphore per model, sized from its ModelConfig."""
+
+    def __init__(self, default_limit: int = DEFAULT_MODEL_CONCURRENCY):
+        self.default_limit = default_limit
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+
+    def slot(self, model: ModelConfig) -> threading.BoundedSemaphore:
+        """Get the semaphore guarding requests to ``model``."""
+        with self._lock:
+            semaphore = self._semaphores.get(model.name)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(get_model_concurrency(model, self.default_limit))
+                self._semaphores[model.name] = semaphore
+            return semaphore
+
+
+def run_units(
+    units: Sequence[Tuple[ModelConfig, Any]],
+    worker: Callable[[ModelConfig, Any], Any],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    limiter: Optional[ModelLimiter] = None
+) -> List[Any]:
+    """
+    Run ``worker(model, payload)`` for every unit with bounded concurrency.
+
+    Args:
+        units: (model, payload) pairs. Interleave models in this list to
+            avoid head-of-line blocking on a single model's limit.
+        worker: Callable executed once per unit
+        max_workers: Thread pool size
+        limiter: Per-model limiter (a fresh one is created if omitted)
+
+    Returns:
+        Worker results, in the same order as ``units``
+    """
+    if not units:
+        return []
+
+    limiter = limiter or ModelLimiter()
+
+    def run_one(unit: Tuple[ModelConfig, Any]) -> Any:
+        model, payload = unit
+        with limiter.slot(model):
+            return worker(model, payload)
+
+    if max_workers <= 1:
+        return [run_one(unit) for unit in units]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(units))) as executor:
+        futures = [executor.submit(run_one, unit) for unit in units]
+        return [future.result() for future in futures]
+
+
+def imap_units(
+    units: Iterable[Tuple[ModelConfig, Any]],
+    worker: Callable[[ModelConfig, Any], Any],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    limiter: Optional[ModelLimiter] = None
+) -> Iterator[Any]:
+    """
+    Lazy run_units: ``units`` is consumed as results are taken, with at
+    most 2 × ``max_workers`` units submitted ahead, so a generator of
+    units is never materialized.
+
+    Yields:
+        Worker results, in the same order as ``units``
+    """
+    limiter = limiter or ModelLimiter()
+
+    def run_one(unit: Tuple[ModelConfig, Any]) -> Any:
+        model, payload = unit
+        with limiter.slot(model):
+            return worker(model, payload)
+
+    if max_workers <= 1:
+        for unit in units:
+            yield run_one(unit)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for unit in units:
+            pending.append(executor.submit(run_one, unit))
+            if len(pending) >= 2 * max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+# =============================================================================
+# RATE LIMITING & RETRY
+# =============================================================================
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, bursts up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until ``tokens`` are available. Returns the time spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+def endpoint_key(model: ModelConfig) -> str:
+    """Identify the endpoint a model is served from (falls back to the model name)."""
+    endpoint = getattr(model, "endpoint", None)
+    for attr in ("name", "base_url", "url"):
+        value = getattr(endpoint, attr, None)
+        if value:
+            return str(value)
+    return model.name
+
+
+class EndpointRateLimiter:
+    """One token bucket per endpoint, sized from ``EndpointConfig.requests_per_minute``."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Optional[TokenBucket]] = {}
+
+    def bucket(self, model: ModelConfig) -> Optional[TokenBucket]:
+        """Get the bucket for ``model``'s endpoint, or None when it is unlimited."""
+        key = endpoint_key(model)
+        with self._lock:
+            if key not in self._buckets:
+                rpm = getattr(getattr(model, "endpoint", None), "requests_per_minute", None)
+                self._buckets[key] = TokenBucket(rpm / 60.0) if rpm else None
+            return self._buckets[key]
+
+    def acquire(self, model: ModelConfig) -> float:
+        """Wait for a request slot on ``model``'s endpoint."""
+        bucket = self.bucket(model)
+        return bucket.acquire() if bucket else 0.0
+
+
+def is_retryable_error(response: Any) -> bool:
+    """Whether a failed LLM response looks like a 429 or a 5xx (or says it is retryable)."""
+    retryable = getattr(response, "retryable", None)
+    if isinstance(retryable, bool):
+        return retryable
+    status = getattr(response, "status_code", None)
+    if isinstance(status, int):
+        return status == 429 or 500 <= status < 600
+    return bool(RETRYABLE_ERROR_PATTERN.search(str(getattr(response, "error", "") or "")))
+
+
+def generate_with_retry(
+    llm_client: Any,
+    model: ModelConfig,
+    user_prompt: str,
+    system_prompt: str,
+    rate_limiter: Optional[EndpointRateLimiter] = None,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+    verbose: bool = False
+) -> Any:
+    """
+    Call ``llm_client.generate`` behind the endpoint rate limiter, retrying
+    429/5xx failures with exponential backoff and jitter.
+
+    Returns:
+        The last LLM response (successful or not)
+    """
+    attempt = 0
+    while True:
+        if rate_limiter:
+            rate_limiter.acquire(model)
+        response = llm_client.generate(model, user_prompt, system_prompt)
+        if response.success or attempt >= max_retries or not is_retryable_error(response):
+            return response
+        
+        delay = min(MAX_BACKOFF_SECONDS, backoff_seconds * (2 ** attempt))
+        delay += random.uniform(0, delay / 2)
+        attempt += 1
+        get_telemetry().instant(
+            "retry", "llm", model=model.name, phase=SYSTEM_PROMPT_PHASES.get(system_prompt, "other"),
+            attempt=attempt, delay=round(delay, 2), error=str(response.error)[:200]
+        )
+        if verbose:
+            print(f"   ↻ {model.name}: {response.error} — retry {attempt}/{max_retries} in {delay:.1f}s")
+        time.sleep(delay)
@@ -0,0 +1,183 @@
+"""
+Evidence Grounding
+==================
+
+Deterministic check, before any review, that an issue's evidence quotes
+come from the pages it cites.
+
+Each evidence quote is fuzzy-matched (PageIndex.match_evidence) against
+the issue's referenced pages and their neighbours (± GROUNDING_WINDOW_PAGES,
+page numbers are often off by one). An issue is annotated with:
+
+    "evidence_grounding": {
+        "status": "grounded" | "ungrounded" | "unverified",
+        "score": best quote score (None if no quote could be checked),
+        "min_score": threshold used,
+        "quotes": [{"quote", "score", "page", "start", "end"}, ...]
+    }
+
+- grounded: at least one quote scores ≥ min_score;
+- ungrounded: quotes were checked and none reaches min_score (the
+  evidence is not on the cited pages: invented, or the wrong pages);
+- unverified: nothing to check (no evidence, quotes shorter than a word
+  n-gram that are not found verbatim, or no page references and no
+  verbatim occurrence anywhere in the document).
+
+Ungrounded issues are not sent to the reviewers and are dismissed in
+Phase 3 with the reason. Match locations (page, start, end into the
+original page content) are reused by the HTML report to highlight the
+matched text, including paraphrased quotes.
+
+Grounding is on by default; set ``evidence_grounding: false`` in the
+council config to disable it, and ``evidence_grounding_min_score`` to
+change the threshold.
+
+Usage:
+    stats = ground_issues(issues, page_index, config)
+    reviewable = [issue for issue in issues if not is_ungrounded(issue)]
+"""
+
+from typing import Dict, List, Optional
+
+from csrd_council_2.config.models import CouncilConfig
+from csrd_council_2.utils.page_index import PageIndex, NGRAM_SIZE, normalize_text, extract_page_numbers_from_refs
+
+
+# Neighbouring pages searched around each referenced page
+GROUNDING_WINDOW_PAGES = 1
+
+# Share of a quote's words that must be found in order on the cited pages
+DEFAULT_MIN_GROUNDING_SCORE = 0.6
+
+GROUNDING_STATUSES = ("grounded", "ungrounded", "unverified")
+
+
+def get_evidence_grounding(config: Optional[CouncilConfig], enabled: Optional[bool] = None) -> bool:
+    """Resolve evidence grounding: explicit value, then config ``evidence_grounding``, on by default."""
+    if enabled is not None:
+        return enabled
+    return bool(getattr(config, "evidence_grounding", True))
+
+
+def get_min_grounding_score(config: Optional[CouncilConfig]) -> float:
+    """Config ``evidence_grounding_min_score`` (default DEFAULT_MIN_GROUNDING_SCORE)."""
+    score = getattr(config, "evidence_grounding_min_score", None)
+    if isinstance(score, (int, float)) and 0 < score <= 1:
+        return float(score)
+    return DEFAULT_MIN_GROUNDING_SCORE
+
+
+def match_quote(quote: str, page_nums: List[int], page_index: PageIndex) -> Dict:
+    """
+    Best location of one evidence quote on ``page_nums`` (the whole
+    document, verbatim only, when empty).
+
+    Returns:
+        {"quote", "score", "page", "start", "end"}; score is None when the
+        quote cannot be checked, 0.0 when it was not found
+    """
+    result = {"quote": quote, "score": None, "page": None, "start": None, "end": None}
+    words = normalize_text(str(quote or "").strip())[0].split()
+    if not words:
+        return result
+
+    if page_nums:
+        match = page_index.match_evidence(quote, page_nums)
+    else:
+        spans = page_index.locate_evidence(quote)
+        match = spans[0] + (1.0,) if spans else None
+
+    if match is not None:
+        page, start, end, score = match
+        result.update(score=round(score, 3), page=page, start=start, end=end)
+    elif page_nums and len(words) >= NGRAM_SIZE:
+        result["score"] = 0.0
+    return result
+
+
+def ground_issue(
+    issue: Dict,
+    page_index: PageIndex,
+    min_score: float = DEFAULT_MIN_GROUNDING_SCORE,
+    window: int = GROUNDING_WINDOW_PAGES
+) -> Dict:
+    """Match an issue's evidence quotes against its cited pages (± ``window``)."""
+    page_nums = set()
+    for page_num in extract_page_numbers_from_refs(issue.get("page_references", []) or []):
+        page_nums.update(range(page_num - window, page_num + window + 1))
+
+    quotes = [match_quote(quote, sorted(page_nums), page_index) for quote in issue.get("evidence", []) or []]
+    scores = [q["score"] for q in quotes if q["score"] is not None]
+    best = max(scores) if scores else None
+
+    if best is None:
+        status = "unverified"
+    elif best >= min_score:
+        status = "grounded"
+    else:
+        status = "ungrounded"
+    return {"status": status, "score": best, "min_score": min_score, "quotes": quotes}
+
+
+def ground_issues(
+    issues: List[Dict],
+    page_index: PageIndex,
+    config: Optional[CouncilConfig] = None,
+    overwrite: bool = False
+) -> Dict[str, int]:
+    """
+    Annotate issues (in place) with their ``evidence_grounding``.
+
+    Issues already annotated (e.g. in Phase 1 files) are kept as they are
+    unless ``overwrite``.
+
+    Returns:
+        Number of issues per status
+    """
+    min_score = get_min_grounding_score(config)
+    stats = {status: 0 for status in GROUNDING_STATUSES}
+    for issue in issues:
+        if overwrite or not isinstance(issue.get("evidence_grounding"), dict):
+            issue["evidence_grounding"] = ground_issue(issue, page_index, min_score)
+        status = issue["evidence_grounding"].get("status")
+        stats[status] = stats.get(status, 0) + 1
+    return stats
+
+
+def is_ungrounded(issue: Dict) -> bool:
+    """Whether none of the issue's evidence quotes was found on its cited pages."""
+    grounding = issue.get("evidence_grounding")
+    return isinstance(grounding, dict) and grounding.get("status") == "ungrounded"
+
+
+def ungrounded_reason(issue: Dict) -> str:
+    """Dismissal reason of an ungrounded issue."""
+    grounding = issue.get("evidence_grounding", {})
+    return (
+        f"No evidence quote found on the cited pages (±{GROUNDING_WINDOW_PAGES}): "
+        f"best match {grounding.get('score') or 0:.2f} < {grounding.get('min_score', DEFAULT_MIN_GROUNDING_SCORE)}"
+    )
+
+
+def evidence_locations(issues: List[Dict]) -> List[Dict]:
+    """
+    Locations of the grounded evidence quotes of ``issues``.
+
+    Returns:
+        [{"page", "start", "end", "score"}] (offsets into the original
+        page content), without duplicates
+    """
+    locations = []
+    seen = set()
+    for issue in issues:
+        grounding = issue.get("evidence_grounding")
+        if not isinstance(grounding, dict):
+            continue
+        for quote in grounding.get("quotes", []):
+            if quote.get("page") is None or (quote.get("score") or 0) < grounding.get("min_score", 0):
+                continue
+            key = (quote["page"], quote["start"], quote["end"])
+            if key not in seen:
+                seen.add(key)
+                locations.append({"page": quote["page"], "start": quote["start"], "end": quote["end"], "score": quote["score"]})
+    return locations
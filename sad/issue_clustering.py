@@ -0,0 +1,150 @@
+"""
+Issue Clustering
+================
+
+Deterministic near-duplicate grouping of Phase 1 issues before review.
+
+Several analysts often report the same problem with slightly different
+titles but the same evidence quotes. Each issue is turned into a set of
+shingles:
+- word n-grams of its (normalized) evidence quotes;
+- the words of its title;
+- its referenced page numbers.
+
+Candidates are found with MinHash signatures and LSH banding, then
+confirmed with the exact Jaccard similarity against the cluster's
+representative (the first issue of the cluster, in collection order).
+Only issues of the same type are grouped, so a representative's review
+(categorization, FP risk penalty) holds for every member.
+
+Hashing uses blake2b with fixed seeds: the same issues always produce
+the same clusters, across runs and processes.
+
+Usage:
+    clusters = cluster_issues(issues)
+    representatives = [cluster[0] for cluster in clusters]
+"""
+
+import hashlib
+import random
+from typing import Dict, List, Set, Tuple
+
+from csrd_council_2.utils.page_index import NGRAM_SIZE, normalize_text, extract_page_numbers_from_refs
+
+
+# Minimum Jaccard similarity between an issue and a cluster representative
+DEFAULT_SIMILARITY_THRESHOLD = 0.5
+
+# MinHash signature length = LSH_BANDS × LSH_ROWS
+LSH_BANDS = 16
+LSH_ROWS = 4
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(20240501)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(LSH_BANDS * LSH_ROWS)
+]
+
+
+def issue_shingles(issue: Dict) -> Set[str]:
+    """Shingle set of an issue: evidence word n-grams, title words and page numbers."""
+    shingles = set()
+    for evidence in issue.get("evidence", []) or []:
+        words = normalize_text(str(evidence))[0].split()
+        if len(words) < NGRAM_SIZE:
+            shingles.add("e:" + " ".join(words))
+        for i in range(len(words) - NGRAM_SIZE + 1):
+            shingles.add("e:" + " ".join(words[i:i + NGRAM_SIZE]))
+    for word in normalize_text(str(issue.get("title", "")))[0].split():
+        shingles.add("t:" + word)
+    for page_num in extract_page_numbers_from_refs(issue.get("page_references", []) or []):
+        shingles.add(f"p:{page_num}")
+    shingles.discard("e:")
+    return shingles
+
+
+def _hash64(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def minhash_signature(shingles: Set[str]) -> Tuple[int, ...]:
+    """MinHash signature (LSH_BANDS × LSH_ROWS values) of a shingle set."""
+    hashes = [_hash64(s) for s in shingles]
+    if not hashes:
+        return tuple([_MERSENNE_PRIME] * len(_PERMUTATIONS))
+    return tuple(min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS)
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    """Jaccard similarity of two sets (0.0 if both are empty)."""
+    if not a and not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def cluster_issues(
+    issues: List[Dict],
+    threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+) -> List[List[int]]:
+    """
+    Group near-duplicate issues.
+
+    Each issue joins the first earlier cluster (of the same type) whose
+    representative shares an LSH band with it and reaches ``threshold``
+    Jaccard similarity; otherwise it starts a new cluster.
+
+    Args:
+        issues: Issues, in collection order
+        threshold: Minimum Jaccard similarity to the representative
+
+    Returns:
+        Clusters of indices into ``issues``, in order of their
+        representative; each cluster lists its representative first
+    """
+    shingles = [issue_shingles(issue) for issue in issues]
+    buckets: Dict[tuple, List[int]] = {}
+    clusters: Dict[int, List[int]] = {}
+
+    for i, issue in enumerate(issues):
+        issue_type = issue.get("type", "UNKNOWN")
+        signature = minhash_signature(shingles[i])
+        keys = [
+            (issue_type, band, signature[band * LSH_ROWS:(band + 1) * LSH_ROWS])
+            for band in range(LSH_BANDS)
+        ]
+
+        candidates = sorted({rep for key in keys for rep in buckets.get(key, [])})
+        rep = next((r for r in candidates if jaccard(shingles[i], shingles[r]) >= threshold), None)
+
+        if rep is not None:
+            clusters[rep].append(i)
+            continue
+
+        clusters[i] = [i]
+        if shingles[i]:
+            for key in keys:
+                buckets.setdefault(key, []).append(i)
+
+    return [clusters[rep] for rep in sorted(clusters)]
+
+
+def fan_out_review(review: Dict, member: Dict, index: int, representative_id: str) -> Dict:
+    """
+    Copy a representative's review record onto a cluster member.
+
+    The issue fields are the member's own, so Phase 3 sees one review per
+    (reviewer, issue) exactly as if the member had been reviewed.
+    """
+    shared = dict(review)
+    if isinstance(review.get("evaluation"), dict):
+        shared["evaluation"] = dict(review["evaluation"])
+    shared["issue_id"] = member.get("issue_id", f"issue-{index}")
+    if "issue_title" in review:
+        shared["issue_title"] = member.get("title", "")
+    if "issue_source_analyst" in review:
+        shared["issue_source_analyst"] = member.get("_source_analyst", "Unknown")
+    if "issue_confidence" in review:
+        shared["issue_confidence"] = str(member.get("confidence") or "MEDIUM")
+    shared["shared_from_issue_id"] = representative_id
+    return shared
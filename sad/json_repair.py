@@ -0,0 +1,248 @@
+"""
+JSON Repair
+===========
+
+Bounded recovery of LLM answers that parse_llm_response cannot read.
+
+Instead of dropping the chunk, review or judgment behind an unreadable
+answer, parse_with_repair tries, in order:
+1. a local repair (no LLM call): the first ``{`` starts the object and
+   anything after its closing brace is ignored (prose, code fences),
+   trailing commas are removed, and a truncated answer is closed after
+   its last complete top-level element (e.g. the last complete issue of
+   "issues"; a half-written issue is dropped, not kept with missing
+   fields);
+2. one short "fix this JSON" follow-up to the same model, containing only
+   the broken answer (at most MAX_REPAIR_INPUT_CHARS characters), never
+   the document content.
+
+Every parse failure is recorded as a "json_repair" instant event in the
+run's telemetry (phase, model, method: "local", "llm" or "failed");
+``repair_summary`` turns them into per-phase repair rates.
+
+Usage:
+    parsed = parse_with_repair(response.answer, llm_client, analyst, "phase1", expected_keys=("issues",))
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from csrd_council_2.config.models import ModelConfig
+from csrd_council_2.config.prompts_v5 import JSON_REPAIR_SYSTEM_PROMPT, format_json_repair_prompt
+from csrd_council_2.models.llm_client import LLMClient
+from csrd_council_2.utils.helpers import parse_llm_response
+from csrd_council_2.utils.concurrency import EndpointRateLimiter, generate_with_retry
+from csrd_council_2.utils.telemetry import Telemetry, get_telemetry
+
+
+# Longest broken answer sent back to the model for repair
+MAX_REPAIR_INPUT_CHARS = 12000
+
+# Cut points tried (latest first) when closing a truncated answer
+MAX_TRUNCATION_CUTS = 200
+
+# Deepest nesting at which a truncated answer is cut (root object and its lists)
+MAX_CUT_DEPTH = 2
+
+_OPENING = {"}": "{", "]": "["}
+_CLOSER = {"{": "}", "[": "]"}
+
+
+# ============================================================================
+# LOCAL REPAIR
+# ============================================================================
+
+def _drop_trailing_comma(out: List[str]) -> None:
+    while out and out[-1] in " \t\n\r":
+        out.pop()
+    if out and out[-1] == ",":
+        out.pop()
+
+
+def _load_object(text: str) -> Optional[Dict]:
+    try:
+        value = json.loads(text)
+    except ValueError:
+        return None
+    return value if isinstance(value, dict) else None
+
+
+def _close(out: List[str], stack: Tuple[str, ...]) -> Optional[Dict]:
+    body = list(out)
+    _drop_trailing_comma(body)
+    return _load_object("".join(body) + "".join(_CLOSER[c] for c in reversed(stack)))
+
+
+def repair_json_text(text: str) -> Optional[Dict]:
+    """
+    Local repair of an LLM answer that should hold one JSON object.
+
+    Returns:
+        The repaired object, or None if it could not be recovered
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+
+    out: List[str] = []
+    stack: List[str] = []
+    # (length of out, open brackets) where the answer can be cut and closed
+    cuts: List[Tuple[int, Tuple[str, ...]]] = []
+    in_string = escape = False
+
+    for ch in text[start:]:
+        if in_string:
+            out.append(ch)
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+            continue
+
+        if ch in _OPENING:
+            if not stack or stack[-1] != _OPENING[ch]:
+                break  # mismatched closer: treat the answer as truncated here
+            _drop_trailing_comma(out)
+            stack.pop()
+            out.append(ch)
+            if not stack:
+                return _load_object("".join(out))
+            if len(stack) <= MAX_CUT_DEPTH:
+                cuts.append((len(out), tuple(stack)))
+            continue
+
+        if ch == "," and len(stack) <= MAX_CUT_DEPTH:
+            cuts.append((len(out), tuple(stack)))
+        out.append(ch)
+        if ch == '"':
+            in_string = True
+        elif ch in _CLOSER:
+            stack.append(ch)
+            if len(stack) <= MAX_CUT_DEPTH:
+                cuts.append((len(out), tuple(stack)))
+
+    # Truncated: close it after its last complete element
+    for length, open_brackets in reversed(cuts[-MAX_TRUNCATION_CUTS:]):
+        repaired = _close(out[:length], open_brackets)
+        if repaired is not None:
+            return repaired
+    return None
+
+
+# ============================================================================
+# REPAIR STAGE
+# ============================================================================
+
+def _has_expected_keys(parsed: Dict, expected_keys: Sequence[str]) -> bool:
+    return not expected_keys or any(key in parsed for key in expected_keys)
+
+
+def request_json_repair(
+    answer: str,
+    error: str,
+    llm_client: LLMClient,
+    model: ModelConfig,
+    expected_keys: Sequence[str] = (),
+    rate_limiter: Optional[EndpointRateLimiter] = None,
+    verbose: bool = False
+) -> Optional[Dict]:
+    """Ask ``model`` to fix its own broken answer (one follow-up call)."""
+    user_prompt = format_json_repair_prompt(
+        broken_output=answer[:MAX_REPAIR_INPUT_CHARS], error=error, expected_keys=tuple(expected_keys)
+    )
+    response = generate_with_retry(
+        llm_client, model, user_prompt, JSON_REPAIR_SYSTEM_PROMPT,
+        rate_limiter=rate_limiter, verbose=verbose
+    )
+    if not response.success:
+        return None
+
+    parsed = parse_llm_response(response.answer)
+    if parsed.get("parse_error"):
+        parsed = repair_json_text(response.answer)
+    if parsed is None or not _has_expected_keys(parsed, expected_keys):
+        return None
+    return parsed
+
+
+def parse_with_repair(
+    answer: str,
+    llm_client: Optional[LLMClient],
+    model: ModelConfig,
+    phase: str,
+    expected_keys: Sequence[str] = (),
+    rate_limiter: Optional[EndpointRateLimiter] = None,
+    verbose: bool = False
+) -> Dict:
+    """
+    parse_llm_response, with local then LLM repair of unreadable answers.
+
+    Args:
+        answer: Raw LLM answer
+        llm_client: Client for the repair follow-up (None = local repair only)
+        model: Model that produced the answer (asked to repair it)
+        phase: Phase name for the repair statistics ("phase1", ...)
+        expected_keys: Top-level keys of the expected object; a repaired
+            object with none of them is rejected
+        rate_limiter: Optional per-endpoint rate limiter for the follow-up
+        verbose: Print progress
+
+    Returns:
+        The parsed (or repaired) object, or parse_llm_response's error dict
+        when the answer could not be recovered
+    """
+    parsed = parse_llm_response(answer)
+    if not parsed.get("parse_error"):
+        return parsed
+
+    error = str(parsed.get("error", "invalid JSON"))[:200]
+    method = "local"
+    repaired = repair_json_text(answer)
+    if repaired is not None and not _has_expected_keys(repaired, expected_keys):
+        repaired = None
+    if repaired is None and llm_client is not None:
+        method = "llm"
+        repaired = request_json_repair(answer, error, llm_client, model, expected_keys, rate_limiter, verbose)
+    if repaired is None:
+        method = "failed"
+
+    get_telemetry().instant("json_repair", "repair", phase=phase, model=model.name, method=method, error=error)
+    if verbose:
+        if repaired is None:
+            print(f"   ⚠️  {model.name}: unreadable answer could not be repaired")
+        else:
+            print(f"   🩹 {model.name}: unreadable answer repaired ({method})")
+    return parsed if repaired is None else repaired
+
+
+def repair_summary(telemetry: Optional[Telemetry] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Per-phase parse failures and repairs of a run.
+
+    Returns:
+        {phase: {"llm_calls", "parse_failures", "repaired_local",
+        "repaired_llm", "unrepaired", "failure_rate", "repair_rate"}}
+        for the phases with at least one parse failure
+    """
+    events = (telemetry or get_telemetry()).snapshot()
+
+    calls: Dict[str, int] = {}
+    summary: Dict[str, Dict[str, Any]] = {}
+    for event in events:
+        args = event["args"]
+        if event["category"] == "llm":
+            calls[args.get("phase")] = calls.get(args.get("phase"), 0) + 1
+        elif event["name"] == "json_repair":
+            row = summary.setdefault(args["phase"], {
+                "parse_failures": 0, "repaired_local": 0, "repaired_llm": 0, "unrepaired": 0
+            })
+            row["parse_failures"] += 1
+            row["unrepaired" if args["method"] == "failed" else f"repaired_{args['method']}"] += 1
+
+    for phase, row in summary.items():
+        row["llm_calls"] = calls.get(phase, 0)
+        row["failure_rate"] = round(row["parse_failures"] / row["llm_calls"], 4) if row["llm_calls"] else None
+        row["repair_rate"] = round((row["repaired_local"] + row["repaired_llm"]) / row["parse_failures"], 4)
+    return dict(sorted(summary.items()))
@@ -0,0 +1,234 @@
+"""
+LLM Response Cache
+==================
+
+Persistent, content-addressed cache for LLM completions shared by all
+three phases.
+
+Entries are keyed by a SHA-256 of (model_id, system prompt, fully
+formatted user prompt), so a rerun on the same document with the same
+prompt templates and models is served from disk. The cache directory is
+size-bounded and evicts least-recently-used entries (tracked via file
+mtime) once the bound is exceeded. Only answers that parse are stored,
+so an unreadable answer is asked again rather than replayed.
+
+The lock only guards the in-memory index and counters; entry files are
+read, written and removed outside it, so slow disk I/O on one entry
+does not stall lookups of the others.
+
+Usage:
+    client = CachedLLMClient(LLMClient(), LLMResponseCache(".llm_cache"))
+    response = client.generate(model, user_prompt, system_prompt)
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from csrd_council_2.config.models import ModelConfig
+from csrd_council_2.models.llm_client import LLMClient
+from csrd_council_2.utils.helpers import parse_llm_response
+from csrd_council_2.utils.prompt_cache import PrefixCachingClient
+from csrd_council_2.utils.llm_pool import PooledLLMClient
+from csrd_council_2.utils.llm_stream import StreamingLLMClient
+from csrd_council_2.utils.telemetry import TracingLLMClient
+
+
+DEFAULT_CACHE_DIR = ".llm_cache"
+DEFAULT_CACHE_MAX_MB = 512
+
+
+@dataclass
+class CachedResponse:
+    """Response served from the cache (same fields the phases read from LLMClient)."""
+    answer: str
+    success: bool = True
+    error: Optional[str] = None
+    cached: bool = True
+
+
+def make_cache_key(model_id: str, system_prompt: str, user_prompt: str, namespace: str = "") -> str:
+    """Hash the inputs that fully determine a completion."""
+    payload = json.dumps([namespace, model_id, system_prompt or "", user_prompt], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """On-disk response store with LRU eviction and hit/miss counters."""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_mb: float = DEFAULT_CACHE_MAX_MB):
+        self.cache_dir = cache_dir
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # key -> (size_bytes, last_access)
+        self._entries: Dict[str, list] = {}
+        self._total_bytes = 0
+        os.makedirs(cache_dir, exist_ok=True)
+        self._scan()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _scan(self) -> None:
+        """Index existing entries so eviction works across runs."""
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                stat = os.stat(os.path.join(root, name))
+                self._entries[name[:-5]] = [stat.st_size, stat.st_mtime]
+                self._total_bytes += stat.st_size
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached answer for ``key`` (and mark it recently used)."""
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                answer = json.load(f)["answer"]
+        except (OSError, ValueError, KeyError):
+            # Unreadable, or evicted since the lookup
+            with self._lock:
+                dropped = self._drop(key)
+                self.misses += 1
+            self._remove(dropped)
+            return None
+
+        now = time.time()
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        with self._lock:
+            if key in self._entries:
+                self._entries[key][1] = now
+            self.hits += 1
+        return answer
+
+    def put(self, key: str, model_id: str, answer: str) -> None:
+        """Store an answer, then evict LRU entries beyond the size bound."""
+        path = self._path(key)
+        data = json.dumps({"model_id": model_id, "answer": answer, "created": time.time()}, ensure_ascii=False)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        size = len(data.encode("utf-8"))
+
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= self._entries[key][0]
+            self._entries[key] = [size, time.time()]
+            self._total_bytes += size
+            self.writes += 1
+            evicted = self._evict()
+        self._remove(evicted)
+
+    def _drop(self, key: str) -> List[str]:
+        """Remove ``key`` from the index (lock held); returns the keys whose files to delete."""
+        if key not in self._entries:
+            return []
+        size, _ = self._entries.pop(key)
+        self._total_bytes -= size
+        return [key]
+
+    def _remove(self, keys: List[str]) -> None:
+        for key in keys:
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def _evict(self) -> List[str]:
+        """Drop LRU entries beyond the size bound from the index (lock held)."""
+        evicted: List[str] = []
+        if self._total_bytes <= self.max_bytes:
+            return evicted
+        for key, _ in sorted(self._entries.items(), key=lambda item: item[1][1]):
+            if self._total_bytes <= self.max_bytes:
+                break
+            evicted.extend(self._drop(key))
+            self.evictions += 1
+        return evicted
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for run_metadata.json."""
+        lookups = self.hits + self.misses
+        return {
+            "cache_dir": self.cache_dir,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "size_bytes": self._total_bytes
+        }
+
+
+class CachedLLMClient:
+    """
+    Drop-in wrapper around LLMClient that serves repeated prompts from cache.
+
+    Only successful responses whose answer parses (parse_llm_response)
+    are stored: an unreadable answer is repaired or re-asked, never
+    replayed from the cache on the next run. ``namespace`` keeps
+    mock-mode answers apart from real model answers.
+    """
+
+    def __init__(self, llm_client: LLMClient, cache: LLMResponseCache, namespace: str = ""):
+        self.llm_client = llm_client
+        self.cache = cache
+        self.namespace = namespace
+
+    def generate(self, model: ModelConfig, user_prompt: str, system_prompt: str = None):
+        key = make_cache_key(model.model_id, system_prompt, user_prompt, self.namespace)
+        answer = self.cache.get(key)
+        if answer is not None:
+            return CachedResponse(answer=answer)
+
+        response = self.llm_client.generate(model, user_prompt, system_prompt)
+        if response.success and response.answer and not parse_llm_response(response.answer).get("parse_error"):
+            self.cache.put(key, model.model_id, response.answer)
+        return response
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.llm_client, name)
+
+
+def create_llm_client(
+    mock_mode: bool = False,
+    cache_dir: Optional[str] = None,
+    cache_max_mb: float = DEFAULT_CACHE_MAX_MB,
+    base_client: Any = None,
+    pool_size: Optional[int] = None
+):
+    """
+    Build a long-lived LLM client: per-endpoint pools of LLMClient
+    (``llm_client.pool_stats()``, see utils/llm_pool.py), or ``base_client``
+    (any object with the same ``generate``), streaming through an
+    incremental JSON scanner when the client can stream (see
+    utils/llm_stream.py), with prompt-prefix cache support (``llm_client.prefix_cache``), wrapped in a response cache
+    when ``cache_dir`` is set. Every call is traced (see
+    utils/telemetry.py).
+    """
+    if base_client is None:
+        base_client = PooledLLMClient(lambda: LLMClient(mock_mode=mock_mode), pool_size)
+    llm_client = PrefixCachingClient(StreamingLLMClient(base_client))
+    if cache_dir:
+        cache = LLMResponseCache(cache_dir, cache_max_mb)
+        llm_client = CachedLLMClient(llm_client, cache, namespace="mock" if mock_mode else "")
+    return TracingLLMClient(llm_client)
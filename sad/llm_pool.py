@@ -0,0 +1,181 @@
+"""
+LLM Client Pool
+===============
+
+Long-lived, per-endpoint pools of LLMClient instances shared by all
+phases of a run.
+
+Each LLMClient keeps its own HTTP session, so reusing instances (instead
+of constructing a client per phase or per call) keeps connections alive
+across calls and phases. PooledLLMClient checks out one client per call
+from the pool of the model's endpoint (see concurrency.endpoint_key), so
+a client is never used by two threads at once, and creates clients
+lazily up to the pool size:
+- ``EndpointConfig.max_connections`` when set,
+- otherwise the ``pool_size`` given to PooledLLMClient,
+- otherwise DEFAULT_POOL_SIZE.
+
+``generate`` is the usual blocking call; ``agenerate`` is its asyncio
+counterpart (the call runs on a worker thread). ``generate_stream`` is
+available when LLMClient streams; the client stays checked out until
+the stream is consumed or closed. ``pool_stats`` reports,
+per endpoint, clients created, checkouts, peak concurrent use, waits
+for a free client and utilization (busy time / capacity over the pool's
+lifetime).
+
+Usage:
+    client = PooledLLMClient(lambda: LLMClient(mock_mode=False))
+    response = client.generate(model, user_prompt, system_prompt)
+    response = await client.agenerate(model, user_prompt, system_prompt)
+    print(client.pool_stats())
+"""
+
+import time
+import asyncio
+import threading
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from csrd_council_2.config.models import ModelConfig
+from csrd_council_2.models.llm_client import LLMClient
+from csrd_council_2.utils.concurrency import endpoint_key, DEFAULT_MAX_WORKERS
+from csrd_council_2.utils.prompt_cache import accepts_cache_control
+
+
+# Clients per endpoint when neither the endpoint nor the caller sets a size
+DEFAULT_POOL_SIZE = DEFAULT_MAX_WORKERS
+
+
+def get_pool_size(model: ModelConfig, default: int = DEFAULT_POOL_SIZE) -> int:
+    """Pool size for ``model``'s endpoint (``EndpointConfig.max_connections``)."""
+    size = getattr(getattr(model, "endpoint", None), "max_connections", None)
+    if isinstance(size, int) and size > 0:
+        return size
+    return default
+
+
+class EndpointPool:
+    """Bounded pool of clients for one endpoint."""
+
+    def __init__(self, key: str, factory: Callable[[], LLMClient], max_size: int):
+        self.key = key
+        self.factory = factory
+        self.max_size = max_size
+        self._idle: List[LLMClient] = []
+        self._cond = threading.Condition()
+        self._created_at = time.monotonic()
+        self.created = 0
+        self.checkouts = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.busy_seconds = 0.0
+
+    @contextmanager
+    def client(self) -> Iterator[LLMClient]:
+        """Check out a client (waiting for one when all are busy)."""
+        requested = time.monotonic()
+        with self._cond:
+            waited = False
+            while not self._idle and self.created >= self.max_size:
+                waited = True
+                self._cond.wait()
+            if self._idle:
+                client = self._idle.pop()
+            else:
+                client = self.factory()
+                self.created += 1
+            self.checkouts += 1
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+            if waited:
+                self.waits += 1
+                self.wait_seconds += time.monotonic() - requested
+
+        started = time.monotonic()
+        try:
+            yield client
+        finally:
+            with self._cond:
+                self.busy_seconds += time.monotonic() - started
+                self.in_use -= 1
+                self._idle.append(client)
+                self._cond.notify()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            lifetime = time.monotonic() - self._created_at
+            return {
+                "max_size": self.max_size,
+                "created": self.created,
+                "checkouts": self.checkouts,
+                "in_use": self.in_use,
+                "peak_in_use": self.peak_in_use,
+                "waits": self.waits,
+                "wait_seconds": round(self.wait_seconds, 3),
+                "busy_seconds": round(self.busy_seconds, 3),
+                "utilization": round(self.busy_seconds / (self.max_size * lifetime), 4) if lifetime > 0 else 0.0
+            }
+
+
+class PooledLLMClient:
+    """
+    Drop-in replacement for a single LLMClient, backed by per-endpoint
+    client pools. Attributes other than the pool API are read from a
+    template client built by ``factory``.
+    """
+
+    def __init__(self, factory: Callable[[], LLMClient], pool_size: Optional[int] = None):
+        self.factory = factory
+        self.pool_size = pool_size or DEFAULT_POOL_SIZE
+        self._template = factory()
+        self._hints_supported = accepts_cache_control(self._template)
+        self.supports_streaming = callable(getattr(self._template, "generate_stream", None))
+        self._stream_hints_supported = self.supports_streaming and accepts_cache_control(self._template, "generate_stream")
+        self._lock = threading.Lock()
+        self._pools: Dict[str, EndpointPool] = {}
+
+    def _pool(self, model: ModelConfig) -> EndpointPool:
+        key = endpoint_key(model)
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = EndpointPool(key, self.factory, get_pool_size(model, self.pool_size))
+                self._pools[key] = pool
+            return pool
+
+    def generate(self, model: ModelConfig, user_prompt: str, system_prompt: str = None, cache_control: Dict = None):
+        with self._pool(model).client() as client:
+            if cache_control is not None and self._hints_supported:
+                return client.generate(model, user_prompt, system_prompt, cache_control=cache_control)
+            return client.generate(model, user_prompt, system_prompt)
+
+    def generate_stream(
+        self,
+        model: ModelConfig,
+        user_prompt: str,
+        system_prompt: str = None,
+        cache_control: Dict = None
+    ) -> Iterator[str]:
+        """Stream the answer's text pieces (see utils/llm_stream.py)."""
+        with self._pool(model).client() as client:
+            if cache_control is not None and self._stream_hints_supported:
+                yield from client.generate_stream(model, user_prompt, system_prompt, cache_control=cache_control)
+            else:
+                yield from client.generate_stream(model, user_prompt, system_prompt)
+
+    async def agenerate(self, model: ModelConfig, user_prompt: str, system_prompt: str = None, cache_control: Dict = None):
+        """asyncio version of ``generate``."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self.generate, model, user_prompt, system_prompt, cache_control))
+
+    def pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-endpoint pool statistics."""
+        with self._lock:
+            pools = dict(self._pools)
+        return {key: pool.stats() for key, pool in sorted(pools.items())}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._template, name)
@@ -0,0 +1,209 @@
+"""
+Streamed LLM Responses
+======================
+
+Incremental JSON scanning of streamed completions.
+
+Every prompt of the council asks for a single JSON object. When the
+underlying client can stream (it has ``generate_stream(model,
+user_prompt, system_prompt)`` yielding text pieces), StreamingLLMClient
+feeds the pieces to a JSONStreamScanner and:
+- stops the stream as soon as the top-level object closes (whatever the
+  model writes after it is never generated);
+- aborts early on output that cannot become a JSON object: no ``{`` in
+  the first MAX_PREAMBLE_CHARS characters, or a closing bracket that
+  does not match the open one. The failed response is marked
+  ``retryable`` so generate_with_retry sends the call again without
+  waiting for the rest of a generation that cannot be parsed.
+
+The scanner only tracks strings and bracket nesting (it is a cheap
+structural check, not a validator); parse_llm_response still parses the
+answer. Responses carry ``ttft_s`` (time to first token) and
+``generation_s`` (first to last token), recorded by the telemetry.
+
+Clients without ``generate_stream``, and models with ``stream = False``
+in their ModelConfig, use the regular ``generate``. Prompt-cache hints
+are passed to either method when it takes ``cache_control``.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from csrd_council_2.config.models import ModelConfig
+from csrd_council_2.models.llm_client import LLMClient
+from csrd_council_2.utils.prompt_cache import accepts_cache_control
+
+
+# Prose / code fence allowed before the JSON object starts
+MAX_PREAMBLE_CHARS = 2000
+
+_CLOSING = {"}": "{", "]": "["}
+_WHITESPACE = " \t\n\r"
+
+
+class JSONStreamScanner:
+    """
+    Tracks the first top-level JSON object of a text fed piece by piece.
+
+    ``state`` is "pending", "complete" (``end`` is the offset just past the
+    closing brace) or "malformed" (``error`` says why).
+    """
+
+    def __init__(self, max_preamble_chars: int = MAX_PREAMBLE_CHARS):
+        self.max_preamble_chars = max_preamble_chars
+        self.state = "pending"
+        self.error: Optional[str] = None
+        self.start: Optional[int] = None
+        self.end: Optional[int] = None
+        self._offset = 0
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._expect_key = False
+
+    def feed(self, piece: str) -> str:
+        """Scan the next piece of the answer; returns the new state."""
+        if self.state != "pending":
+            return self.state
+
+        for i, ch in enumerate(piece, self._offset):
+            if self.start is None:
+                if ch == "{":
+                    self.start = i
+                    self._stack = ["{"]
+                    self._expect_key = True
+                elif i >= self.max_preamble_chars:
+                    return self._malformed(f"no JSON object in the first {self.max_preamble_chars} characters")
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if self._expect_key:
+                if ch in _WHITESPACE:
+                    continue
+                self._expect_key = False
+                if ch not in '"}':
+                    # A brace in prose ("{le résultat}"), not the object: keep looking
+                    self.start = None
+                    self._stack = []
+                    continue
+
+            if ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._stack.append(ch)
+            elif ch in _CLOSING:
+                if self._stack[-1] != _CLOSING[ch]:
+                    return self._malformed(f"unexpected '{ch}' at character {i}")
+                self._stack.pop()
+                if not self._stack:
+                    self.state = "complete"
+                    self.end = i + 1
+                    return self.state
+
+        self._offset += len(piece)
+        return self.state
+
+    def _malformed(self, error: str) -> str:
+        self.state = "malformed"
+        self.error = error
+        return self.state
+
+
+@dataclass
+class StreamedResponse:
+    """Response assembled from a stream (same fields the phases read from LLMClient)."""
+    answer: str
+    success: bool = True
+    error: Optional[str] = None
+    ttft_s: Optional[float] = None
+    generation_s: Optional[float] = None
+    retryable: Optional[bool] = None
+
+
+class StreamingLLMClient:
+    """
+    Drop-in wrapper around LLMClient that streams completions through a
+    JSONStreamScanner when the client supports it.
+    """
+
+    def __init__(self, llm_client: LLMClient):
+        self.llm_client = llm_client
+        self.supports_streaming = getattr(
+            llm_client, "supports_streaming", callable(getattr(llm_client, "generate_stream", None))
+        )
+        self._hints_supported = accepts_cache_control(llm_client)
+        self._stream_hints_supported = self.supports_streaming and accepts_cache_control(llm_client, "generate_stream")
+
+    def _streams(self, model: ModelConfig) -> bool:
+        return self.supports_streaming and getattr(model, "stream", True) is not False
+
+    def generate(self, model: ModelConfig, user_prompt: str, system_prompt: str = None, cache_control: Dict = None):
+        if not self._streams(model):
+            if cache_control is not None and self._hints_supported:
+                return self.llm_client.generate(model, user_prompt, system_prompt, cache_control=cache_control)
+            return self.llm_client.generate(model, user_prompt, system_prompt)
+        return self.generate_streamed(model, user_prompt, system_prompt, cache_control)
+
+    def generate_streamed(
+        self,
+        model: ModelConfig,
+        user_prompt: str,
+        system_prompt: str = None,
+        cache_control: Dict = None
+    ) -> StreamedResponse:
+        """Stream one completion, stopping at the end of the JSON object (or on malformed output)."""
+        scanner = JSONStreamScanner()
+        pieces: List[str] = []
+        started = time.perf_counter()
+        first = last = None
+        if cache_control is not None and self._stream_hints_supported:
+            stream = self.llm_client.generate_stream(model, user_prompt, system_prompt, cache_control=cache_control)
+        else:
+            stream = self.llm_client.generate_stream(model, user_prompt, system_prompt)
+        try:
+            for piece in stream:
+                if not piece:
+                    continue
+                last = time.perf_counter()
+                if first is None:
+                    first = last
+                pieces.append(piece)
+                if scanner.feed(piece) != "pending":
+                    break
+        except Exception as e:
+            return StreamedResponse(
+                answer="".join(pieces), success=False, error=f"Stream failed: {e}",
+                ttft_s=None if first is None else round(first - started, 4)
+            )
+        finally:
+            close = getattr(stream, "close", None)
+            if close:
+                close()
+
+        answer = "".join(pieces)
+        timing = {
+            "ttft_s": None if first is None else round(first - started, 4),
+            "generation_s": None if first is None else round(last - first, 4)
+        }
+        if scanner.state == "malformed":
+            return StreamedResponse(
+                answer=answer, success=False, retryable=True,
+                error=f"Malformed JSON stream aborted after {len(answer)} characters: {scanner.error}", **timing
+            )
+        if scanner.state == "complete":
+            return StreamedResponse(answer=answer[:scanner.end], **timing)
+        if not answer:
+            return StreamedResponse(answer="", success=False, error="Empty stream", **timing)
+        return StreamedResponse(answer=answer, **timing)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.llm_client, name)
@@ -0,0 +1,307 @@
+"""
+Page Index
+==========
+
+Per-document lookup structure shared by Phase 2 and the HTML report.
+
+Built once per document, it holds:
+- page number → page (content and original dict);
+- each page's normalized text (lower-cased, whitespace collapsed, inline
+  markdown markers dropped) with offsets back into the original content;
+- a word n-gram index (n-gram → page numbers) used to find the pages an
+  evidence quote comes from without scanning the whole document.
+
+``locate_evidence`` finds exact occurrences of a quote anywhere in the
+document; ``match_evidence`` fuzzy-matches a quote against given pages
+(see utils/evidence_grounding.py).
+
+Reviewer context extraction then only looks at the pages an issue
+references (plus a small window) and the pages its evidence is located
+on, instead of rescanning every page for every review.
+
+Usage:
+    index = load_page_index("report.json")
+    pages = index.pages_for_issue(issue)
+    spans = index.locate_evidence("émissions de scope 3")
+    match = index.match_evidence("émissions de scope 3 en hausse", [12, 13])
+"""
+
+import os
+import re
+import threading
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from csrd_council_2.utils.helpers import load_document
+
+
+# Word n-gram size used for evidence lookups
+NGRAM_SIZE = 3
+
+# Pages on each side of a referenced page handed to context extraction
+CONTEXT_WINDOW_PAGES = 2
+
+# Shorter evidence strings are not located (too unspecific)
+MIN_EVIDENCE_CHARS = 5
+
+# Inline markdown markers ignored when matching evidence against page text
+_MARKUP_CHARS = frozenset("*_`")
+
+# Page-text alignment windows tried per page when fuzzy-matching a quote
+MAX_MATCH_ANCHORS = 20
+
+_PAGE_NUMBER_RE = re.compile(r"\d+")
+
+
+def extract_page_numbers_from_refs(page_references: List[str]) -> List[int]:
+    """Extract page numbers from page reference strings."""
+    page_nums = set()
+    for ref in page_references:
+        nums = _PAGE_NUMBER_RE.findall(str(ref))
+        page_nums.update(int(n) for n in nums)
+    return sorted(page_nums)
+
+
+def normalize_text(text: str) -> Tuple[str, List[int]]:
+    """
+    Normalize text for matching and keep a map back to the original.
+
+    Returns:
+        (normalized text, offsets) where offsets[i] is the index in
+        ``text`` of the character that produced normalized character i
+    """
+    chars = []
+    offsets = []
+    space_at = None
+    for i, ch in enumerate(text):
+        if ch in _MARKUP_CHARS:
+            continue
+        if ch.isspace():
+            if chars and space_at is None:
+                space_at = i
+            continue
+        if space_at is not None:
+            chars.append(" ")
+            offsets.append(space_at)
+            space_at = None
+        for lowered in ch.lower():
+            chars.append(lowered)
+            offsets.append(i)
+    return "".join(chars), offsets
+
+
+class PageIndex:
+    """Page lookup, normalized page text and evidence n-gram index for one document."""
+
+    def __init__(self, pages: List[Dict]):
+        self.pages = pages
+        self.by_number: Dict[int, Dict] = {p["page_number"]: p for p in pages}
+        self.document_pages: Dict[int, str] = {p["page_number"]: p["content"] for p in pages}
+
+        self._normalized: Dict[int, Tuple[str, List[int]]] = {}
+        self._words: Dict[str, Set[int]] = defaultdict(set)
+        self._ngrams: Dict[Tuple[str, ...], Set[int]] = defaultdict(set)
+        for page_num, content in self.document_pages.items():
+            normalized, offsets = normalize_text(content or "")
+            self._normalized[page_num] = (normalized, offsets)
+            words = normalized.split(" ")
+            for word in words:
+                self._words[word].add(page_num)
+            for i in range(len(words) - NGRAM_SIZE + 1):
+                self._ngrams[tuple(words[i:i + NGRAM_SIZE])].add(page_num)
+
+        self._lock = threading.Lock()
+        self._located: Dict[str, List[Tuple[int, int, int]]] = {}
+        self._matched: Dict[Tuple[str, Tuple[int, ...]], Optional[Tuple[int, int, int, float]]] = {}
+        self._page_words: Dict[int, Tuple[List[str], List[int]]] = {}
+
+    def content(self, page_num: int) -> str:
+        """Original content of a page ("" if unknown)."""
+        return self.document_pages.get(page_num, "")
+
+    def _candidate_pages(self, words: List[str]) -> Set[int]:
+        # The first and last words of a quote may be cut mid-word, so only
+        # the interior words / n-grams are required to match exactly.
+        inner = words[1:-1]
+        if len(inner) >= NGRAM_SIZE:
+            keys = [tuple(inner[i:i + NGRAM_SIZE]) for i in range(len(inner) - NGRAM_SIZE + 1)]
+            postings = self._ngrams
+        elif inner:
+            keys = inner
+            postings = self._words
+        else:
+            return set(self._normalized)
+
+        candidates = None
+        for key in sorted(set(keys), key=lambda k: len(postings.get(k, ()))):
+            pages = postings.get(key)
+            if not pages:
+                return set()
+            candidates = set(pages) if candidates is None else candidates & pages
+            if not candidates:
+                break
+        return candidates
+
+    def locate_evidence(self, evidence: str) -> List[Tuple[int, int, int]]:
+        """
+        Find where an evidence quote occurs in the document.
+
+        Matching ignores case, whitespace differences and inline markdown
+        markers.
+
+        Returns:
+            (page_number, start, end) spans into the original page content,
+            in page order
+        """
+        if not evidence:
+            return []
+        with self._lock:
+            if evidence in self._located:
+                return self._located[evidence]
+
+        needle, _ = normalize_text(evidence.strip())
+        spans = []
+        if len(needle) >= MIN_EVIDENCE_CHARS:
+            for page_num in sorted(self._candidate_pages(needle.split(" "))):
+                normalized, offsets = self._normalized[page_num]
+                start = normalized.find(needle)
+                while start >= 0:
+                    end = start + len(needle)
+                    spans.append((page_num, offsets[start], offsets[end - 1] + 1))
+                    start = normalized.find(needle, end)
+
+        with self._lock:
+            self._located[evidence] = spans
+        return spans
+
+    def _words_of(self, page_num: int) -> Tuple[List[str], List[int]]:
+        # Words of a page's normalized text and their start offsets in it
+        with self._lock:
+            cached = self._page_words.get(page_num)
+        if cached is None:
+            normalized = self._normalized[page_num][0]
+            words = normalized.split(" ") if normalized else []
+            starts = []
+            position = 0
+            for word in words:
+                starts.append(position)
+                position += len(word) + 1
+            cached = (words, starts)
+            with self._lock:
+                self._page_words[page_num] = cached
+        return cached
+
+    def _align(self, needle_words: List[str], page_num: int) -> Optional[Tuple[int, int, int, float]]:
+        words, starts = self._words_of(page_num)
+        quote_ngrams: Dict[Tuple[str, ...], int] = {}
+        for q in range(len(needle_words) - NGRAM_SIZE + 1):
+            quote_ngrams.setdefault(tuple(needle_words[q:q + NGRAM_SIZE]), q)
+
+        # Align the quote where it would start given each shared n-gram
+        anchors = []
+        for i in range(len(words) - NGRAM_SIZE + 1):
+            q = quote_ngrams.get(tuple(words[i:i + NGRAM_SIZE]))
+            if q is not None and i - q not in anchors:
+                anchors.append(i - q)
+                if len(anchors) >= MAX_MATCH_ANCHORS:
+                    break
+
+        slack = max(2, len(needle_words) // 4)
+        best = None
+        for anchor in anchors:
+            lo = max(0, anchor - slack)
+            window = words[lo:anchor + len(needle_words) + slack]
+            blocks = [b for b in SequenceMatcher(None, needle_words, window, autojunk=False).get_matching_blocks() if b.size]
+            score = sum(b.size for b in blocks) / len(needle_words)
+            if best is None or score > best[1]:
+                best = (lo + blocks[0].b, score, lo + blocks[-1].b + blocks[-1].size - 1)
+        if best is None:
+            return None
+
+        first, score, last = best
+        offsets = self._normalized[page_num][1]
+        end = starts[last] + len(words[last])
+        return page_num, offsets[starts[first]], offsets[end - 1] + 1, score
+
+    def match_evidence(self, evidence: str, page_numbers: Iterable[int]) -> Optional[Tuple[int, int, int, float]]:
+        """
+        Best match of an evidence quote on the given pages.
+
+        An exact occurrence (as in ``locate_evidence``) scores 1.0.
+        Otherwise the quote's words are aligned with the page text around
+        every word n-gram they share, and the score is the share of the
+        quote's words found in order in the best window (a paraphrased or
+        partly invented quote scores lower).
+
+        Returns:
+            (page_number, start, end, score) with start/end into the
+            original page content, or None when no page shares a word
+            n-gram with the quote
+        """
+        pages = tuple(sorted(n for n in set(page_numbers) if n in self._normalized))
+        key = (evidence, pages)
+        with self._lock:
+            if key in self._matched:
+                return self._matched[key]
+
+        exact = [span for span in self.locate_evidence(evidence) if span[0] in pages]
+        if exact:
+            match = exact[0] + (1.0,)
+        else:
+            match = None
+            needle_words = normalize_text((evidence or "").strip())[0].split(" ")
+            if len(needle_words) >= NGRAM_SIZE:
+                for page_num in pages:
+                    candidate = self._align(needle_words, page_num)
+                    if candidate and (match is None or candidate[3] > match[3]):
+                        match = candidate
+
+        with self._lock:
+            self._matched[key] = match
+        return match
+
+    def matched_text(self, page_num: int, start: int, end: int) -> str:
+        """Page text of a match span, without inline markdown markers (as rendered)."""
+        return "".join(ch for ch in self.content(page_num)[start:end] if ch not in _MARKUP_CHARS)
+
+    def evidence_pages(self, evidence_list: List[str]) -> Set[int]:
+        """Pages on which any of the evidence quotes occurs."""
+        return {span[0] for evidence in evidence_list for span in self.locate_evidence(evidence)}
+
+    def evidence_on_page(self, evidence_list: List[str], page_num: int) -> List[str]:
+        """The evidence quotes that occur on ``page_num``."""
+        return [e for e in evidence_list if any(span[0] == page_num for span in self.locate_evidence(e))]
+
+    def pages_for_issue(self, issue: Dict, window: int = CONTEXT_WINDOW_PAGES) -> List[Dict]:
+        """
+        Pages relevant to an issue: its referenced pages (± ``window``) and
+        the pages its evidence is found on. Falls back to the whole document
+        when neither yields a page.
+        """
+        page_nums = set()
+        for page_num in extract_page_numbers_from_refs(issue.get("page_references", [])):
+            page_nums.update(range(page_num - window, page_num + window + 1))
+        page_nums.update(self.evidence_pages(issue.get("evidence", [])))
+
+        pages = [self.by_number[n] for n in sorted(page_nums) if n in self.by_number]
+        return pages or self.pages
+
+
+_index_lock = threading.Lock()
+_index_cache: Dict[Tuple[str, float], PageIndex] = {}
+
+
+def load_page_index(document_path: str) -> PageIndex:
+    """
+    Load a document and build its PageIndex, reusing the last index built
+    for the same (unchanged) file so all phases of a run share it.
+    """
+    key = (os.path.abspath(document_path), os.path.getmtime(document_path))
+    with _index_lock:
+        index = _index_cache.get(key)
+        if index is None:
+            index = PageIndex(load_document(document_path))
+            _index_cache.clear()
+            _index_cache[key] = index
+        return index
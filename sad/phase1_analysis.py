@@ -0,0 +1,474 @@
+"""
+Phase 1: Analysis
+=================
+
+Independent analysis phase where each analyst LLM analyzes the document.
+
+This module can be run independently:
+    python -m csrd_council.phases.phase1_analysis \\
+        --document report.json \\
+        --config council_config.json \\
+        --analyst Analyst-A \\
+        --output-dir ./outputs
+
+Or run all analysts:
+    python -m csrd_council.phases.phase1_analysis \\
+        --document report.json \\
+        --config council_config.json \\
+        --output-dir ./outputs
+"""
+
+import os
+import sys
+import json
+import argparse
+from datetime import datetime
+from typing import List, Dict, Optional
+
+# Add parent to path for imports when running as script
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from csrd_council_2.config.models import CouncilConfig, ModelConfig, EndpointConfig
+from csrd_council_2.config.prompts_v5 import ANALYST_SYSTEM_PROMPT, format_analyst_prompt
+from csrd_council_2.models.llm_client import LLMClient
+from csrd_council_2.utils.helpers import (
+    save_json, generate_issue_id, get_timestamp
+)
+from csrd_council_2.utils.concurrency import (
+    run_units, get_max_workers, EndpointRateLimiter, generate_with_retry
+)
+from csrd_council_2.utils.llm_cache import create_llm_client
+from csrd_council_2.utils.checkpoint import CheckpointJournal, run_checkpointed
+from csrd_council_2.utils.chunking import (
+    plan_chunks, chunks_from_plan, save_chunk_plan, resolve_overlap_issues
+)
+from csrd_council_2.utils.telemetry import span
+from csrd_council_2.utils.json_repair import parse_with_repair
+from csrd_council_2.utils.page_index import load_page_index
+from csrd_council_2.utils.evidence_grounding import get_evidence_grounding, ground_issues
+
+
+def analyze_chunk(
+    analyst: ModelConfig,
+    chunk: Dict,
+    llm_client: LLMClient,
+    verbose: bool = True,
+    rate_limiter: Optional[EndpointRateLimiter] = None
+) -> Dict:
+    """
+    Run a single analyst on a single document chunk.
+    
+    Args:
+        analyst: Analyst model configuration
+        chunk: Document chunk
+        llm_client: LLM client instance
+        verbose: Print progress
+        rate_limiter: Optional per-endpoint rate limiter (enables 429/5xx retries)
+    
+    Returns:
+        Dict with the chunk's "issues" and its "chunk_detail" entry
+    """
+    if verbose:
+        print(f"Processing chunk {chunk['chunk_id']} ({analyst.name}): pages {chunk['page_start']}-{chunk['page_end']}...")
+    
+    # Format prompt
+    user_prompt = format_analyst_prompt(
+        analyst_name=analyst.name,
+        chunk_id=chunk['chunk_id'],
+        page_start=chunk['page_start'],
+        page_end=chunk['page_end'],
+        content=chunk['text']
+    )
+    
+    # Call LLM (rate-limited, with retry on 429/5xx and aborted malformed streams)
+    response = generate_with_retry(
+        llm_client, analyst, user_prompt, ANALYST_SYSTEM_PROMPT,
+        rate_limiter=rate_limiter, verbose=verbose
+    )
+    
+    if not response.success:
+        if verbose:
+            print(f"   ⚠️  Error: {response.error}")
+        return {
+            "issues": [],
+            "chunk_detail": {
+                "chunk_id": chunk['chunk_id'],
+                "error": response.error,
+                "issues": []
+            }
+        }
+    
+    # Parse response (repairing unreadable JSON)
+    parsed = parse_with_repair(
+        response.answer, llm_client, analyst, "phase1", expected_keys=("issues",),
+        rate_limiter=rate_limiter, verbose=verbose
+    )
+    
+    if parsed.get("parse_error"):
+        if verbose:
+            print(f"   ⚠️  Parse error: {parsed.get('error', 'Unknown')}")
+        return {
+            "issues": [],
+            "chunk_detail": {
+                "chunk_id": chunk['chunk_id'],
+                "parse_error": True,
+                "issues": []
+            }
+        }
+    
+    # Extract issues and add metadata
+    issues = parsed.get("issues", [])
+    for issue in issues:
+        issue["source_analyst"] = analyst.name
+        issue["source_chunk"] = chunk['chunk_id']
+        issue["issue_id"] = generate_issue_id(issue, analyst.name, chunk['chunk_id'])
+    
+    if verbose:
+        print(f"   ✓ {analyst.name} found {len(issues)} issue(s) in chunk {chunk['chunk_id']}")
+    
+    return {
+        "issues": issues,
+        "chunk_detail": {
+            "chunk_id": chunk['chunk_id'],
+            "pages": f"{chunk['page_start']}-{chunk['page_end']}",
+            "issues_found": len(issues),
+            "sections_analyzed": parsed.get("sections_analyzed", ""),
+            "confidence_notes": parsed.get("confidence_notes", "")
+        }
+    }
+
+
+def chunk_unit_key(chunk: Dict) -> str:
+    """Checkpoint unit key of a chunk (page range guards against a changed chunk plan)."""
+    return f"{chunk['chunk_id']}:{chunk['page_start']}-{chunk['page_end']}"
+
+
+def chunk_output_succeeded(output: Dict) -> bool:
+    """Whether an analyze_chunk output is worth checkpointing (no LLM/parse error)."""
+    detail = output["chunk_detail"]
+    return "error" not in detail and not detail.get("parse_error")
+
+
+def build_analyst_result(analyst: ModelConfig, chunks: List[Dict], chunk_outputs: List[Dict]) -> Dict:
+    """Assemble per-chunk outputs (in chunk order) into the analyst result dict."""
+    all_issues = []
+    chunk_results = []
+    for output in chunk_outputs:
+        all_issues.extend(output["issues"])
+        chunk_results.append(output["chunk_detail"])
+    
+    return {
+        "analyst": analyst.name,
+        "model_id": analyst.model_id,
+        "timestamp": get_timestamp(),
+        "chunks_analyzed": len(chunks),
+        "total_issues": len(all_issues),
+        "issues": all_issues,
+        "chunk_details": chunk_results
+    }
+
+
+def run_analyst(
+    analyst: ModelConfig,
+    chunks: List[Dict],
+    llm_client: LLMClient,
+    verbose: bool = True,
+    max_workers: Optional[int] = None
+) -> Dict:
+    """
+    Run a single analyst on all document chunks (on the run_units pool).
+    
+    Args:
+        analyst: Analyst model configuration
+        chunks: List of document chunks
+        llm_client: LLM client instance
+        verbose: Print progress
+        max_workers: Worker pool size (None = default)
+    
+    Returns:
+        Analysis result dict
+    """
+    if verbose:
+        print(f"\n🔍 {analyst.name} analyzing {len(chunks)} chunk(s)...")
+    
+    rate_limiter = EndpointRateLimiter()
+    chunk_outputs = run_units(
+        [(analyst, chunk) for chunk in chunks],
+        lambda model, chunk: analyze_chunk(model, chunk, llm_client, verbose, rate_limiter),
+        max_workers=get_max_workers(None, max_workers)
+    )
+    result = build_analyst_result(analyst, chunks, chunk_outputs)
+    
+    if verbose:
+        print(f"   ✅ {analyst.name} complete: {result['total_issues']} total issues")
+    
+    return result
+
+
+def assign_overlap_issues(
+    analyst: ModelConfig,
+    chunks: List[Dict],
+    chunk_outputs: List[Dict],
+    verbose: bool = True
+) -> List[Dict]:
+    """
+    Give each overlap-region issue of one analyst to a single chunk.
+    
+    See chunking.resolve_overlap_issues. The count of issues moved into a
+    chunk is added to that chunk's chunk_detail, and the count of
+    duplicates a chunk reported to the reporting chunk's.
+    
+    Args:
+        analyst: Analyst model configuration
+        chunks: Document chunks
+        chunk_outputs: The analyst's analyze_chunk outputs, in chunk order
+        verbose: Print progress
+    
+    Returns:
+        New outputs (the inputs, possibly restored from the journal, are not modified)
+    """
+    resolved, stats = resolve_overlap_issues([output["issues"] for output in chunk_outputs], chunks)
+    
+    outputs = []
+    for chunk, output, issues in zip(chunks, chunk_outputs, resolved):
+        detail = output["chunk_detail"]
+        if chunk["chunk_id"] in stats:
+            detail = dict(detail, **stats[chunk["chunk_id"]])
+        outputs.append(dict(output, issues=issues, chunk_detail=detail))
+    
+    if verbose and stats:
+        moved = sum(s["overlap_issues_reassigned"] for s in stats.values())
+        removed = sum(s["overlap_issues_removed"] for s in stats.values())
+        print(f"   🔁 {analyst.name} overlap issues: {moved} moved to their owning chunk, {removed} duplicate(s) removed")
+    
+    return outputs
+
+
+def save_phase1_results(
+    analysts: List[ModelConfig],
+    chunks: List[Dict],
+    outputs_by_analyst: Dict[str, List[Dict]],
+    document_path: str,
+    total_pages: int,
+    output_dir: str,
+    verbose: bool = True
+) -> List[str]:
+    """
+    Write one phase1_<analyst>.json file per analyst.
+    
+    Args:
+        analysts: Analysts, in output order
+        chunks: Document chunks
+        outputs_by_analyst: Per-chunk analyze_chunk outputs (in chunk order), by analyst name
+        document_path: Path to document JSON
+        total_pages: Number of document pages
+        output_dir: Output directory
+        verbose: Print progress
+    
+    Returns:
+        List of output file paths
+    """
+    output_files = []
+    for analyst in analysts:
+        result = build_analyst_result(analyst, chunks, outputs_by_analyst[analyst.name])
+        
+        # Add document metadata
+        result["document"] = {
+            "path": document_path,
+            "total_pages": total_pages,
+            "chunks": len(chunks)
+        }
+        
+        # Save result
+        output_path = os.path.join(output_dir, f"phase1_{analyst.name}.json")
+        save_json(result, output_path)
+        output_files.append(output_path)
+        
+        if verbose:
+            print(f"   ✅ {analyst.name} complete: {result['total_issues']} total issues")
+            print(f"   💾 Saved: {output_path}")
+    
+    return output_files
+
+
+def run_phase1(
+    document_path: str,
+    config: CouncilConfig,
+    output_dir: str,
+    analyst_names: Optional[List[str]] = None,
+    mock_mode: bool = False,
+    verbose: bool = True,
+    max_workers: Optional[int] = None,
+    llm_client: Optional[LLMClient] = None,
+    journal: Optional[CheckpointJournal] = None
+) -> List[str]:
+    """
+    Run Phase 1 analysis for all (or selected) analysts.
+    
+    Every (analyst, chunk) pair is dispatched to a bounded worker pool;
+    per-model limits come from ModelConfig, behind a per-endpoint token
+    bucket with 429/5xx retries. Results are reassembled in
+    chunk order, so output files do not depend on completion order.
+    
+    Issues reported on overlap pages are then given to the single chunk
+    owning their page (duplicates dropped), unless the config sets
+    ``overlap_issue_ownership`` to False, and annotated with their
+    ``evidence_grounding`` (see utils/evidence_grounding.py) unless the
+    config sets ``evidence_grounding`` to False.
+    
+    Args:
+        document_path: Path to document JSON
+        config: Council configuration
+        output_dir: Output directory for results
+        analyst_names: Optional list of specific analysts to run (None = all)
+        mock_mode: Use mock LLM
+        verbose: Print progress
+        max_workers: Worker pool size (None = config / default)
+        llm_client: Shared LLM client (None = create one for this phase)
+        journal: Checkpoint journal; units already recorded are not re-run
+    
+    Returns:
+        List of output file paths
+    """
+    if verbose:
+        print("\n" + "="*70)
+        print("PHASE 1: INDEPENDENT ANALYSIS")
+        print("="*70)
+    
+    # Load document
+    if verbose:
+        print(f"\n📂 Loading document: {document_path}")
+    page_index = load_page_index(document_path)
+    pages = page_index.pages
+    
+    # Chunk document (the plan is saved for Phase 3)
+    os.makedirs(output_dir, exist_ok=True)
+    with span("chunk_planning", phase="phase1", pages=len(pages)):
+        plan = plan_chunks(pages, config)
+        save_chunk_plan(plan, output_dir)
+    chunks = chunks_from_plan(pages, plan)
+    if verbose:
+        budget_note = f", ≤{plan['token_budget']} tokens each" if plan["token_budget"] else ""
+        print(f"📦 Created {len(chunks)} chunk(s) from {len(pages)} pages ({plan['strategy']}{budget_note})")
+    
+    # Filter analysts if specified
+    analysts = config.analysts
+    if analyst_names:
+        analysts = [a for a in analysts if a.name in analyst_names]
+        if verbose:
+            print(f"👤 Running {len(analysts)} selected analyst(s): {[a.name for a in analysts]}")
+    else:
+        if verbose:
+            print(f"👥 Running {len(analysts)} analyst(s): {[a.name for a in analysts]}")
+    
+    # Initialize LLM client (unless the caller shares one across phases)
+    if llm_client is None:
+        llm_client = create_llm_client(mock_mode)
+    
+    # Create output directory
+    os.makedirs(output_dir, exist_ok=True)
+    
+    # Fan out every (analyst, chunk) pair; chunk-major order interleaves models
+    workers = get_max_workers(config, max_workers)
+    if verbose:
+        print(f"⚙️  Dispatching {len(analysts) * len(chunks)} analyst × chunk unit(s) on {workers} worker(s)")
+    
+    if journal and verbose and journal.count("phase1"):
+        print(f"♻️  Resuming: {journal.count('phase1')} analyst × chunk unit(s) in checkpoint journal")
+    
+    rate_limiter = EndpointRateLimiter()
+    
+    def analyze_unit(analyst: ModelConfig, chunk: Dict) -> Dict:
+        return run_checkpointed(
+            journal, "phase1", analyst.name, chunk_unit_key(chunk),
+            lambda: analyze_chunk(analyst, chunk, llm_client, verbose, rate_limiter),
+            succeeded=chunk_output_succeeded
+        )
+    
+    units = [(analyst, chunk) for chunk in chunks for analyst in analysts]
+    unit_outputs = run_units(units, analyze_unit, max_workers=workers)
+    
+    outputs_by_analyst = {analyst.name: [] for analyst in analysts}
+    for (analyst, _), output in zip(units, unit_outputs):
+        outputs_by_analyst[analyst.name].append(output)
+    
+    # Overlap pages are analyzed twice: keep each finding in one chunk only
+    if getattr(config, "overlap_issue_ownership", True):
+        with span("overlap_ownership", phase="phase1"):
+            for analyst in analysts:
+                outputs_by_analyst[analyst.name] = assign_overlap_issues(
+                    analyst, chunks, outputs_by_analyst[analyst.name], verbose
+                )
+    
+    # Check every issue's evidence quotes against the pages it cites
+    if get_evidence_grounding(config):
+        issues = [issue for outputs in outputs_by_analyst.values() for output in outputs for issue in output["issues"]]
+        with span("evidence_grounding", phase="phase1", issues=len(issues)) as extra:
+            grounding_stats = ground_issues(issues, page_index, config, overwrite=True)
+            extra.update(grounding_stats)
+        if verbose:
+            print(f"🔎 Evidence grounding: {grounding_stats['grounded']} grounded, "
+                  f"{grounding_stats['ungrounded']} ungrounded, {grounding_stats['unverified']} unverified")
+    
+    output_files = save_phase1_results(
+        analysts, chunks, outputs_by_analyst, document_path, len(pages), output_dir, verbose
+    )
+    
+    if verbose:
+        print(f"\n✅ Phase 1 complete: {len(output_files)} analysis file(s) generated")
+    
+    return output_files
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="CSRD Council - Phase 1: Analysis",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    
+    parser.add_argument("--document", "-d", required=True,
+                       help="Path to document JSON file")
+    parser.add_argument("--config", "-c", required=True,
+                       help="Path to council config JSON/YAML file")
+    parser.add_argument("--output-dir", "-o", default="./outputs",
+                       help="Output directory (default: ./outputs)")
+    parser.add_argument("--analyst", "-a", action="append",
+                       help="Specific analyst to run (can be repeated). If not specified, runs all.")
+    parser.add_argument("--mock", action="store_true",
+                       help="Use mock LLM for testing")
+    parser.add_argument("--max-workers", type=int,
+                       help="Concurrent analyst × chunk requests (default: config or 8)")
+    parser.add_argument("--quiet", "-q", action="store_true",
+                       help="Suppress progress output")
+    
+    args = parser.parse_args()
+    
+    # Load config
+    if args.config.endswith('.yaml') or args.config.endswith('.yml'):
+        config = CouncilConfig.from_yaml(args.config)
+    else:
+        config = CouncilConfig.from_json(args.config)
+    
+    # Validate config
+    issues = config.validate()
+    for issue in issues:
+        print(issue)
+    
+    # Run phase 1
+    output_files = run_phase1(
+        document_path=args.document,
+        config=config,
+        output_dir=args.output_dir,
+        analyst_names=args.analyst,
+        mock_mode=args.mock,
+        verbose=not args.quiet,
+        max_workers=args.max_workers
+    )
+    
+    print(f"\nOutput files: {output_files}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1177 @@
+"""
+Phase 2: Peer Review (v2.0)
+===========================
+
+Peer review phase where reviewer LLMs evaluate issues found in Phase 1.
+Updated to support new confidence levels and cross-section risk assessment.
+
+This module can be run independently:
+    python -m csrd_council.phases.phase2_review \\
+        --phase1-dir ./outputs \\
+        --document report.json \\
+        --config council_config.json \\
+        --output-dir ./outputs
+
+Or run a single reviewer:
+    python -m csrd_council.phases.phase2_review \\
+        --phase1-dir ./outputs \\
+        --document report.json \\
+        --config council_config.json \\
+        --reviewer Reviewer-1 \\
+        --output-dir ./outputs
+"""
+
+import os
+import sys
+import json
+import argparse
+from datetime import datetime
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
+
+# Add parent to path for imports when running as script
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from csrd_council_2.config.models import CouncilConfig, ModelConfig
+from csrd_council_2.config.prompts_v5 import (
+    REVIEWER_SYSTEM_PROMPT, format_reviewer_prompt, format_reviewer_batch_prompt
+)
+from csrd_council_2.models.llm_client import LLMClient
+from csrd_council_2.utils.helpers import (
+    load_json, save_json,
+    find_phase1_files, extract_context_for_issue, get_timestamp
+)
+from csrd_council_2.utils.concurrency import (
+    run_units, get_max_workers, EndpointRateLimiter, generate_with_retry
+)
+from csrd_council_2.utils.llm_cache import create_llm_client
+from csrd_council_2.utils.checkpoint import CheckpointJournal
+from csrd_council_2.utils.streaming import Phase1Files, JSONLSpill, write_json_array
+from csrd_council_2.utils.page_index import PageIndex, load_page_index
+from csrd_council_2.utils.issue_clustering import (
+    cluster_issues, fan_out_review, DEFAULT_SIMILARITY_THRESHOLD
+)
+from csrd_council_2.utils.telemetry import span
+from csrd_council_2.utils.json_repair import parse_with_repair
+from csrd_council_2.utils.evidence_grounding import (
+    get_evidence_grounding, ground_issues, is_ungrounded, ungrounded_reason
+)
+from csrd_council_2.phases.phase3_judgment import (
+    validity_outcome, MIN_VALIDITY_CONFIRM, MIN_VALIDITY_VERIFY
+)
+
+
+# =============================================================================
+# CONFIGURATION v2.0
+# =============================================================================
+
+# Types d'issues avec risque élevé de faux positifs (requiert validation renforcée)
+HIGH_FP_RISK_TYPES = [
+    "MISSING_INFORMATION",
+    "AMBIGUOUS_STATEMENT",
+]
+
+# Types d'issues à haute priorité (risque réglementaire)
+HIGH_PRIORITY_TYPES = [
+    "GREENWASHING",
+    "REGULATORY_GAP",
+    "NUMERIC_INCONSISTENCY",
+    "LOGICAL_CONTRADICTION",
+]
+
+# Issues per reviewer call (1 = one call per issue; see batch_issues)
+DEFAULT_REVIEW_BATCH_SIZE = 1
+
+# Reviewer calls per worker in a review window (see review_windows)
+REVIEW_WINDOW_CALLS_PER_WORKER = 4
+
+
+def review_windows(layout: Phase1Files, min_issues: int) -> Iterator[List[Tuple[int, Dict]]]:
+    """
+    Group the issues of whole source chunks into review windows.
+    
+    Chunks are read one at a time (see Phase1Files.iter_chunks) and added
+    to the current window until it holds ``min_issues`` issues, so only
+    the window being reviewed is in memory.
+    
+    Yields:
+        (index, issue) pairs of consecutive chunks
+    """
+    window = []
+    for _, entries in layout.iter_chunks():
+        window.extend(entries)
+        if len(window) >= min_issues:
+            yield window
+            window = []
+    if window:
+        yield window
+
+
+def get_issue_field_with_default(issue: Dict, field: str, default: str = "N/A") -> str:
+    """
+    Get a field from issue dict with a default value.
+    Handles both old and new issue formats for backwards compatibility.
+    """
+    value = issue.get(field)
+    if value is None or value == "":
+        return default
+    return str(value)
+
+
+def get_review_batch_size(config: CouncilConfig, batch_size: Optional[int] = None) -> int:
+    """Resolve the review batch size: explicit value, then config, then default."""
+    if batch_size and batch_size > 0:
+        return batch_size
+    configured = getattr(config, "review_batch_size", None)
+    if isinstance(configured, int) and configured > 0:
+        return configured
+    return DEFAULT_REVIEW_BATCH_SIZE
+
+
+def batch_issues(issues: List[Dict], batch_size: int) -> List[List[int]]:
+    """
+    Group issue positions into review batches.
+    
+    Only issues from the same source chunk share a batch (they share a
+    context window); each chunk's issues are cut into batches of at most
+    ``batch_size``, in issue order.
+    
+    Returns:
+        Batches of indices into ``issues``
+    """
+    by_chunk: Dict[object, List[int]] = {}
+    for i, issue in enumerate(issues):
+        by_chunk.setdefault(issue.get("source_chunk"), []).append(i)
+    
+    batches = []
+    for indices in by_chunk.values():
+        for start in range(0, len(indices), batch_size):
+            batches.append(indices[start:start + batch_size])
+    return batches
+
+
+def get_issue_prompt_fields(issue: Dict, index: int) -> Dict[str, str]:
+    """Reviewer prompt fields for an issue (blind review - no source analyst info)."""
+    evidence = issue.get("evidence", [])
+    evidence_text = "\n".join([f"- {e}" for e in evidence]) if evidence else "No evidence provided"
+    
+    # Get new fields with backwards compatibility (default values for old format)
+    confidence = get_issue_field_with_default(issue, "confidence", "MEDIUM")
+    cross_section_note = get_issue_field_with_default(
+        issue, 
+        "cross_section_note", 
+        "Non spécifié (format legacy)" if issue.get("cross_section_check_needed") else "N/A"
+    )
+    
+    return {
+        "issue_id": issue.get("issue_id", f"issue-{index}"),
+        "issue_type": issue.get("type", "UNKNOWN"),
+        "severity": issue.get("severity", "UNKNOWN"),
+        "confidence": confidence,
+        "title": issue.get("title", "Untitled"),
+        "description": issue.get("description", "No description"),
+        "evidence": evidence_text,
+        "cross_section_note": cross_section_note
+    }
+
+
+def apply_fp_risk_penalty(evaluation: Dict, issue_type: str) -> Dict:
+    """
+    Apply the cross-section risk penalty for high FP risk types (in place).
+    
+    Returns:
+        The evaluation dict
+    """
+    if issue_type in HIGH_FP_RISK_TYPES:
+        cross_section_risk = evaluation.get("cross_section_risk", "MEDIUM")
+        validity_score = evaluation.get("validity_score", 0.5)
+        
+        # Apply penalty based on cross-section risk
+        if cross_section_risk == "HIGH":
+            adjusted_score = max(0.0, validity_score - 0.15)
+            evaluation["validity_score_original"] = validity_score
+            evaluation["validity_score"] = adjusted_score
+            evaluation["validity_adjustment_reason"] = "Cross-section risk HIGH penalty (-0.15)"
+        elif cross_section_risk == "MEDIUM":
+            adjusted_score = max(0.0, validity_score - 0.08)
+            evaluation["validity_score_original"] = validity_score
+            evaluation["validity_score"] = adjusted_score
+            evaluation["validity_adjustment_reason"] = "Cross-section risk MEDIUM penalty (-0.08)"
+    return evaluation
+
+
+def build_review_record(
+    reviewer: ModelConfig,
+    issue: Dict,
+    index: int,
+    evaluation: Dict,
+    verbose: bool = True
+) -> Dict:
+    """Build the review record for a parsed evaluation (FP risk penalty applied)."""
+    issue_id = issue.get("issue_id", f"issue-{index}")
+    issue_type = issue.get("type", "UNKNOWN")
+    
+    apply_fp_risk_penalty(evaluation, issue_type)
+    
+    review_result = {
+        "issue_id": issue_id,
+        "issue_type": issue_type,
+        "issue_title": issue.get("title", ""),
+        "issue_source_analyst": issue.get("_source_analyst", "Unknown"),
+        "issue_confidence": get_issue_field_with_default(issue, "confidence", "MEDIUM"),
+        "reviewer_id": reviewer.name,
+        "evaluation": evaluation,
+        "high_fp_risk": issue_type in HIGH_FP_RISK_TYPES,
+        "high_priority": issue_type in HIGH_PRIORITY_TYPES
+    }
+    
+    # Log result
+    validity = evaluation.get("validity_score", "?")
+    assessment = evaluation.get("overall_assessment", "?")
+    cross_risk = evaluation.get("cross_section_risk", "?")
+    
+    if verbose:
+        validity_str = f"{validity:.2f}" if isinstance(validity, float) else str(validity)
+        adjustment_note = ""
+        if evaluation.get("validity_adjustment_reason"):
+            adjustment_note = f" (adjusted: {evaluation.get('validity_adjustment_reason')})"
+        print(f"   ✓ Validity: {validity_str}{adjustment_note}, Cross-risk: {cross_risk}, Assessment: {assessment}")
+    
+    return review_result
+
+
+def _print_review_start(reviewer: ModelConfig, issue: Dict, index: int) -> None:
+    issue_type = issue.get("type", "UNKNOWN")
+    title = issue.get("title", "Untitled")[:50]
+    # Mark high FP risk types
+    risk_marker = "⚠️ " if issue_type in HIGH_FP_RISK_TYPES else ""
+    priority_marker = "🔴 " if issue_type in HIGH_PRIORITY_TYPES else ""
+    print(f"   {reviewer.name} reviewing #{index+1}: {priority_marker}{risk_marker}{title}...")
+
+
+def review_issue(
+    reviewer: ModelConfig,
+    issue: Dict,
+    index: int,
+    page_index: PageIndex,
+    llm_client: LLMClient,
+    verbose: bool = True,
+    rate_limiter: Optional[EndpointRateLimiter] = None
+) -> Dict:
+    """
+    Run a single reviewer on a single issue.
+    
+    Args:
+        reviewer: Reviewer model configuration
+        issue: Issue to review
+        index: Position of the issue in the collected issue list (fallback ID)
+        page_index: Document page index (for context extraction)
+        llm_client: LLM client instance
+        verbose: Print progress
+        rate_limiter: Optional per-endpoint rate limiter (enables 429/5xx retries)
+    
+    Returns:
+        Review record dict
+    """
+    issue_id = issue.get("issue_id", f"issue-{index}")
+    
+    if verbose:
+        _print_review_start(reviewer, issue, index)
+    
+    # Extract context for this issue (only from the pages it can concern)
+    context = extract_context_for_issue(issue, page_index.pages_for_issue(issue))
+    
+    # Format prompt (blind review - no source analyst info)
+    user_prompt = format_reviewer_prompt(
+        reviewer_name=reviewer.name,
+        context=context,
+        **get_issue_prompt_fields(issue, index)
+    )
+    
+    # Call LLM (rate-limited, with retry on 429/5xx)
+    response = generate_with_retry(
+        llm_client, reviewer, user_prompt, REVIEWER_SYSTEM_PROMPT,
+        rate_limiter=rate_limiter, verbose=verbose
+    )
+    
+    if not response.success:
+        if verbose:
+            print(f"   ⚠️  Error: {response.error}")
+        return {
+            "issue_id": issue_id,
+            "reviewer_id": reviewer.name,
+            "error": response.error,
+            "evaluation": None
+        }
+    
+    # Parse response (repairing unreadable JSON)
+    parsed = parse_with_repair(
+        response.answer, llm_client, reviewer, "phase2", rate_limiter=rate_limiter, verbose=verbose
+    )
+    
+    if parsed.get("parse_error"):
+        if verbose:
+            print(f"   ⚠️  Parse error")
+        return {
+            "issue_id": issue_id,
+            "reviewer_id": reviewer.name,
+            "parse_error": True,
+            "evaluation": None
+        }
+    
+    # Extract evaluation
+    evaluation = parsed.get("evaluation", parsed)
+    return build_review_record(reviewer, issue, index, evaluation, verbose)
+
+
+def split_batch_evaluations(parsed: Dict, issue_ids: List[str]) -> List[Optional[Dict]]:
+    """
+    Match a batched reviewer answer back to the issues of the batch.
+    
+    Evaluations are matched by issue_id; when the batch's IDs are not
+    unique (or the answer omits them) they are matched by position.
+    
+    Returns:
+        One evaluation dict (or None if missing) per issue, in batch order
+    """
+    entries = [e for e in parsed.get("evaluations", []) if isinstance(e, dict)]
+    
+    if len(set(issue_ids)) == len(issue_ids):
+        by_id = {str(e.get("issue_id")): e for e in entries if e.get("issue_id") is not None}
+        if by_id:
+            matched = [by_id.get(issue_id) for issue_id in issue_ids]
+        else:
+            matched = entries[:len(issue_ids)]
+    else:
+        matched = entries[:len(issue_ids)]
+    matched += [None] * (len(issue_ids) - len(matched))
+    
+    evaluations = []
+    for entry in matched:
+        evaluation = entry.get("evaluation", entry) if entry else None
+        evaluations.append(evaluation if isinstance(evaluation, dict) else None)
+    return evaluations
+
+
+def review_issue_batch(
+    reviewer: ModelConfig,
+    batch: List[Tuple[int, Dict]],
+    page_index: PageIndex,
+    llm_client: LLMClient,
+    verbose: bool = True,
+    rate_limiter: Optional[EndpointRateLimiter] = None
+) -> List[Dict]:
+    """
+    Run a single reviewer on several issues sharing a context, in one call.
+    
+    The answer is split back into one review record per issue, in the same
+    format as review_issue (FP risk penalties included). A single-issue
+    batch is reviewed with the regular single-issue prompt.
+    
+    Args:
+        reviewer: Reviewer model configuration
+        batch: (index, issue) pairs; index is the issue's position in the
+            collected issue list (fallback ID)
+        page_index: Document page index (for context extraction)
+        llm_client: LLM client instance
+        verbose: Print progress
+        rate_limiter: Optional per-endpoint rate limiter (enables 429/5xx retries)
+    
+    Returns:
+        Review record dicts, in batch order
+    """
+    if len(batch) == 1:
+        index, issue = batch[0]
+        return [review_issue(reviewer, issue, index, page_index, llm_client, verbose, rate_limiter)]
+    
+    fields = [get_issue_prompt_fields(issue, index) for index, issue in batch]
+    issue_ids = [f["issue_id"] for f in fields]
+    
+    if verbose:
+        for index, issue in batch:
+            _print_review_start(reviewer, issue, index)
+    
+    # One context for the whole batch: the pages any of its issues can concern
+    pages = {}
+    for _, issue in batch:
+        for page in page_index.pages_for_issue(issue):
+            pages[page["page_number"]] = page
+    merged_issue = {
+        "page_references": [ref for _, issue in batch for ref in issue.get("page_references", [])],
+        "evidence": [e for _, issue in batch for e in issue.get("evidence", [])]
+    }
+    context = extract_context_for_issue(merged_issue, [pages[n] for n in sorted(pages)])
+    
+    user_prompt = format_reviewer_batch_prompt(
+        reviewer_name=reviewer.name,
+        issues=fields,
+        context=context
+    )
+    
+    # Call LLM (rate-limited, with retry on 429/5xx)
+    response = generate_with_retry(
+        llm_client, reviewer, user_prompt, REVIEWER_SYSTEM_PROMPT,
+        rate_limiter=rate_limiter, verbose=verbose
+    )
+    
+    if not response.success:
+        if verbose:
+            print(f"   ⚠️  Error ({len(batch)} issue batch): {response.error}")
+        return [
+            {"issue_id": issue_id, "reviewer_id": reviewer.name, "error": response.error, "evaluation": None}
+            for issue_id in issue_ids
+        ]
+    
+    parsed = parse_with_repair(
+        response.answer, llm_client, reviewer, "phase2", expected_keys=("evaluations",),
+        rate_limiter=rate_limiter, verbose=verbose
+    )
+    
+    if parsed.get("parse_error"):
+        if verbose:
+            print(f"   ⚠️  Parse error ({len(batch)} issue batch)")
+        return [
+            {"issue_id": issue_id, "reviewer_id": reviewer.name, "parse_error": True, "evaluation": None}
+            for issue_id in issue_ids
+        ]
+    
+    reviews = []
+    for (index, issue), issue_id, evaluation in zip(batch, issue_ids, split_batch_evaluations(parsed, issue_ids)):
+        if evaluation is None:
+            if verbose:
+                print(f"   ⚠️  No evaluation for {issue_id} in batch answer")
+            reviews.append({
+                "issue_id": issue_id,
+                "reviewer_id": reviewer.name,
+                "error": "Missing from batch answer",
+                "evaluation": None
+            })
+        else:
+            reviews.append(build_review_record(reviewer, issue, index, evaluation, verbose))
+    return reviews
+
+
+def review_batch_checkpointed(
+    journal: Optional[CheckpointJournal],
+    reviewer: ModelConfig,
+    batch: List[Tuple[int, Dict]],
+    page_index: PageIndex,
+    llm_client: LLMClient,
+    verbose: bool = True,
+    rate_limiter: Optional[EndpointRateLimiter] = None
+) -> List[Dict]:
+    """
+    review_issue_batch with per-issue checkpointing.
+    
+    Journal units stay (reviewer, issue): issues already journaled are
+    restored, only the others are sent (as one smaller batch), and each
+    successful review is recorded on its own.
+    
+    Returns:
+        Review record dicts, in batch order
+    """
+    reviews: List[Optional[Dict]] = [None] * len(batch)
+    todo = []
+    for position, (index, issue) in enumerate(batch):
+        restored = journal.get("phase2", reviewer.name, issue.get("issue_id", f"issue-{index}")) if journal else None
+        if restored is not None:
+            reviews[position] = restored
+        else:
+            todo.append(position)
+    
+    if todo:
+        results = review_issue_batch(
+            reviewer, [batch[p] for p in todo], page_index, llm_client, verbose, rate_limiter
+        )
+        for position, review in zip(todo, results):
+            reviews[position] = review
+            if journal and review_succeeded(review):
+                index, issue = batch[position]
+                journal.record("phase2", reviewer.name, issue.get("issue_id", f"issue-{index}"), review)
+    return reviews
+
+
+def review_succeeded(review: Dict) -> bool:
+    """Whether a review produced an evaluation (only those are checkpointed)."""
+    return review.get("evaluation") is not None
+
+
+# =============================================================================
+# SEQUENTIAL REVIEW (EARLY STOPPING)
+# =============================================================================
+
+def get_sequential_review(config: CouncilConfig, sequential: Optional[bool] = None) -> bool:
+    """Resolve sequential review mode: explicit value, then config ``sequential_review``, off by default."""
+    if sequential is not None:
+        return sequential
+    return bool(getattr(config, "sequential_review", False))
+
+
+def get_sequential_review_margin(config: CouncilConfig) -> Optional[float]:
+    """Config ``sequential_review_margin`` (None = stop only when the outcome is guaranteed)."""
+    margin = getattr(config, "sequential_review_margin", None)
+    if isinstance(margin, (int, float)) and margin >= 0:
+        return float(margin)
+    return None
+
+
+def review_order(reviewers: List[ModelConfig], offset: int) -> List[ModelConfig]:
+    """
+    Order in which a batch goes through the reviewers in sequential mode.
+    
+    Rotated by ``offset`` (the batch number) so that each round spreads
+    its calls over all reviewer models.
+    """
+    shift = offset % len(reviewers) if reviewers else 0
+    return reviewers[shift:] + reviewers[:shift]
+
+
+def review_outcome_settled(
+    issue: Dict,
+    reviews: List[Dict],
+    remaining: int,
+    margin: Optional[float] = None,
+    min_validity_confirm: float = MIN_VALIDITY_CONFIRM,
+    min_validity_verify: float = MIN_VALIDITY_VERIFY
+) -> Optional[str]:
+    """
+    Whether the remaining reviewers can still change the Phase 3 filter
+    outcome of an issue (see filter_issues_by_validity).
+    
+    With k valid scores summing to S and r reviewers left each scoring in
+    [lo, hi], the final average validity lies in
+    [(S + r·lo) / (k + r), (S + r·hi) / (k + r)] (failed reviews, which
+    add no score, included), and any of them may still report a HIGH
+    cross-section risk. By default [lo, hi] = [0, 1], so the outcome is
+    guaranteed; with ``margin`` the remaining reviewers are assumed to
+    score within ``margin`` of the current average.
+    
+    Returns:
+        The outcome ("confirmed", "needs_verification" or "dismissed")
+        once no remaining review can change it, else None
+    """
+    evaluations = [
+        r["evaluation"] for r in reviews
+        if isinstance(r.get("evaluation"), dict) and "validity_score" in r["evaluation"]
+    ]
+    scores = [e["validity_score"] for e in evaluations]
+    if not scores or not all(isinstance(score, (int, float)) for score in scores):
+        return None
+    
+    mean = sum(scores) / len(scores)
+    lo, hi = (0.0, 1.0) if margin is None else (max(0.0, mean - margin), min(1.0, mean + margin))
+    total = len(scores) + remaining
+    lowest = (sum(scores) + remaining * lo) / total
+    highest = (sum(scores) + remaining * hi) / total
+    is_high_fp_risk = issue.get("type", "") in HIGH_FP_RISK_TYPES
+    risks = {"HIGH" if any(e.get("cross_section_risk") == "HIGH" for e in evaluations) else "UNKNOWN"}
+    if remaining:
+        risks.add("HIGH")
+    
+    outcomes = {
+        validity_outcome(validity, risk, is_high_fp_risk, min_validity_confirm, min_validity_verify)
+        for validity in (lowest, highest) for risk in risks
+    }
+    return outcomes.pop() if len(outcomes) == 1 else None
+
+
+def build_skipped_review(reviewer: ModelConfig, issue: Dict, index: int, reason: str) -> Dict:
+    """Review record of a reviewer that did not review the issue (settled outcome, ungrounded evidence)."""
+    return {
+        "issue_id": issue.get("issue_id", f"issue-{index}"),
+        "reviewer_id": reviewer.name,
+        "skipped": True,
+        "skip_reason": reason,
+        "evaluation": None
+    }
+
+
+def settle_batch(
+    batch: List[int],
+    issues: List[Dict],
+    reviews_by_reviewer: Dict[str, List[Optional[Dict]]],
+    done: List[ModelConfig],
+    remaining: List[ModelConfig],
+    margin: Optional[float] = None
+) -> List[int]:
+    """
+    Record skipped reviews for the issues of a batch whose outcome is
+    settled after the ``done`` reviewers (see review_outcome_settled).
+    
+    Returns:
+        The issues of the batch still to be reviewed by ``remaining``
+    """
+    still_open = []
+    for i in batch:
+        reviews = [reviews_by_reviewer[r.name][i] for r in done]
+        outcome = review_outcome_settled(issues[i], reviews, len(remaining), margin) if remaining else None
+        if outcome is None:
+            still_open.append(i)
+            continue
+        for reviewer in remaining:
+            reviews_by_reviewer[reviewer.name][i] = build_skipped_review(
+                reviewer, issues[i], i, f"Outcome '{outcome}' settled after {len(done)} review(s)"
+            )
+    return still_open if remaining else []
+
+
+def build_reviewer_result(
+    reviewer: ModelConfig,
+    issues: List[Dict],
+    reviews: List[Dict],
+    verbose: bool = True
+) -> Dict:
+    """Assemble a reviewer's reviews (in issue order) into the reviewer result dict."""
+    if verbose:
+        # Summary stats
+        valid_reviews = [r for r in reviews if r.get("evaluation")]
+        high_validity = len([r for r in valid_reviews 
+                           if r.get("evaluation", {}).get("validity_score", 0) >= 0.7])
+        low_validity = len([r for r in valid_reviews 
+                          if r.get("evaluation", {}).get("validity_score", 0) < 0.5])
+        
+        print(f"   ✅ {reviewer.name} complete: {len(reviews)} review(s)")
+        print(f"      High validity (≥0.7): {high_validity}, Low validity (<0.5): {low_validity}")
+    
+    result = {
+        "reviewer": reviewer.name,
+        "model_id": reviewer.model_id,
+        "timestamp": get_timestamp(),
+        "issues_reviewed": len(issues),
+        "reviews": reviews,
+        "stats": {
+            "total": len(reviews),
+            "high_fp_risk_types": len([r for r in reviews if r.get("high_fp_risk")]),
+            "high_priority_types": len([r for r in reviews if r.get("high_priority")])
+        }
+    }
+    skipped = len([r for r in reviews if r.get("skipped")])
+    if skipped:
+        result["stats"]["skipped"] = skipped
+    return result
+
+
+def count_reviews(reviews: Iterable[Dict], counts: Dict[str, int]) -> Iterator[Dict]:
+    """Yield ``reviews`` while adding them to ``counts`` (summed by save_phase2_results)."""
+    for review in reviews:
+        evaluation = review.get("evaluation")
+        counts["total"] = counts.get("total", 0) + 1
+        tallies = {
+            "high_fp_risk": review.get("high_fp_risk"),
+            "high_priority": review.get("high_priority"),
+            "shared": review.get("shared_from_issue_id"),
+            "skipped": review.get("skipped")
+        }
+        if evaluation:
+            validity = evaluation.get("validity_score", 0)
+            tallies.update({
+                "valid": True,
+                "high_validity": validity >= 0.7,
+                "medium_validity": 0.5 <= validity < 0.7,
+                "low_validity": validity < 0.5,
+                "valid_high_fp_risk": review.get("high_fp_risk"),
+                "valid_high_priority": review.get("high_priority"),
+                "cross_section_high_risk": evaluation.get("cross_section_risk") == "HIGH",
+                "adjusted": evaluation.get("validity_adjustment_reason")
+            })
+        for name, value in tallies.items():
+            counts[name] = counts.get(name, 0) + (1 if value else 0)
+        yield review
+
+
+def run_reviewer(
+    reviewer: ModelConfig,
+    issues: List[Dict],
+    page_index: PageIndex,
+    llm_client: LLMClient,
+    verbose: bool = True,
+    max_workers: Optional[int] = None
+) -> Dict:
+    """
+    Run a single reviewer on all issues (on the run_units pool).
+    
+    Args:
+        reviewer: Reviewer model configuration
+        issues: List of issues to review
+        page_index: Document page index (for context extraction)
+        llm_client: LLM client instance
+        verbose: Print progress
+        max_workers: Worker pool size (None = default)
+    
+    Returns:
+        Review results dict
+    """
+    if verbose:
+        print(f"\n🔍 {reviewer.name} reviewing {len(issues)} issue(s)...")
+    
+    rate_limiter = EndpointRateLimiter()
+    reviews = run_units(
+        [(reviewer, i) for i in range(len(issues))],
+        lambda model, i: review_issue(model, issues[i], i, page_index, llm_client, verbose, rate_limiter),
+        max_workers=get_max_workers(None, max_workers)
+    )
+    return build_reviewer_result(reviewer, issues, reviews, verbose)
+
+
+def run_phase2(
+    phase1_dir: str,
+    document_path: str,
+    config: CouncilConfig,
+    output_dir: str,
+    reviewer_names: Optional[List[str]] = None,
+    mock_mode: bool = False,
+    verbose: bool = True,
+    max_workers: Optional[int] = None,
+    llm_client: Optional[LLMClient] = None,
+    journal: Optional[CheckpointJournal] = None,
+    batch_size: Optional[int] = None,
+    cluster_duplicates: Optional[bool] = None,
+    sequential_review: Optional[bool] = None
+) -> List[str]:
+    """
+    Run Phase 2 peer review for all (or selected) reviewers.
+    
+    All (reviewer, issue batch) pairs are dispatched to a bounded worker
+    pool, behind a per-endpoint token bucket with 429/5xx retries. Reviews
+    are regrouped in reviewer then issue order, exactly as a serial run.
+    
+    With a batch size above 1, up to that many issues from the same source
+    chunk are sent to a reviewer in a single call (see batch_issues).
+    
+    Issues are read from the Phase 1 files a few source chunks at a time
+    (see review_windows) and their reviews are spilled to disk, so memory
+    holds one window of issues, not the whole run.
+    
+    With cluster_duplicates, near-duplicate issues are grouped first (see
+    utils/issue_clustering.py): only each cluster's representative is
+    reviewed and its reviews are copied onto the other members, so the
+    output files keep one review per (reviewer, issue).
+    
+    With sequential_review, reviewers run one round at a time and an issue
+    is sent to the next reviewer only while the remaining reviews could
+    still move its average validity across MIN_VALIDITY_CONFIRM or
+    MIN_VALIDITY_VERIFY (see review_outcome_settled). The reviews that are
+    not needed are recorded with ``skipped: True`` and no evaluation.
+    Config ``sequential_review_margin`` relaxes the check (see
+    review_outcome_settled).
+    
+    Issues none of whose evidence quotes is found on their cited pages
+    (see utils/evidence_grounding.py) are not reviewed either: they get a
+    skipped review from every reviewer and are dismissed in Phase 3.
+    
+    Args:
+        phase1_dir: Directory containing Phase 1 outputs
+        document_path: Path to original document JSON
+        config: Council configuration
+        output_dir: Output directory for results
+        reviewer_names: Optional list of specific reviewers to run
+        mock_mode: Use mock LLM
+        verbose: Print progress
+        max_workers: Worker pool size (None = config / default)
+        llm_client: Shared LLM client (None = create one for this phase)
+        journal: Checkpoint journal; reviews already recorded are not re-run
+        batch_size: Issues per reviewer call (None = config / default of 1)
+        cluster_duplicates: Review one issue per near-duplicate cluster
+            (None = config ``cluster_duplicate_issues``, off by default)
+        sequential_review: Stop reviewing an issue once its outcome is
+            settled (None = config ``sequential_review``, off by default)
+    
+    Returns:
+        List of output file paths
+    """
+    if verbose:
+        print("\n" + "="*70)
+        print("PHASE 2: PEER REVIEW (v2.0 - Enhanced FP Detection)")
+        print("="*70)
+    
+    # Find Phase 1 files
+    phase1_files = find_phase1_files(phase1_dir)
+    if not phase1_files:
+        print(f"❌ No Phase 1 files found in {phase1_dir}")
+        return []
+    
+    if verbose:
+        print(f"\n📂 Found ==> {len(phase1_files)} Phase-1 file(s)")
+    
+    # Scan the Phase 1 files (issues are read again window by window)
+    with span("collect_issues", phase="phase2", files=len(phase1_files)):
+        layout = Phase1Files(phase1_files)
+    if verbose:
+        print(f"📋 Collected {len(layout)} issue(s) to review")
+        
+        # Show breakdown by type
+        print(f"   Breakdown by type:")
+        for t, count in sorted(layout.type_counts.items(), key=lambda x: -x[1]):
+            risk_marker = "⚠️ HIGH_FP_RISK" if t in HIGH_FP_RISK_TYPES else ""
+            priority_marker = "🔴 HIGH_PRIORITY" if t in HIGH_PRIORITY_TYPES else ""
+            markers = f" {priority_marker}{risk_marker}".strip()
+            print(f"      - {t}: {count}{markers}")
+    
+    if not len(layout):
+        print("⚠️  No issues to review")
+        return []
+    
+    # Load and index document for context
+    if verbose:
+        print(f"📄 Loading document: {document_path}")
+    with span("page_index", phase="phase2"):
+        page_index = load_page_index(document_path)
+    
+    # Filter reviewers if specified
+    reviewers = config.reviewers
+    if reviewer_names:
+        reviewers = [r for r in reviewers if r.name in reviewer_names]
+    
+    if verbose:
+        print(f"👥 Running {len(reviewers)} reviewer(s): {[r.name for r in reviewers]}")
+    
+    # Initialize LLM client (unless the caller shares one across phases)
+    if llm_client is None:
+        llm_client = create_llm_client(mock_mode)
+    
+    # Create output directory
+    os.makedirs(output_dir, exist_ok=True)
+    
+    grounding = get_evidence_grounding(config)
+    if cluster_duplicates is None:
+        cluster_duplicates = bool(getattr(config, "cluster_duplicate_issues", False))
+    threshold = getattr(config, "cluster_similarity_threshold", None) or DEFAULT_SIMILARITY_THRESHOLD
+    workers = get_max_workers(config, max_workers)
+    batch_size = get_review_batch_size(config, batch_size)
+    sequential_review = get_sequential_review(config, sequential_review)
+    margin = get_sequential_review_margin(config)
+    
+    # Issues are reviewed a few chunks at a time (enough calls to keep the
+    # pool busy); clustering compares all issues, so it needs them at once,
+    # as do Phase 1 files not written in chunk order
+    if cluster_duplicates:
+        windows = [list(layout.iter_issues())]
+    elif layout.chunk_ordered:
+        windows = review_windows(layout, REVIEW_WINDOW_CALLS_PER_WORKER * workers * batch_size)
+    else:
+        if verbose:
+            print(f"⚠️  {len(layout.unordered)} Phase 1 file(s) not in chunk order: all issues are reviewed in one window (in memory)")
+        windows = [list(layout.iter_issues())]
+    
+    if verbose:
+        print(f"⚙️  Dispatching reviewer × issue units on {workers} worker(s)")
+        if batch_size > 1:
+            print(f"   Batched: up to {batch_size} issue(s) from the same chunk per reviewer call")
+    
+    if journal and verbose and journal.count("phase2"):
+        print(f"♻️  Resuming: {journal.count('phase2')} reviewer × issue unit(s) in checkpoint journal")
+    
+    rate_limiter = EndpointRateLimiter()
+    
+    # Reviews are written to disk window by window, per (reviewer, Phase 1
+    # file), and read back in issue order when the output files are saved
+    spill = JSONLSpill()
+    issue_clusters = [] if cluster_duplicates else None
+    totals = {"ungrounded": 0, "units": 0, "calls": 0, "skipped": 0}
+    batch_offset = 0
+    
+    try:
+        for window in windows:
+            positions = [i for i, _ in window]
+            issues = [issue for _, issue in window]
+            
+            # Evidence not found on the cited pages: not worth a review
+            if grounding:
+                with span("evidence_grounding", phase="phase2", issues=len(issues)):
+                    ground_issues(issues, page_index, config)
+            ungrounded = [j for j, issue in enumerate(issues) if grounding and is_ungrounded(issue)]
+            reviewable = sorted(set(range(len(issues))) - set(ungrounded))
+            
+            # Near-duplicate clusters: only representatives are reviewed
+            if cluster_duplicates:
+                with span("issue_clustering", phase="phase2", issues=len(reviewable)):
+                    clusters = [
+                        [reviewable[j] for j in cluster]
+                        for cluster in cluster_issues([issues[j] for j in reviewable], threshold)
+                    ]
+                if verbose:
+                    print(f"🧬 Clustered {len(reviewable)} issue(s) into {len(clusters)} cluster(s) "
+                          f"(Jaccard ≥ {threshold}): {len(reviewable) - len(clusters)} duplicate review(s) skipped")
+            else:
+                clusters = [[j] for j in reviewable]
+            representatives = [cluster[0] for cluster in clusters]
+            
+            # Fan out every (reviewer, issue batch) pair; issue-major order interleaves models
+            batches = [
+                [representatives[j] for j in batch]
+                for batch in batch_issues([issues[j] for j in representatives], batch_size)
+            ]
+            
+            def review_unit(reviewer: ModelConfig, batch: List[int]) -> List[Dict]:
+                return review_batch_checkpointed(
+                    journal, reviewer, [(positions[j], issues[j]) for j in batch],
+                    page_index, llm_client, verbose, rate_limiter
+                )
+            
+            totals["ungrounded"] += len(ungrounded)
+            totals["units"] += len(reviewers) * len(representatives)
+            totals["calls"] += len(reviewers) * len(batches)
+            
+            reviews_by_reviewer = {reviewer.name: [None] * len(issues) for reviewer in reviewers}
+            for j in ungrounded:
+                for reviewer in reviewers:
+                    reviews_by_reviewer[reviewer.name][j] = build_skipped_review(
+                        reviewer, issues[j], positions[j], ungrounded_reason(issues[j])
+                    )
+            if sequential_review:
+                # One review round per reviewer; an issue moves on only while its outcome can change
+                orders = [review_order(reviewers, batch_offset + b) for b in range(len(batches))]
+                open_batches = list(enumerate(batches))
+                for round_number in range(len(reviewers)):
+                    units = [(orders[b][round_number], batch) for b, batch in open_batches]
+                    unit_reviews = run_units(units, review_unit, max_workers=workers)
+                    for (reviewer, batch), reviews in zip(units, unit_reviews):
+                        for j, review in zip(batch, reviews):
+                            reviews_by_reviewer[reviewer.name][j] = review
+                    next_batches = []
+                    for b, batch in open_batches:
+                        still_open = settle_batch(
+                            batch, issues, reviews_by_reviewer,
+                            orders[b][:round_number + 1], orders[b][round_number + 1:], margin
+                        )
+                        if still_open:
+                            next_batches.append((b, still_open))
+                    open_batches = next_batches
+                totals["skipped"] += sum(1 for reviews in reviews_by_reviewer.values() for j in representatives
+                                         if reviews[j].get("skipped"))
+            else:
+                units = [(reviewer, batch) for batch in batches for reviewer in reviewers]
+                unit_reviews = run_units(units, review_unit, max_workers=workers)
+                for (reviewer, batch), reviews in zip(units, unit_reviews):
+                    for j, review in zip(batch, reviews):
+                        reviews_by_reviewer[reviewer.name][j] = review
+            batch_offset += len(batches)
+            
+            # Copy each representative's reviews onto the rest of its cluster
+            for cluster in clusters:
+                rep = cluster[0]
+                rep_id = issues[rep].get("issue_id", f"issue-{positions[rep]}")
+                for j in cluster[1:]:
+                    for reviewer in reviewers:
+                        reviews_by_reviewer[reviewer.name][j] = fan_out_review(
+                            reviews_by_reviewer[reviewer.name][rep], issues[j], positions[j], rep_id
+                        )
+            
+            if cluster_duplicates:
+                issue_clusters.extend(
+                    [issues[j].get("issue_id", f"issue-{positions[j]}") for j in cluster]
+                    for cluster in clusters if len(cluster) > 1
+                )
+            
+            # Issue order within each Phase 1 file
+            for j in sorted(range(len(issues)), key=lambda j: positions[j]):
+                k = layout.file_of(positions[j])
+                for reviewer in reviewers:
+                    spill.extend((reviewer.name, k), [reviews_by_reviewer[reviewer.name][j]])
+        
+        if verbose:
+            if totals["ungrounded"]:
+                print(f"🔎 {totals['ungrounded']} issue(s) without grounded evidence were not reviewed")
+            print(f"⚙️  Dispatched {totals['units']} reviewer × issue unit(s)"
+                  + (f" in {totals['calls']} batched call(s)" if batch_size > 1 else ""))
+            if sequential_review:
+                print(f"⏭️  Sequential review: {totals['skipped']} of {totals['units']} "
+                      f"review(s) skipped (outcome already settled)")
+        
+        return save_phase2_results(
+            reviewers, len(layout),
+            {
+                reviewer.name: spill.view(*[(reviewer.name, k) for k in range(len(phase1_files))])
+                for reviewer in reviewers
+            },
+            phase1_files, output_dir, verbose,
+            issue_clusters=issue_clusters
+        )
+    finally:
+        spill.close()
+
+
+def save_phase2_results(
+    reviewers: List[ModelConfig],
+    num_issues: int,
+    reviews_by_reviewer: Dict[str, Iterable[Dict]],
+    phase1_files: List[str],
+    output_dir: str,
+    verbose: bool = True,
+    issue_clusters: Optional[List[List[str]]] = None
+) -> List[str]:
+    """
+    Write one phase2_<reviewer>.json file per reviewer plus phase2_all_reviews.json.
+    
+    Reviews are written as they are iterated (never gathered in one
+    list), so each reviewer's reviews are iterated twice: once for its
+    own file, once for the combined file.
+    
+    Args:
+        reviewers: Reviewers, in output order
+        num_issues: Number of reviewed issues
+        reviews_by_reviewer: Reviews (in issue order), by reviewer name;
+            each must be re-iterable (a list, a JSONLSpill view)
+        phase1_files: Phase 1 files the issues came from
+        output_dir: Output directory
+        verbose: Print progress
+        issue_clusters: Near-duplicate clusters (issue IDs, representative
+            first) when reviews were shared within clusters
+    
+    Returns:
+        List of output file paths
+    """
+    output_files = []
+    counts: Dict[str, int] = {}
+    
+    for reviewer in reviewers:
+        reviewer_counts: Dict[str, int] = {}
+        
+        def reviewer_stats() -> Dict:
+            stats = {
+                "total": reviewer_counts.get("total", 0),
+                "high_fp_risk_types": reviewer_counts.get("high_fp_risk", 0),
+                "high_priority_types": reviewer_counts.get("high_priority", 0)
+            }
+            if reviewer_counts.get("skipped"):
+                stats["skipped"] = reviewer_counts["skipped"]
+            return {"stats": stats}
+        
+        # Save individual reviewer result (stats follow the reviews they count)
+        output_path = os.path.join(output_dir, f"phase2_{reviewer.name}.json")
+        write_json_array(
+            output_path,
+            {
+                "reviewer": reviewer.name,
+                "model_id": reviewer.model_id,
+                "timestamp": get_timestamp(),
+                "issues_reviewed": num_issues
+            },
+            "reviews",
+            count_reviews(reviews_by_reviewer[reviewer.name], reviewer_counts),
+            reviewer_stats
+        )
+        output_files.append(output_path)
+        
+        for name, value in reviewer_counts.items():
+            counts[name] = counts.get(name, 0) + value
+        
+        if verbose:
+            print(f"   ✅ {reviewer.name} complete: {reviewer_counts.get('total', 0)} review(s)")
+            print(f"      High validity (≥0.7): {reviewer_counts.get('high_validity', 0)}, "
+                  f"Low validity (<0.5): {reviewer_counts.get('low_validity', 0)}")
+            print(f"   💾 Saved: {output_path}")
+    
+    # Compute aggregate stats
+    aggregate_stats = {
+        "total_reviews": counts.get("total", 0),
+        "valid_reviews": counts.get("valid", 0),
+        "high_validity_count": counts.get("high_validity", 0),
+        "medium_validity_count": counts.get("medium_validity", 0),
+        "low_validity_count": counts.get("low_validity", 0),
+        "high_fp_risk_issues": counts.get("valid_high_fp_risk", 0),
+        "high_priority_issues": counts.get("valid_high_priority", 0),
+        "cross_section_high_risk": counts.get("cross_section_high_risk", 0),
+        "adjusted_scores_count": counts.get("adjusted", 0)
+    }
+    if issue_clusters is not None:
+        aggregate_stats["shared_reviews"] = counts.get("shared", 0)
+    if counts.get("skipped"):
+        aggregate_stats["skipped_reviews"] = counts["skipped"]
+    
+    # Save combined reviews file
+    combined_path = os.path.join(output_dir, "phase2_all_reviews.json")
+    write_json_array(
+        combined_path,
+        {
+            "timestamp": get_timestamp(),
+            "version": "2.0",
+            "phase1_sources": phase1_files,
+            "total_issues": num_issues,
+            "total_reviewers": len(reviewers),
+            "aggregate_stats": aggregate_stats
+        },
+        "reviews",
+        (review for reviewer in reviewers for review in reviews_by_reviewer[reviewer.name]),
+        {"issue_clusters": issue_clusters} if issue_clusters is not None else None
+    )
+    output_files.append(combined_path)
+    
+    if verbose:
+        print(f"\n" + "="*50)
+        print(f"📊 PHASE 2 AGGREGATE STATS:")
+        print(f"   Total reviews: {aggregate_stats['total_reviews']}")
+        print(f"   High validity (≥0.7): {aggregate_stats['high_validity_count']}")
+        print(f"   Medium validity (0.5-0.7): {aggregate_stats['medium_validity_count']}")
+        print(f"   Low validity (<0.5): {aggregate_stats['low_validity_count']}")
+        print(f"   High FP risk issues: {aggregate_stats['high_fp_risk_issues']}")
+        print(f"   Cross-section HIGH risk: {aggregate_stats['cross_section_high_risk']}")
+        print(f"   Scores adjusted: {aggregate_stats['adjusted_scores_count']}")
+        if "shared_reviews" in aggregate_stats:
+            print(f"   Shared from duplicates: {aggregate_stats['shared_reviews']}")
+        if "skipped_reviews" in aggregate_stats:
+            print(f"   Skipped (not reviewed): {aggregate_stats['skipped_reviews']}")
+        print(f"="*50)
+        print(f"\n✅ Phase 2 complete: {len(output_files)} review file(s) generated")
+    
+    return output_files
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="CSRD Council - Phase 2: Peer Review (v2.0)",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    
+    parser.add_argument("--phase1-dir", required=True,
+                       help="Directory containing Phase 1 output files")
+    parser.add_argument("--document", "-d", required=True,
+                       help="Path to original document JSON file")
+    parser.add_argument("--config", "-c", required=True,
+                       help="Path to council config JSON/YAML file")
+    parser.add_argument("--output-dir", "-o", default="./outputs",
+                       help="Output directory (default: ./outputs)")
+    parser.add_argument("--reviewer", "-r", action="append",
+                       help="Specific reviewer to run (can be repeated)")
+    parser.add_argument("--mock", action="store_true",
+                       help="Use mock LLM for testing")
+    parser.add_argument("--max-workers", type=int,
+                       help="Concurrent reviewer × issue requests (default: config or 8)")
+    parser.add_argument("--review-batch-size", type=int,
+                       help="Issues from the same chunk reviewed per call (default: config or 1)")
+    parser.add_argument("--cluster-duplicates", action="store_true", default=None,
+                       help="Review one issue per near-duplicate cluster and share its reviews")
+    parser.add_argument("--sequential-review", action="store_true", default=None,
+                       help="Skip the remaining reviewers once an issue's outcome is settled")
+    parser.add_argument("--quiet", "-q", action="store_true",
+                       help="Suppress progress output")
+    
+    args = parser.parse_args()
+    
+    # Load config
+    if args.config.endswith('.yaml') or args.config.endswith('.yml'):
+        config = CouncilConfig.from_yaml(args.config)
+    else:
+        config = CouncilConfig.from_json(args.config)
+    
+    # Run phase 2
+    output_files = run_phase2(
+        phase1_dir=args.phase1_dir,
+        document_path=args.document,
+        config=config,
+        output_dir=args.output_dir,
+        reviewer_names=args.reviewer,
+        mock_mode=args.mock,
+        verbose=not args.quiet,
+        max_workers=args.max_workers,
+        batch_size=args.review_batch_size,
+        cluster_duplicates=args.cluster_duplicates,
+        sequential_review=args.sequential_review
+    )
+    
+    print(f"\nOutput files: {output_files}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
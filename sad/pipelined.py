@@ -0,0 +1,371 @@
+"""
+Pipelined Execution
+===================
+
+Streaming alternative to running the three phases back to back.
+
+In the barrier mode, Phase 2 waits for every analyst to finish every
+chunk and Phase 3 waits for every review. Here all LLM work shares one
+bounded worker pool and is scheduled as soon as its inputs exist:
+
+- every (analyst, chunk) unit is queued up front, but a free worker
+  always takes judge work first, then review work, then analysis, so a
+  chunk's reviews and judgment never wait behind the remaining analyses;
+- the issues an analyst returns are immediately queued for every reviewer
+  (one by one, or in batches of up to review_batch_size issues); with
+  sequential_review a batch goes to one reviewer after the other and
+  stops once its outcome is settled (see phase2_review.settle_batch);
+  issues whose evidence is not on their cited pages are not queued (see
+  utils/evidence_grounding.py);
+- once all analyst and reviewer work of a chunk is done, that chunk is
+  enriched, filtered and sent to the judge.
+
+Overlap issue ownership (phase1_analysis.assign_overlap_issues) is not
+applied: it needs the neighbouring chunks' analyses before an issue can
+be reviewed, so issues on overlap pages may be reviewed and judged in
+both chunks. A warning is printed when the chunks overlap.
+
+Total latency therefore tends towards the longest analyst → review →
+judge path instead of the sum of the three phases.
+
+The same phase1_*.json / phase2_*.json / phase3 files are written at the
+end, and the same checkpoint journal units are used, so a pipelined run
+can be resumed (or continued) in either mode.
+"""
+
+import heapq
+import itertools
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from csrd_council_2.config.models import CouncilConfig, ModelConfig
+from csrd_council_2.models.llm_client import LLMClient
+from csrd_council_2.utils.concurrency import ModelLimiter, EndpointRateLimiter, get_max_workers
+from csrd_council_2.utils.llm_cache import create_llm_client
+from csrd_council_2.utils.checkpoint import CheckpointJournal, run_checkpointed
+from csrd_council_2.utils.page_index import load_page_index
+from csrd_council_2.utils.chunking import plan_chunks, chunks_from_plan, save_chunk_plan
+from csrd_council_2.utils.telemetry import span
+from csrd_council_2.utils.evidence_grounding import (
+    get_evidence_grounding, ground_issues, is_ungrounded, ungrounded_reason
+)
+from csrd_council_2.phases.phase1_analysis import (
+    analyze_chunk, chunk_unit_key, chunk_output_succeeded, save_phase1_results
+)
+from csrd_council_2.phases.phase2_review import (
+    review_batch_checkpointed, batch_issues, get_review_batch_size, save_phase2_results,
+    get_sequential_review, get_sequential_review_margin, review_order, settle_batch, build_skipped_review
+)
+from csrd_council_2.phases.phase3_judgment import (
+    run_phase3, run_judge_on_chunk, judgment_succeeded, judge_unit_key,
+    enrich_issues_with_reviews, filter_issues_by_validity
+)
+
+
+# Task priorities (lowest first): work closer to the end of the pipeline
+# runs first, so finished chunks move on instead of queueing behind analysis
+PRIORITY_JUDGE = 0
+PRIORITY_REVIEW = 1
+PRIORITY_ANALYSIS = 2
+
+
+class _Scheduler:
+    """
+    Worker threads running queued tasks by priority (then submission
+    order), including tasks submitted by tasks.
+    """
+
+    def __init__(self, max_workers: int):
+        self.limiter = ModelLimiter()
+        self._cond = threading.Condition()
+        self._queue: List[tuple] = []
+        self._sequence = itertools.count()
+        self._outstanding = 0
+        self._closed = False
+        self._errors: List[Exception] = []
+        self._threads = [threading.Thread(target=self._work, daemon=True) for _ in range(max(1, max_workers))]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, model: ModelConfig, task: Callable[[], Any], priority: int = PRIORITY_ANALYSIS) -> None:
+        """Queue ``task``, to run behind ``model``'s concurrency slot."""
+        with self._cond:
+            self._outstanding += 1
+            heapq.heappush(self._queue, (priority, next(self._sequence), model, task))
+            self._cond.notify()
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                _, _, model, task = heapq.heappop(self._queue)
+            try:
+                with self.limiter.slot(model):
+                    task()
+            except Exception as e:
+                with self._cond:
+                    self._errors.append(e)
+            finally:
+                with self._cond:
+                    self._outstanding -= 1
+                    self._cond.notify_all()
+
+    def wait(self) -> None:
+        """Block until every task (and every task it spawned) is done."""
+        with self._cond:
+            while self._outstanding:
+                self._cond.wait()
+            self._closed = True
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join()
+        if self._errors:
+            raise self._errors[0]
+
+
+def run_pipelined(
+    document_path: str,
+    config: CouncilConfig,
+    output_dir: str,
+    mock_mode: bool = False,
+    verbose: bool = True,
+    max_workers: Optional[int] = None,
+    llm_client: Optional[LLMClient] = None,
+    journal: Optional[CheckpointJournal] = None,
+    shared_pages: bool = False,
+    review_batch_size: Optional[int] = None,
+    sequential_review: Optional[bool] = None
+) -> Dict[str, Any]:
+    """
+    Run analysis, review and judgment as one streaming pipeline.
+
+    Args:
+        document_path: Path to document JSON
+        config: Council configuration
+        output_dir: Output directory for all phase files
+        mock_mode: Use mock LLM
+        verbose: Print progress
+        max_workers: Worker pool size shared by all phases (None = config / default)
+        llm_client: Shared LLM client (None = create one)
+        journal: Checkpoint journal; units already recorded are not re-run
+        shared_pages: Render each source page once in the HTML report
+        review_batch_size: Issues of an analyst's chunk reviewed per call
+            (None = config / default of 1)
+        sequential_review: Stop reviewing an issue once its outcome is
+            settled (None = config ``sequential_review``, off by default)
+
+    Returns:
+        Dict with the "phase1", "phase2" and "phase3" output paths
+    """
+    outputs = {"phase1": [], "phase2": [], "phase3": {}}
+
+    if verbose:
+        print("\n" + "="*70)
+        print("PIPELINED ANALYSIS → REVIEW → JUDGMENT")
+        print("="*70)
+
+    with span("page_index", phase="pipelined"):
+        page_index = load_page_index(document_path)
+    pages = page_index.pages
+
+    # One chunk plan for analysis and judgment (saved for Phase 3 reruns)
+    os.makedirs(output_dir, exist_ok=True)
+    with span("chunk_planning", phase="pipelined", pages=len(pages)):
+        plan = plan_chunks(pages, config)
+        save_chunk_plan(plan, output_dir)
+    chunks = chunks_from_plan(pages, plan)
+    chunks_by_id = {chunk["chunk_id"]: chunk for chunk in chunks}
+
+    analysts = config.analysts
+    reviewers = config.reviewers
+    judge = config.judge
+
+    if llm_client is None:
+        llm_client = create_llm_client(mock_mode)
+
+    phase1_paths = {a.name: os.path.join(output_dir, f"phase1_{a.name}.json") for a in analysts}
+    phase2_paths = {r.name: os.path.join(output_dir, f"phase2_{r.name}.json") for r in reviewers}
+
+    workers = get_max_workers(config, max_workers)
+    batch_size = get_review_batch_size(config, review_batch_size)
+    sequential_review = get_sequential_review(config, sequential_review)
+    margin = get_sequential_review_margin(config)
+    grounding = get_evidence_grounding(config)
+    if verbose:
+        print(f"📦 {len(chunks)} chunk(s), {len(analysts)} analyst(s), {len(reviewers)} reviewer(s)")
+        print(f"⚙️  Streaming all units on {workers} worker(s)")
+    if getattr(config, "overlap_issue_ownership", True) and any(
+        previous["page_end"] >= chunk["page_start"] for previous, chunk in zip(chunks, chunks[1:])
+    ):
+        print("⚠️  Overlap issue ownership is not applied in pipelined mode: "
+              "issues on overlap pages may be reviewed and judged twice")
+
+    scheduler = _Scheduler(workers)
+    rate_limiter = EndpointRateLimiter()
+    lock = threading.Lock()
+
+    # (analyst, chunk_id) -> analyze_chunk output; issues tagged like Phase 2/3 loaders do
+    chunk_outputs: Dict[tuple, Dict] = {}
+    tagged_issues: Dict[tuple, List[Dict]] = {}
+    # (reviewer, analyst, chunk_id) -> reviews, in issue order
+    reviews: Dict[tuple, List[Optional[Dict]]] = {}
+    # Analyst + review batch units still running per chunk
+    pending = {chunk["chunk_id"]: len(analysts) for chunk in chunks}
+    judge_results: Dict[str, Dict] = {}
+
+    def finish_unit(chunk_id: int) -> None:
+        with lock:
+            pending[chunk_id] -= 1
+            ready = pending[chunk_id] == 0
+        if ready and judge:
+            scheduler.submit(judge, lambda: judge_chunk(chunks_by_id[chunk_id]), PRIORITY_JUDGE)
+
+    def analyze(analyst: ModelConfig, chunk: Dict) -> None:
+        output = run_checkpointed(
+            journal, "phase1", analyst.name, chunk_unit_key(chunk),
+            lambda: analyze_chunk(analyst, chunk, llm_client, verbose, rate_limiter),
+            succeeded=chunk_output_succeeded
+        )
+        key = (analyst.name, chunk["chunk_id"])
+        if grounding:
+            with span("evidence_grounding", phase="pipelined", chunk=chunk["chunk_id"]):
+                ground_issues(output["issues"], page_index, config, overwrite=True)
+        issues = [
+            dict(issue, _source_analyst=analyst.name, _source_file=phase1_paths[analyst.name])
+            for issue in output["issues"]
+        ]
+        reviewable = [i for i, issue in enumerate(issues) if not (grounding and is_ungrounded(issue))]
+        batches = [
+            [reviewable[j] for j in batch]
+            for batch in batch_issues([issues[i] for i in reviewable], batch_size)
+        ]
+        with lock:
+            chunk_outputs[key] = output
+            tagged_issues[key] = issues
+            for reviewer in reviewers:
+                reviews[(reviewer.name,) + key] = [
+                    build_skipped_review(reviewer, issue, i, ungrounded_reason(issue)) if grounding and is_ungrounded(issue) else None
+                    for i, issue in enumerate(issues)
+                ]
+            pending[chunk["chunk_id"]] += len(batches) * (1 if sequential_review else len(reviewers))
+
+        for b, batch in enumerate(batches):
+            if sequential_review:
+                order = review_order(reviewers, chunk["chunk_id"] + b)
+                scheduler.submit(order[0], lambda o=order, bt=batch: review(o, 0, key, bt, issues), PRIORITY_REVIEW)
+            else:
+                for reviewer in reviewers:
+                    scheduler.submit(
+                        reviewer, lambda r=reviewer, bt=batch: review([r], 0, key, bt, issues), PRIORITY_REVIEW
+                    )
+        finish_unit(chunk["chunk_id"])
+
+    def review(order: List[ModelConfig], position: int, key: tuple, batch: List[int], issues: List[Dict]) -> None:
+        # order[position] reviews the batch; the issues still open then go to order[position + 1]
+        reviewer = order[position]
+        results = review_batch_checkpointed(
+            journal, reviewer, [(i, issues[i]) for i in batch],
+            page_index, llm_client, verbose, rate_limiter
+        )
+        with lock:
+            for i, result in zip(batch, results):
+                reviews[(reviewer.name,) + key][i] = result
+            still_open = settle_batch(
+                batch, issues, {r.name: reviews[(r.name,) + key] for r in order},
+                order[:position + 1], order[position + 1:], margin
+            )
+            if still_open:
+                pending[key[1]] += 1
+        if still_open:
+            scheduler.submit(
+                order[position + 1], lambda: review(order, position + 1, key, still_open, issues), PRIORITY_REVIEW
+            )
+        finish_unit(key[1])
+
+    def judge_chunk(chunk: Dict) -> None:
+        chunk_id = chunk["chunk_id"]
+        with lock:
+            # Analyst / reviewer config order (judge_unit_key does not depend on it)
+            issues = [dict(issue) for a in analysts for issue in tagged_issues.get((a.name, chunk_id), [])]
+            chunk_reviews = [
+                dict(r, _source_file=phase2_paths[reviewer.name])
+                for reviewer in reviewers
+                for a in analysts
+                for r in reviews.get((reviewer.name, a.name, chunk_id), [])
+            ]
+
+        with span("enrichment_filtering", phase="pipelined", chunk=chunk_id):
+            confirmed, _, _ = filter_issues_by_validity(
+                enrich_issues_with_reviews(issues, chunk_reviews), evidence_grounding=grounding
+            )
+        if not confirmed:
+            return
+
+        unit = judge_unit_key(chunk, confirmed)
+        result = run_checkpointed(
+            journal, "phase3", judge.name, unit,
+            lambda: run_judge_on_chunk(
+                judge=judge,
+                chunk_content=chunk["text"],
+                chunk_issues=confirmed,
+                source_chunk=chunk_id,
+                page_start=chunk["page_start"],
+                page_end=chunk["page_end"],
+                llm_client=llm_client,
+                verbose=verbose,
+                rate_limiter=rate_limiter
+            ),
+            succeeded=judgment_succeeded
+        )
+        with lock:
+            judge_results[unit] = result
+
+    # Chunk-major order interleaves analyst models
+    for chunk in chunks:
+        for analyst in analysts:
+            scheduler.submit(analyst, lambda a=analyst, c=chunk: analyze(a, c), PRIORITY_ANALYSIS)
+    scheduler.wait()
+
+    # Write the phase files in the barrier-mode layout
+    outputs["phase1"] = save_phase1_results(
+        analysts, chunks,
+        {a.name: [chunk_outputs[(a.name, c["chunk_id"])] for c in chunks] for a in analysts},
+        document_path, len(pages), output_dir, verbose
+    )
+
+    num_issues = sum(len(issues) for issues in tagged_issues.values())
+    if not num_issues:
+        print("⚠️  No issues to review")
+        return outputs
+
+    outputs["phase2"] = save_phase2_results(
+        reviewers, num_issues,
+        {
+            r.name: [rv for a in analysts for c in chunks for rv in reviews[(r.name, a.name, c["chunk_id"])]]
+            for r in reviewers
+        },
+        outputs["phase1"], output_dir, verbose
+    )
+
+    # Final aggregation and report; chunks judged above are not re-judged
+    outputs["phase3"] = run_phase3(
+        phase1_dir=output_dir,
+        phase2_dir=output_dir,
+        config=config,
+        output_dir=output_dir,
+        document_path=document_path,
+        num_pages=len(pages),
+        mock_mode=mock_mode,
+        verbose=verbose,
+        llm_client=llm_client,
+        journal=journal,
+        judge_results=judge_results,
+        shared_pages=shared_pages,
+        max_workers=max_workers
+    )
+
+    return outputs
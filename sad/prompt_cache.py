@@ -0,0 +1,181 @@
+"""
+Prompt Prefix Caching
+=====================
+
+Client-side support for provider prompt (prefix) caching.
+
+User prompts are built as LayeredPrompt strings (see prompts_v5): the
+static instructions come first, then the document content, then the
+per-call fields, and the prompt records where the first two layers end.
+Together with the system prompt, those offsets are the cache breakpoints.
+
+PrefixCachingClient wraps an LLMClient and, for every call:
+- passes a ``cache_control`` hint to ``generate`` when the model enables
+  ``prompt_caching`` and the client's generate accepts that argument;
+- counts prompt tokens and how many of them were a prefix already sent
+  to the same model within the provider's cache lifetime (a local
+  estimate, used when the response carries no ``cached_tokens`` figure).
+
+Usage:
+    client = PrefixCachingClient(LLMClient())
+    response = client.generate(model, user_prompt, system_prompt)
+    print(client.prefix_cache.stats())
+"""
+
+import time
+import hashlib
+import inspect
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from csrd_council_2.config.models import ModelConfig
+from csrd_council_2.models.llm_client import LLMClient
+from csrd_council_2.utils.chunking import count_tokens
+
+
+# How long a provider keeps a cached prefix warm (Anthropic / OpenAI: ~5 min)
+DEFAULT_PREFIX_TTL_SECONDS = 300
+
+# Providers ignore prefixes shorter than this
+MIN_CACHEABLE_TOKENS = 1024
+
+
+def prompt_prefixes(user_prompt: str, system_prompt: Optional[str]) -> List[Tuple[str, str]]:
+    """
+    Cacheable prefixes of a call, shortest first, as (system, user prefix)
+    pairs: the system prompt alone, then with each shared layer of the
+    user prompt.
+    """
+    system_prompt = system_prompt or ""
+    prefixes = [(system_prompt, "")] if system_prompt else []
+    for offset in getattr(user_prompt, "boundaries", ()):
+        prefixes.append((system_prompt, user_prompt[:offset]))
+    return prefixes
+
+
+def build_cache_control(user_prompt: str, system_prompt: Optional[str]) -> Dict[str, Any]:
+    """Cache-control hint for clients that support prefix caching."""
+    return {
+        "type": "ephemeral",
+        "system": bool(system_prompt),
+        "user_breakpoints": list(getattr(user_prompt, "boundaries", ()))
+    }
+
+
+class PrefixCacheTracker:
+    """Counts prompt tokens and the share served from a warm prefix, per model."""
+
+    def __init__(self, ttl_seconds: float = DEFAULT_PREFIX_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.cached_prefix_tokens = 0
+        self.provider_reported_calls = 0
+        self._lock = threading.Lock()
+        self._seen: Dict[tuple, float] = {}
+        self._tokens: Dict[str, int] = {}
+
+    def _count(self, text: str) -> int:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        with self._lock:
+            tokens = self._tokens.get(digest)
+        if tokens is None:
+            tokens = count_tokens(text)
+            with self._lock:
+                self._tokens[digest] = tokens
+        return tokens
+
+    def record(
+        self,
+        model: ModelConfig,
+        user_prompt: str,
+        system_prompt: Optional[str],
+        provider_cached_tokens: Optional[int] = None
+    ) -> int:
+        """
+        Account for one call.
+
+        Returns:
+            Prompt tokens counted as a cached prefix for this call
+        """
+        prefixes = prompt_prefixes(user_prompt, system_prompt)
+        total = self._count(system_prompt or "") + self._count(user_prompt)
+        keys = [
+            (model.model_id, hashlib.sha256(f"{system}\0{user}".encode("utf-8")).hexdigest())
+            for system, user in prefixes
+        ]
+
+        now = time.monotonic()
+        cached = 0
+        with self._lock:
+            longest_warm = None
+            for prefix, key in zip(prefixes, keys):
+                seen = self._seen.get(key)
+                if seen is not None and now - seen <= self.ttl_seconds:
+                    longest_warm = prefix
+                self._seen[key] = now
+        if longest_warm is not None:
+            cached = self._count(longest_warm[0]) + self._count(longest_warm[1])
+            if cached < MIN_CACHEABLE_TOKENS:
+                cached = 0
+        if isinstance(provider_cached_tokens, int):
+            cached = provider_cached_tokens
+
+        with self._lock:
+            self.calls += 1
+            self.prompt_tokens += total
+            self.cached_prefix_tokens += cached
+            if isinstance(provider_cached_tokens, int):
+                self.provider_reported_calls += 1
+        return cached
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "prompt_tokens": self.prompt_tokens,
+                "cached_prefix_tokens": self.cached_prefix_tokens,
+                "cached_prefix_ratio": (
+                    round(self.cached_prefix_tokens / self.prompt_tokens, 4) if self.prompt_tokens else 0.0
+                ),
+                "provider_reported_calls": self.provider_reported_calls
+            }
+
+
+def accepts_cache_control(llm_client: Any, method: str = "generate") -> bool:
+    """Whether ``llm_client.generate`` (or ``method``) takes a ``cache_control`` argument."""
+    try:
+        parameters = inspect.signature(getattr(llm_client, method)).parameters
+    except (AttributeError, TypeError, ValueError):
+        return False
+    return "cache_control" in parameters or any(
+        p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values()
+    )
+
+
+class PrefixCachingClient:
+    """
+    Drop-in wrapper around LLMClient that forwards prompt-cache hints and
+    tracks cached prefix tokens. Only calls that reach the client are
+    counted (responses served by the on-disk cache never get here).
+    """
+
+    def __init__(self, llm_client: LLMClient, tracker: Optional[PrefixCacheTracker] = None):
+        self.llm_client = llm_client
+        self.prefix_cache = tracker or PrefixCacheTracker()
+        self._hints_supported = accepts_cache_control(llm_client)
+
+    def generate(self, model: ModelConfig, user_prompt: str, system_prompt: str = None):
+        if self._hints_supported and getattr(model, "prompt_caching", False):
+            response = self.llm_client.generate(
+                model, user_prompt, system_prompt,
+                cache_control=build_cache_control(user_prompt, system_prompt)
+            )
+        else:
+            response = self.llm_client.generate(model, user_prompt, system_prompt)
+
+        self.prefix_cache.record(model, user_prompt, system_prompt, getattr(response, "cached_tokens", None))
+        return response
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.llm_client, name)
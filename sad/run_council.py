@@ -0,0 +1,479 @@
+#!/usr/bin/env python3
+"""
+CSRD Council - Main Runner v2.0
+===============================
+
+Run the complete CSRD Council analysis pipeline or individual phases.
+
+Updated for v2.0:
+- Passes document_path to Phase 3 (required for chunk-by-chunk processing)
+- Support for new validity thresholds
+- Better error handling and reporting
+
+Usage:
+    # Run all phases
+    python run_council.py --document report.json --config config.json --output-dir ./results
+    
+    # Run individual phases
+    python run_council.py --phase 1 --document report.json --config config.json --output-dir ./results
+    python run_council.py --phase 2 --document report.json --config config.json --output-dir ./results
+    python run_council.py --phase 3 --document report.json --config config.json --output-dir ./results
+"""
+
+import os
+import sys
+import argparse
+import time
+from datetime import datetime
+
+# Add package to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from csrd_council_2.config.models import CouncilConfig
+from csrd_council_2.phases.phase1_analysis import run_phase1
+from csrd_council_2.phases.phase2_review import run_phase2
+from csrd_council_2.phases.phase3_judgment import run_phase3
+from csrd_council_2.phases.pipelined import run_pipelined
+from csrd_council_2.utils.helpers import load_document, save_json, get_timestamp
+from csrd_council_2.utils.llm_cache import create_llm_client, DEFAULT_CACHE_DIR, DEFAULT_CACHE_MAX_MB
+from csrd_council_2.utils.baseline import load_baseline, seed_journal
+from csrd_council_2.utils.checkpoint import open_journal
+from csrd_council_2.utils.telemetry import reset_telemetry, span, save_trace, print_summary
+from csrd_council_2.utils.json_repair import repair_summary
+
+
+def run_full_pipeline(
+    document_path: str,
+    config: CouncilConfig,
+    output_dir: str,
+    mock_mode: bool = False,
+    verbose: bool = True,
+    max_workers: int = None,
+    cache_dir: str = None,
+    cache_max_mb: float = DEFAULT_CACHE_MAX_MB,
+    resume: bool = False,
+    pipelined: bool = False,
+    shared_pages: bool = False,
+    review_batch_size: int = None,
+    cluster_duplicates: bool = None,
+    sequential_review: bool = None,
+    baseline_run: str = None,
+    llm_client=None
+) -> dict:
+    """
+    Run the complete CSRD Council pipeline.
+    
+    Phase 1: Independent analysis by each analyst
+    Phase 2: Peer review of all issues
+    Phase 3: Judge aggregation and final report
+    
+    One long-lived LLM client, with a client pool per endpoint, is shared
+    by all phases; when cache_dir is set it is backed by the on-disk
+    response cache. A prebuilt client (see
+    create_llm_client) can be passed as llm_client instead.
+    
+    Every LLM call and local stage is timed: the run's Chrome trace is
+    saved to trace.json (chrome://tracing, Perfetto) and a per-phase /
+    per-actor summary goes to run_metadata.json (see utils/telemetry.py).
+    
+    Unreadable LLM answers are repaired (locally, then by a short
+    follow-up call) instead of being dropped; per-phase repair rates go
+    to run_metadata.json (see utils/json_repair.py).
+    
+    Every completed unit is appended to the checkpoint journal in
+    output_dir. With resume=True, journaled units are skipped and the
+    phase files are rebuilt from the journal.
+    
+    With pipelined=True the phases overlap: issues are reviewed as soon
+    as an analyst reports them, and each chunk is judged once its
+    analysis and reviews are done (see phases/pipelined.py). Overlap
+    issue ownership is not applied in that mode.
+    
+    With shared_pages=True the HTML report renders each cited source
+    page once and highlights evidence in the browser.
+    
+    review_batch_size sends up to that many issues from the same chunk to
+    a reviewer in one call (None = config / one issue per call).
+    
+    cluster_duplicates reviews one issue per near-duplicate cluster and
+    shares its reviews with the other members (barrier mode only: in
+    pipelined mode issues are reviewed before all analysts have reported).
+    
+    sequential_review sends an issue to one reviewer after the other and
+    skips the remaining ones once they can no longer change its Phase 3
+    outcome (None = config ``sequential_review``).
+    
+    baseline_run is the output directory of a run on a previous revision
+    of the document: units of chunks whose pages did not change are
+    copied from its journal instead of being re-run (see utils/baseline.py).
+    
+    Returns:
+        Dict with all output file paths
+    """
+    start_time = time.time()
+    telemetry = reset_telemetry()
+    
+    print("\n" + "="*70)
+    print("🏛️  CSRD LLM COUNCIL - FULL PIPELINE v2.0")
+    print("="*70)
+    print(f"📄 Document: {document_path}")
+    print(f"📁 Output: {output_dir}")
+    print(f"🎭 Mock mode: {mock_mode}")
+    print(f"🗄️  Response cache: {cache_dir or 'disabled'}")
+    print(f"♻️  Resume: {resume}")
+    print(f"🔀 Pipelined: {pipelined}")
+    if baseline_run:
+        print(f"📎 Baseline run: {baseline_run}")
+    
+    # Validate config
+    issues = config.validate()
+    if issues:
+        print("\n⚠️  Configuration warnings:")
+        for issue in issues:
+            print(f"   {issue}")
+    
+    # Validate document exists
+    if not os.path.exists(document_path):
+        print(f"\n❌ Document not found: {document_path}")
+        return {"phase1": [], "phase2": [], "phase3": {}}
+    
+    # Get document page count for metadata
+    pages = load_document(document_path)
+    num_pages = len(pages)
+    print(f"📑 Pages: {num_pages}")
+    
+    outputs = {
+        "phase1": [],
+        "phase2": [],
+        "phase3": {}
+    }
+    
+    if llm_client is None:
+        llm_client = create_llm_client(mock_mode, cache_dir, cache_max_mb)
+    
+    # Read the baseline before the journal is reset (it may be the same directory)
+    baseline = load_baseline(baseline_run) if baseline_run else None
+    if baseline_run and baseline is None:
+        print(f"⚠️  No chunk plan with page hashes or no journal in {baseline_run}: running from scratch")
+    
+    journal = open_journal(output_dir, resume, ["phase1", "phase2", "phase3"])
+    baseline_stats = None
+    if baseline:
+        with span("baseline_seeding", phase="setup"):
+            baseline_stats = seed_journal(baseline, journal, document_path, config, verbose)
+    
+    if pipelined:
+        print("\n" + "-"*70)
+        if cluster_duplicates:
+            print("⚠️  Duplicate clustering is not applied in pipelined mode")
+        with span("pipelined", "phase"):
+            outputs = run_pipelined(
+                document_path=document_path,
+                config=config,
+                output_dir=output_dir,
+                mock_mode=mock_mode,
+                verbose=verbose,
+                max_workers=max_workers,
+                llm_client=llm_client,
+                journal=journal,
+                shared_pages=shared_pages,
+                review_batch_size=review_batch_size,
+                sequential_review=sequential_review
+            )
+    else:
+        # Phase 1: Analysis
+        print("\n" + "-"*70)
+        with span("phase1", "phase"):
+            outputs["phase1"] = run_phase1(
+                document_path=document_path,
+                config=config,
+                output_dir=output_dir,
+                mock_mode=mock_mode,
+                verbose=verbose,
+                max_workers=max_workers,
+                llm_client=llm_client,
+                journal=journal
+            )
+        
+        if not outputs["phase1"]:
+            print("❌ Phase 1 failed, stopping pipeline")
+            return outputs
+        
+        # Phase 2: Review
+        print("\n" + "-"*70)
+        with span("phase2", "phase"):
+            outputs["phase2"] = run_phase2(
+                phase1_dir=output_dir,
+                document_path=document_path,
+                config=config,
+                output_dir=output_dir,
+                mock_mode=mock_mode,
+                verbose=verbose,
+                max_workers=max_workers,
+                llm_client=llm_client,
+                journal=journal,
+                batch_size=review_batch_size,
+                cluster_duplicates=cluster_duplicates,
+                sequential_review=sequential_review
+            )
+        
+        if not outputs["phase2"]:
+            print("❌ Phase 2 failed, stopping pipeline")
+            return outputs
+        
+        # Phase 3: Judgment
+        # FIX: Pass document_path to Phase 3 (required for chunk-by-chunk processing)
+        print("\n" + "-"*70)
+        with span("phase3", "phase"):
+            outputs["phase3"] = run_phase3(
+                phase1_dir=output_dir,
+                phase2_dir=output_dir,
+                config=config,
+                output_dir=output_dir,
+                document_path=document_path,  # ← FIX: Added document_path
+                num_pages=num_pages,
+                mock_mode=mock_mode,
+                verbose=verbose,
+                llm_client=llm_client,
+                journal=journal,
+                shared_pages=shared_pages,
+                max_workers=max_workers
+            )
+        
+    elapsed = time.time() - start_time
+    
+    # Save run metadata
+    # Stats of the wrappers built by create_llm_client (an injected client may lack them)
+    pool_stats = getattr(llm_client, "pool_stats", None)
+    response_cache = getattr(llm_client, "cache", None) if cache_dir else None
+    prefix_cache = getattr(llm_client, "prefix_cache", None)
+    run_metadata = {
+        "timestamp": get_timestamp(),
+        "version": "2.0",
+        "document": document_path,
+        "num_pages": num_pages,
+        "config": config.to_dict(),
+        "outputs": outputs,
+        "elapsed_time_seconds": elapsed,
+        "mock_mode": mock_mode,
+        "resumed": resume,
+        "pipelined": pipelined,
+        "baseline": baseline_stats,
+        "llm_cache": response_cache.stats() if response_cache else None,
+        "prompt_prefix_cache": prefix_cache.stats() if prefix_cache else None,
+        "connection_pool": pool_stats() if pool_stats else None,
+        "json_repair": repair_summary(telemetry),
+        "telemetry": {
+            "trace": save_trace(output_dir),
+            "phase_seconds": telemetry.phase_durations(),
+            "phase_cpu_seconds": telemetry.phase_durations("cpu_s"),
+            "summary": telemetry.summarize()
+        }
+    }
+    
+    metadata_path = os.path.join(output_dir, "run_metadata.json")
+    save_json(run_metadata, metadata_path)
+    
+    print("\n" + "="*70)
+    print("✅ PIPELINE COMPLETE")
+    print("="*70)
+    print(f"⏱️  Total time: {elapsed:.1f}s")
+    cache_stats = run_metadata["llm_cache"]
+    if cache_stats:
+        print(f"🗄️  Cache: {cache_stats['hits']} hit(s), {cache_stats['misses']} miss(es)")
+    prefix_stats = run_metadata["prompt_prefix_cache"]
+    if prefix_stats:
+        print(f"🧩 Prompt prefix cache: {prefix_stats['cached_prefix_tokens']}/{prefix_stats['prompt_tokens']} "
+              f"prompt token(s) from a cached prefix ({prefix_stats['cached_prefix_ratio']:.0%})")
+    for endpoint, stats in (run_metadata["connection_pool"] or {}).items():
+        print(f"🔌 Client pool {endpoint}: {stats['created']}/{stats['max_size']} client(s), "
+              f"peak {stats['peak_in_use']} in use, {stats['waits']} wait(s), {stats['utilization']:.0%} utilization")
+    for phase, stats in run_metadata["json_repair"].items():
+        print(f"🩹 JSON repair {phase}: {stats['parse_failures']} unreadable answer(s), "
+              f"{stats['repaired_local']} repaired locally, {stats['repaired_llm']} by follow-up, "
+              f"{stats['unrepaired']} lost ({stats['repair_rate']:.0%} recovered)")
+    if verbose:
+        print(f"\n📊 Telemetry (trace: {run_metadata['telemetry']['trace']}):")
+        print_summary(run_metadata["telemetry"]["summary"])
+    print(f"\n📁 Output files:")
+    print(f"   Phase 1: {len(outputs['phase1'])} file(s)")
+    print(f"   Phase 2: {len(outputs['phase2'])} file(s)")
+    print(f"   Phase 3: JSON + HTML")
+    
+    html_path = outputs['phase3'].get('html', 'N/A')
+    print(f"\n🌐 HTML Report: {html_path}")
+    
+    if html_path != 'N/A':
+        print(f"\n💡 Open the HTML report in your browser to view results")
+    
+    return outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="CSRD Council - Multi-LLM Analysis Pipeline v2.0",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    # Run full pipeline
+    python run_council.py -d report.json -c config.json -o ./results
+    
+    # Run with mock LLM
+    python run_council.py -d report.json -c config.json -o ./results --mock
+    
+    # Overlap analysis, review and judgment (streaming pipeline)
+    python run_council.py -d report.json -c config.json -o ./results --pipelined
+    
+    # Resume an interrupted run from its checkpoint journal
+    python run_council.py -d report.json -c config.json -o ./results --resume
+    
+    # Re-run a revised report, reusing results for unchanged pages
+    python run_council.py -d report_v2.json -c config.json -o ./results_v2 --baseline-run ./results
+    
+    # Rerun without the response cache (always call the LLMs)
+    python run_council.py -d report.json -c config.json -o ./results --no-cache
+    
+    # Run only Phase 1
+    python run_council.py --phase 1 -d report.json -c config.json -o ./results
+    
+    # Run only Phase 2 (requires Phase 1 outputs)
+    python run_council.py --phase 2 -d report.json -c config.json -o ./results
+    
+    # Run only Phase 3 (requires Phase 1 & 2 outputs AND document)
+    python run_council.py --phase 3 -d report.json -c config.json -o ./results
+        """
+    )
+    
+    parser.add_argument("--document", "-d",
+                       help="Path to document JSON file (required for all phases)")
+    parser.add_argument("--config", "-c", required=True,
+                       help="Path to council config JSON file")
+    parser.add_argument("--output-dir", "-o", default="./outputs",
+                       help="Output directory (default: ./outputs)")
+    parser.add_argument("--phase", type=int, choices=[1, 2, 3],
+                       help="Run only specific phase (default: run all)")
+    parser.add_argument("--mock", action="store_true",
+                       help="Use mock LLM for testing")
+    parser.add_argument("--max-workers", type=int,
+                       help="Concurrent LLM requests per phase (default: config or 8)")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR,
+                       help=f"LLM response cache directory (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--cache-max-mb", type=float, default=DEFAULT_CACHE_MAX_MB,
+                       help=f"Cache size bound, LRU-evicted (default: {DEFAULT_CACHE_MAX_MB})")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Disable the LLM response cache")
+    parser.add_argument("--resume", action="store_true",
+                       help="Skip units recorded in the output dir's checkpoint journal")
+    parser.add_argument("--pipelined", action="store_true",
+                       help="Overlap the phases: review and judge chunks while analysts are still running")
+    parser.add_argument("--shared-pages", action="store_true",
+                       help="Render each source page once in the HTML report (smaller file)")
+    parser.add_argument("--review-batch-size", type=int,
+                       help="Issues from the same chunk sent per reviewer call (default: config or 1)")
+    parser.add_argument("--cluster-duplicates", action="store_true", default=None,
+                       help="Review one issue per near-duplicate cluster and share its reviews")
+    parser.add_argument("--sequential-review", action="store_true", default=None,
+                       help="Skip the remaining reviewers once an issue's outcome is settled")
+    parser.add_argument("--baseline-run",
+                       help="Output dir of a run on a previous revision: reuse results of unchanged chunks")
+    parser.add_argument("--quiet", "-q", action="store_true",
+                       help="Suppress progress output")
+    
+    args = parser.parse_args()
+    
+    # Load config
+    config = CouncilConfig.from_json(args.config)
+    
+    # Create output directory
+    os.makedirs(args.output_dir, exist_ok=True)
+    
+    cache_dir = None if args.no_cache else args.cache_dir
+    
+    if args.phase is None:
+        # Run full pipeline
+        if not args.document:
+            parser.error("--document is required for full pipeline")
+        
+        run_full_pipeline(
+            document_path=args.document,
+            config=config,
+            output_dir=args.output_dir,
+            mock_mode=args.mock,
+            verbose=not args.quiet,
+            max_workers=args.max_workers,
+            cache_dir=cache_dir,
+            cache_max_mb=args.cache_max_mb,
+            resume=args.resume,
+            pipelined=args.pipelined,
+            shared_pages=args.shared_pages,
+            review_batch_size=args.review_batch_size,
+            cluster_duplicates=args.cluster_duplicates,
+            sequential_review=args.sequential_review,
+            baseline_run=args.baseline_run
+        )
+    
+    elif args.phase == 1:
+        if not args.document:
+            parser.error("--document is required for Phase 1")
+        
+        run_phase1(
+            document_path=args.document,
+            config=config,
+            output_dir=args.output_dir,
+            mock_mode=args.mock,
+            verbose=not args.quiet,
+            max_workers=args.max_workers,
+            llm_client=create_llm_client(args.mock, cache_dir, args.cache_max_mb),
+            journal=open_journal(args.output_dir, args.resume, ["phase1"])
+        )
+    
+    elif args.phase == 2:
+        if not args.document:
+            parser.error("--document is required for Phase 2")
+        
+        run_phase2(
+            phase1_dir=args.output_dir,
+            document_path=args.document,
+            config=config,
+            output_dir=args.output_dir,
+            mock_mode=args.mock,
+            verbose=not args.quiet,
+            max_workers=args.max_workers,
+            llm_client=create_llm_client(args.mock, cache_dir, args.cache_max_mb),
+            journal=open_journal(args.output_dir, args.resume, ["phase2"]),
+            batch_size=args.review_batch_size,
+            cluster_duplicates=args.cluster_duplicates,
+            sequential_review=args.sequential_review
+        )
+    
+    elif args.phase == 3:
+        # FIX: Document is now required for Phase 3
+        if not args.document:
+            parser.error("--document is required for Phase 3 (chunk-by-chunk processing)")
+        
+        if not os.path.exists(args.document):
+            print(f"❌ Document not found: {args.document}")
+            return 1
+        
+        pages = load_document(args.document)
+        
+        run_phase3(
+            phase1_dir=args.output_dir,
+            phase2_dir=args.output_dir,
+            config=config,
+            output_dir=args.output_dir,
+            document_path=args.document,  # ← FIX: Added document_path
+            num_pages=len(pages),
+            mock_mode=args.mock,
+            verbose=not args.quiet,
+            llm_client=create_llm_client(args.mock, cache_dir, args.cache_max_mb),
+            journal=open_journal(args.output_dir, args.resume, ["phase3"]),
+            shared_pages=args.shared_pages,
+            max_workers=args.max_workers
+        )
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,449 @@
+"""
+Streaming JSON Loading
+======================
+
+Lazy readers for the phase output files.
+
+Phase files are single JSON objects whose bulk is one array
+(``issues`` in phase1_*.json, ``reviews`` in phase2_*.json). Reading
+them with json.load keeps the raw text and the full parsed tree alive at
+once; the iterators here decode the array one element at a time from a
+buffered reader, so only the current element (plus a small read buffer)
+is held in memory.
+
+On top of them:
+- Phase1Files scans a run's Phase 1 files once (counts, headers, issue
+  ID digest) and regroups their issues by source chunk, so Phase 2 and
+  Phase 3 only hold the issues of the chunks they are working on;
+- ChunkReviews reads the Phase 2 reviews of those issues chunk by chunk;
+- JSONLSpill and write_json_array let Phase 2 write its (issue-ordered)
+  review files while reviewing chunk by chunk.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+from bisect import bisect_right
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple, Union
+
+
+READ_BLOCK_SIZE = 64 * 1024
+_WHITESPACE = " \t\n\r"
+
+_decoder = json.JSONDecoder()
+
+
+class _JSONStreamReader:
+    """Incremental decoder over a text file (buffer grows only as far as one value)."""
+
+    def __init__(self, f: TextIO):
+        self.f = f
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, min_size: int = READ_BLOCK_SIZE) -> bool:
+        if self.eof:
+            return False
+        data = self.f.read(max(READ_BLOCK_SIZE, min_size))
+        if not data:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at end of file)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' at offset {self.pos}, found '{found or 'EOF'}'")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value, reading more input as needed."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                # Value spans past the buffer: read more (doubling) and retry
+                if not self._fill(len(self.buf)):
+                    raise
+                continue
+            # A number at the very end of the buffer may be cut short
+            if end == len(self.buf) and not self.eof and not isinstance(value, (dict, list, str)):
+                if self._fill():
+                    continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(path: str, key: Optional[str] = None, header: Optional[Dict] = None) -> Iterator[Any]:
+    """
+    Lazily yield the elements of a JSON array.
+
+    Args:
+        path: JSON file path
+        key: Top-level member holding the array (None = the file is an array).
+            If the file is a bare array, it is used whatever ``key`` is.
+        header: Optional dict that receives the top-level members that
+            precede ``key`` in the file (e.g. "analyst", "aggregate_stats")
+
+    Yields:
+        Array elements, in file order
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        reader = _JSONStreamReader(f)
+
+        if reader.peek() == "{":
+            reader.expect("{")
+            while True:
+                if reader.peek() == "}":
+                    return
+                name = reader.value()
+                reader.expect(":")
+                if name == key and reader.peek() == "[":
+                    break
+                value = reader.value()
+                if header is not None:
+                    header[name] = value
+                if reader.peek() == ",":
+                    reader.expect(",")
+
+        reader.expect("[")
+        if reader.peek() == "]":
+            return
+        while True:
+            yield reader.value()
+            if reader.peek() == ",":
+                reader.expect(",")
+                continue
+            reader.expect("]")
+            return
+
+
+def iter_phase1_issues(phase1_files: List[str]) -> Iterator[Dict]:
+    """
+    Yield every Phase 1 issue, tagged with ``_source_analyst`` / ``_source_file``.
+
+    Issues are yielded as freshly decoded dicts, so callers may annotate
+    them in place without copying.
+    """
+    for filepath in phase1_files:
+        header: Dict = {}
+        for issue in iter_json_array(filepath, "issues", header):
+            issue["_source_analyst"] = phase1_analyst(header)
+            issue["_source_file"] = filepath
+            yield issue
+
+
+def phase1_analyst(header: Dict) -> str:
+    """Analyst name from the members of a Phase 1 file."""
+    return header.get("analyst_id", header.get("analyst", "Unknown"))
+
+
+def iter_phase2_reviews(phase2_files: List[str], headers: Optional[List[Dict]] = None) -> Iterator[Dict]:
+    """
+    Yield every Phase 2 review, tagged with ``_source_file``.
+
+    Args:
+        phase2_files: Review files, in order
+        headers: Optional list receiving each file's top-level members
+            that precede "reviews" (e.g. "aggregate_stats")
+    """
+    for filepath in phase2_files:
+        header: Dict = {}
+        for review in iter_json_array(filepath, "reviews", header):
+            review["_source_file"] = filepath
+            yield review
+        if headers is not None:
+            headers.append(header)
+
+
+# ============================================================================
+# CHUNK-BY-CHUNK ACCESS
+# ============================================================================
+
+def issue_key(issue: Dict, index: int) -> str:
+    """ID under which an issue is reviewed (its position in collection order when it has none)."""
+    return str(issue.get("issue_id", f"issue-{index}"))
+
+
+def source_chunk(issue: Dict) -> int:
+    """Chunk an issue belongs to (0 when unknown)."""
+    chunk = issue.get("source_chunk", 0)
+    return chunk if isinstance(chunk, int) else 0
+
+
+class Phase1Files:
+    """
+    Issue layout of a run's Phase 1 files, read in one streaming pass.
+
+    Keeps, per file, its members other than "issues" (analyst,
+    total_issues, ...), its number of issues and whether they are in
+    chunk order (as save_phase1_results writes them), plus the issue
+    counts per type and a digest of the issue IDs in collection order
+    (the order of iter_phase1_issues, which Phase 2 reviews follow).
+    No issue is kept.
+    """
+
+    def __init__(self, phase1_files: List[str]):
+        self.files = list(phase1_files)
+        self.headers: List[Dict] = []
+        self.counts: List[int] = []
+        self.offsets: List[int] = []
+        self.type_counts: Dict[str, int] = {}
+        self.unordered: Set[int] = set()
+
+        digest = hashlib.sha256()
+        total = 0
+        for k, filepath in enumerate(self.files):
+            header: Dict = {}
+            count = 0
+            last_chunk = None
+            for issue in iter_json_array(filepath, "issues", header):
+                chunk = source_chunk(issue)
+                if last_chunk is not None and chunk < last_chunk:
+                    self.unordered.add(k)
+                last_chunk = chunk
+                issue_type = issue.get("type", "UNKNOWN")
+                self.type_counts[issue_type] = self.type_counts.get(issue_type, 0) + 1
+                digest.update(issue_key(issue, total + count).encode("utf-8") + b"\0")
+                count += 1
+            self.headers.append(header)
+            self.offsets.append(total)
+            self.counts.append(count)
+            total += count
+        self.total = total
+        self.id_digest = digest.hexdigest()
+
+    def __len__(self) -> int:
+        return self.total
+
+    @property
+    def chunk_ordered(self) -> bool:
+        """Whether every file lists its issues in chunk order."""
+        return not self.unordered
+
+    def file_of(self, index: int) -> int:
+        """Position in ``files`` of the file holding issue ``index``."""
+        return bisect_right(self.offsets, index) - 1
+
+    def iter_issues(self) -> Iterator[Tuple[int, Dict]]:
+        """(index, issue) pairs in collection order."""
+        return enumerate(iter_phase1_issues(self.files))
+
+    def _iter_file(self, k: int) -> Iterator[Tuple[int, Dict]]:
+        entries = ((self.offsets[k] + i, issue) for i, issue in enumerate(iter_phase1_issues([self.files[k]])))
+        if k in self.unordered:
+            # Not written in chunk order: this file is regrouped in memory
+            return iter(sorted(entries, key=lambda entry: source_chunk(entry[1])))
+        return entries
+
+    def iter_chunks(self) -> Iterator[Tuple[int, List[Tuple[int, Dict]]]]:
+        """
+        Yield (source chunk, [(index, issue), ...]) in chunk order.
+
+        Each chunk's issues come in collection order (file by file). The
+        files are merged as they are read, so only one chunk of issues is
+        held at a time (plus any file that is not in chunk order).
+        """
+        streams = [self._iter_file(k) for k in range(len(self.files))]
+        heads = [next(stream, None) for stream in streams]
+        while any(head is not None for head in heads):
+            chunk = min(source_chunk(head[1]) for head in heads if head is not None)
+            entries = []
+            for k, stream in enumerate(streams):
+                while heads[k] is not None and source_chunk(heads[k][1]) == chunk:
+                    entries.append(heads[k])
+                    heads[k] = next(stream, None)
+            yield chunk, entries
+
+
+class Phase2Files:
+    """
+    A run's Phase 2 review files, read in one streaming pass: members
+    other than "reviews", number of reviews, reviewer IDs and, per file,
+    a digest of the reviewed issue IDs. No review is kept.
+    """
+
+    def __init__(self, phase2_files: List[str]):
+        self.files = list(phase2_files)
+        self.headers: List[Dict] = []
+        self.counts: List[int] = []
+        self.reviewer_ids: Set[Any] = set()
+        self._digests: List[str] = []
+
+        for filepath in self.files:
+            header: Dict = {}
+            digest = hashlib.sha256()
+            count = 0
+            for review in iter_json_array(filepath, "reviews", header):
+                self.reviewer_ids.add(review.get("reviewer_id"))
+                digest.update(str(review.get("issue_id")).encode("utf-8") + b"\0")
+                count += 1
+            self.headers.append(header)
+            self.counts.append(count)
+            self._digests.append(digest.hexdigest())
+
+    def __len__(self) -> int:
+        return sum(self.counts)
+
+    def aligned_with(self, layout: Phase1Files) -> bool:
+        """Whether every file holds exactly one review per issue of ``layout``, in collection order."""
+        return all(
+            count == len(layout) and digest == layout.id_digest
+            for count, digest in zip(self.counts, self._digests)
+        )
+
+
+class ChunkReviews:
+    """
+    Reviews of the issues yielded by Phase1Files.iter_chunks, chunk by chunk.
+
+    When the review files line up with the Phase 1 files (the usual case:
+    Phase 2 writes one review per issue in collection order) and those
+    are in chunk order, each review file is read through one forward-only
+    cursor per Phase 1 file, so only the current chunk's reviews are
+    held. Otherwise all reviews are indexed by issue ID up front.
+    """
+
+    def __init__(self, phase2: Phase2Files, layout: Phase1Files):
+        self.phase2 = phase2
+        self.layout = layout
+        self.streamed = layout.chunk_ordered and phase2.aligned_with(layout)
+        self._cursors: Dict[Tuple[int, int], Iterator[Dict]] = {}
+        self._by_issue: Optional[Dict[str, List[Dict]]] = None
+        if not self.streamed:
+            self._by_issue = {}
+            for review in iter_phase2_reviews(phase2.files):
+                self._by_issue.setdefault(review.get("issue_id", ""), []).append(review)
+
+    def _cursor(self, r: int, k: int) -> Iterator[Dict]:
+        cursor = self._cursors.get((r, k))
+        if cursor is None:
+            start = self.layout.offsets[k]
+            cursor = islice(iter_phase2_reviews([self.phase2.files[r]]), start, start + self.layout.counts[k])
+            self._cursors[(r, k)] = cursor
+        return cursor
+
+    def reviews_for(self, entries: List[Tuple[int, Dict]]) -> List[Dict]:
+        """Reviews of a chunk's (index, issue) pairs, review file by review file."""
+        if not self.streamed:
+            issue_ids = dict.fromkeys(issue.get("issue_id", "") for _, issue in entries)
+            return [review for issue_id in issue_ids for review in self._by_issue.get(issue_id, [])]
+
+        reviews = []
+        for r in range(len(self.phase2.files)):
+            for index, issue in entries:
+                review = next(self._cursor(r, self.layout.file_of(index)))
+                if str(review.get("issue_id")) != issue_key(issue, index):
+                    raise ValueError(f"Review file {self.phase2.files[r]} is out of step at issue {index}")
+                reviews.append(review)
+        return reviews
+
+
+# ============================================================================
+# WRITING
+# ============================================================================
+
+def _dump(value: Any, level: int) -> str:
+    # json.dump(indent=2) layout of a value nested ``level`` levels deep
+    return json.dumps(value, indent=2, ensure_ascii=False).replace("\n", "\n" + "  " * level)
+
+
+def write_json_array(
+    path: str,
+    head: Dict,
+    key: str,
+    items: Iterable[Any],
+    tail: Optional[Union[Dict, Callable[[], Dict]]] = None
+) -> int:
+    """
+    Write ``{**head, key: [*items], **tail}`` (as json.dump with indent=2)
+    without building the array: items are written as they are iterated.
+
+    ``tail`` may be a callable, called once the items are written (so it
+    can summarize them).
+
+    Returns:
+        Number of items written
+    """
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{")
+        for name, value in head.items():
+            f.write(f"\n  {json.dumps(name, ensure_ascii=False)}: {_dump(value, 1)},")
+        f.write(f"\n  {json.dumps(key, ensure_ascii=False)}: [")
+        for item in items:
+            f.write(("," if count else "") + "\n    " + _dump(item, 2))
+            count += 1
+        f.write("\n  ]" if count else "]")
+        if callable(tail):
+            tail = tail()
+        for name, value in (tail or {}).items():
+            f.write(f",\n  {json.dumps(name, ensure_ascii=False)}: {_dump(value, 1)}")
+        f.write("\n}")
+    return count
+
+
+class JSONLSpill:
+    """
+    Append-only JSON lines files (one per key) in a temporary directory.
+
+    ``view(*keys)`` is a re-iterable over the items of those keys, in
+    order, read back from disk on every iteration.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self._dir = tempfile.mkdtemp(prefix="spill-", dir=directory)
+        self._paths: Dict[Any, str] = {}
+
+    def _path(self, key: Any) -> str:
+        path = self._paths.get(key)
+        if path is None:
+            path = os.path.join(self._dir, f"{len(self._paths)}.jsonl")
+            self._paths[key] = path
+        return path
+
+    def extend(self, key: Any, items: Iterable[Any]) -> None:
+        with open(self._path(key), "a", encoding="utf-8") as f:
+            for item in items:
+                f.write(json.dumps(item, ensure_ascii=False) + "\n")
+
+    def iter(self, key: Any) -> Iterator[Any]:
+        path = self._paths.get(key)
+        if path is None:
+            return
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
+
+    def view(self, *keys: Any) -> "_SpillView":
+        return _SpillView(self, keys)
+
+    def close(self) -> None:
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+
+class _SpillView:
+    def __init__(self, spill: JSONLSpill, keys: Tuple[Any, ...]):
+        self.spill = spill
+        self.keys = keys
+
+    def __iter__(self) -> Iterator[Any]:
+        for key in self.keys:
+            yield from self.spill.iter(key)
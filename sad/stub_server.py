@@ -0,0 +1,499 @@
+#!/usr/bin/env python3
+"""
+Local LLM Stub Server
+=====================
+
+OpenAI-compatible chat-completion server for load and failure testing
+without calling real models.
+
+Point a model's EndpointConfig at it (base URL ``http://127.0.0.1:<port>/v1``)
+and every ``POST /v1/chat/completions`` gets a CSRD-shaped JSON answer
+(analyst issues, reviewer evaluations, judge verdicts) from
+SyntheticLLMClient, recognized from the system prompt. A FailureProfile
+injects:
+- latency, drawn from a distribution ("const:MS", "uniform:LO:HI",
+  "lognormal:MEDIAN:SIGMA", "exp:MEAN", in milliseconds);
+- 429 responses, from a requests-per-minute limit and/or at random;
+- bursts of consecutive 503 responses;
+- truncated JSON answers (finish_reason "length");
+- slow streaming (``"stream": true`` requests get server-sent events,
+  one piece of the answer every ``stream_delay_ms``).
+
+``GET /stats`` returns request counts per status and the injected
+latency percentiles.
+
+With ``--drive``, the server is started in-process and a load of
+analyst / reviewer / judge calls is sent through LLMClient and
+generate_with_retry (with the models of ``--config``, which must point
+at the server), reporting throughput, tail latency, retries and
+failures.
+
+Usage:
+    python stub_server.py --port 8765 --latency lognormal:800:0.6 --rate-limit-rpm 120 --error-burst-rate 0.01
+    python stub_server.py --port 8765 --truncate-rate 0.05 --drive -c config_stub.json --requests 300 --workers 16
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import random
+import argparse
+import threading
+from dataclasses import dataclass, asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from csrd_council_2.utils.chunking import count_tokens
+
+
+DEFAULT_PORT = 8765
+
+
+# ============================================================================
+# FAILURE PROFILE
+# ============================================================================
+
+@dataclass
+class FailureProfile:
+    """What the stub injects into its responses (rates are per request, 0.0-1.0)."""
+    latency: str = "const:0"
+    rate_limit_rpm: int = 0
+    rate_limit_rate: float = 0.0
+    error_burst_rate: float = 0.0
+    error_burst_length: int = 5
+    truncate_rate: float = 0.0
+    stream_delay_ms: float = 0.0
+    stream_chunk_chars: int = 64
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """
+    Latency sampler (milliseconds) from a spec: "const:MS", "uniform:LO:HI",
+    "lognormal:MEDIAN:SIGMA" or "exp:MEAN".
+
+    Raises:
+        ValueError: Unknown distribution or wrong number of parameters
+    """
+    kind, *params = spec.split(":")
+    values = [float(p) for p in params]
+    if kind == "const" and len(values) == 1:
+        return lambda rng: values[0]
+    if kind == "uniform" and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == "lognormal" and len(values) == 2:
+        return lambda rng: rng.lognormvariate(math.log(max(values[0], 1e-3)), values[1])
+    if kind == "exp" and len(values) == 1:
+        return lambda rng: rng.expovariate(1 / values[0]) if values[0] > 0 else 0.0
+    raise ValueError(f"Invalid latency spec: {spec!r}")
+
+
+def _percentiles(values: List[float]) -> Dict[str, float]:
+    ordered = sorted(values)
+    if not ordered:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    pick = lambda q: ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+    return {"p50": round(pick(0.5), 1), "p95": round(pick(0.95), 1), "p99": round(pick(0.99), 1), "max": round(ordered[-1], 1)}
+
+
+# ============================================================================
+# SERVER
+# ============================================================================
+
+class StubLLMServer:
+    """
+    Threaded OpenAI-compatible stub. ``responder(model, user_prompt,
+    system_prompt)`` returns the answer text (default: SyntheticLLMClient).
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PORT,
+        profile: Optional[FailureProfile] = None,
+        responder: Optional[Callable[[str, str, Optional[str]], str]] = None,
+        seed: int = 0
+    ):
+        if responder is None:
+            from csrd_council_2.benchmark_pipeline import SyntheticLLMClient
+            responder = SyntheticLLMClient(seed=seed).respond
+        self.profile = profile or FailureProfile()
+        self.responder = responder
+        self._latency = parse_latency(self.profile.latency)
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._burst_remaining = 0
+        self._tokens = float(self._bucket_capacity())
+        self._refilled = time.monotonic()
+        self._counts: Dict[str, int] = {}
+        self._latencies: List[float] = []
+
+        self.httpd = ThreadingHTTPServer((host, port), _StubHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.stub = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "StubLLMServer":
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="stub-llm-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "StubLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _bucket_capacity(self) -> float:
+        return max(1.0, self.profile.rate_limit_rpm / 60)
+
+    def _take_token(self) -> Optional[float]:
+        """Consume a rate-limit token; returns the seconds to wait when there is none."""
+        if self.profile.rate_limit_rpm <= 0:
+            return None
+        rate = self.profile.rate_limit_rpm / 60
+        now = time.monotonic()
+        self._tokens = min(self._bucket_capacity(), self._tokens + (now - self._refilled) * rate)
+        self._refilled = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return None
+        return (1 - self._tokens) / rate
+
+    def decide(self) -> Dict[str, Any]:
+        """
+        Fate of the next request: "status" (200, 429 or 503), "retry_after",
+        "latency_ms" and "truncate".
+        """
+        profile = self.profile
+        with self._lock:
+            latency = max(0.0, self._latency(self._rng))
+            wait = self._take_token()
+            if wait is not None or self._rng.random() < profile.rate_limit_rate:
+                status = 429
+            elif self._burst_remaining > 0 or self._rng.random() < profile.error_burst_rate:
+                if self._burst_remaining == 0:
+                    self._burst_remaining = max(1, profile.error_burst_length)
+                self._burst_remaining -= 1
+                status = 503
+            else:
+                status = 200
+            truncate = status == 200 and self._rng.random() < profile.truncate_rate
+            cut = self._rng.random()
+        return {
+            "status": status, "retry_after": math.ceil(wait) if wait else 1,
+            "latency_ms": latency, "truncate": truncate, "cut": cut
+        }
+
+    def record(self, outcome: str, latency_ms: float) -> None:
+        with self._lock:
+            self._counts[outcome] = self._counts.get(outcome, 0) + 1
+            self._latencies.append(latency_ms)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": len(self._latencies),
+                "outcomes": dict(self._counts),
+                "injected_latency_ms": _percentiles(self._latencies),
+                "profile": asdict(self.profile)
+            }
+
+
+def _message_text(content: Any) -> str:
+    if isinstance(content, list):
+        return "".join(part.get("text", "") for part in content if isinstance(part, dict))
+    return content or ""
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _send_json(self, status: int, body: Dict, headers: Optional[Dict[str, str]] = None) -> None:
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self) -> None:
+        stub = self.server.stub
+        if self.path.rstrip("/").endswith("/stats"):
+            self._send_json(200, stub.stats())
+        elif self.path.rstrip("/").endswith("/models"):
+            self._send_json(200, {"object": "list", "data": [{"id": "stub", "object": "model"}]})
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}", "type": "invalid_request_error"}})
+
+    def do_POST(self) -> None:
+        stub = self.server.stub
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}", "type": "invalid_request_error"}})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": {"message": "Invalid JSON body", "type": "invalid_request_error"}})
+            return
+
+        model = request.get("model", "stub")
+        messages = request.get("messages", [])
+        system_prompt = next((_message_text(m.get("content")) for m in messages if m.get("role") == "system"), None)
+        user_prompt = "\n".join(_message_text(m.get("content")) for m in messages if m.get("role") == "user")
+
+        fate = stub.decide()
+        time.sleep(fate["latency_ms"] / 1000)
+
+        if fate["status"] == 429:
+            stub.record("429", fate["latency_ms"])
+            self._send_json(429, {
+                "error": {"message": "Rate limit exceeded (429)", "type": "rate_limit_error", "code": "rate_limit_exceeded"}
+            }, {"Retry-After": str(fate["retry_after"])})
+            return
+        if fate["status"] == 503:
+            stub.record("503", fate["latency_ms"])
+            self._send_json(503, {"error": {"message": "Service overloaded (503)", "type": "server_error"}})
+            return
+
+        answer = stub.responder(model, user_prompt, system_prompt)
+        finish_reason = "stop"
+        if fate["truncate"]:
+            answer = answer[:max(1, int(len(answer) * fate["cut"]))]
+            finish_reason = "length"
+        stub.record("truncated" if fate["truncate"] else "200", fate["latency_ms"])
+
+        usage = {
+            "prompt_tokens": count_tokens(system_prompt or "") + count_tokens(user_prompt),
+            "completion_tokens": count_tokens(answer)
+        }
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+        completion_id = f"chatcmpl-stub-{int(time.time() * 1000)}"
+
+        if request.get("stream"):
+            self._stream(completion_id, model, answer, finish_reason, stub.profile)
+            return
+
+        self._send_json(200, {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": answer}, "finish_reason": finish_reason}],
+            "usage": usage
+        })
+
+    def _stream(self, completion_id: str, model: str, answer: str, finish_reason: str, profile: FailureProfile) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        def event(delta: Dict, finish: Optional[str] = None) -> None:
+            chunk = {
+                "id": completion_id, "object": "chat.completion.chunk", "created": int(time.time()), "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish}]
+            }
+            self.wfile.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+        step = max(1, profile.stream_chunk_chars)
+        event({"role": "assistant"})
+        for i in range(0, len(answer), step):
+            if profile.stream_delay_ms > 0:
+                time.sleep(profile.stream_delay_ms / 1000)
+            event({"content": answer[i:i + step]})
+        event({}, finish_reason)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+
+# ============================================================================
+# LOAD DRIVER
+# ============================================================================
+
+def build_load(config: Any, num_requests: int, seed: int = 0) -> List[Tuple[Any, str, str]]:
+    """
+    ``num_requests`` (model, user prompt, system prompt) calls cycling
+    over the config's analysts, reviewers and judge, with prompts built
+    from a synthetic document.
+    """
+    from csrd_council_2.config.prompts_v5 import (
+        ANALYST_SYSTEM_PROMPT, REVIEWER_SYSTEM_PROMPT, JUDGE_SYSTEM_PROMPT,
+        format_analyst_prompt, format_reviewer_prompt, format_judge_chunk_prompt
+    )
+    from csrd_council_2.benchmark_pipeline import SyntheticLLMClient, make_document
+
+    pages = make_document(50, seed=seed)
+    synthetic = SyntheticLLMClient(pages, issue_density=0.5, seed=seed)
+    models = [("analyst", m) for m in config.analysts] + [("reviewer", m) for m in config.reviewers]
+    if config.judge:
+        models.append(("judge", config.judge))
+
+    load = []
+    for i in range(num_requests):
+        role, model = models[i % len(models)]
+        start = (i * 5) % (len(pages) - 5)
+        chunk_pages = pages[start:start + 5]
+        content = "\n\n".join(p["content"] for p in chunk_pages)
+        page_start, page_end = chunk_pages[0]["page_number"], chunk_pages[-1]["page_number"]
+        analyst_prompt = format_analyst_prompt(model.name, i + 1, page_start, page_end, content)
+        if role == "analyst":
+            load.append((model, analyst_prompt, ANALYST_SYSTEM_PROMPT))
+            continue
+
+        issues = json.loads(synthetic.respond(model.name, analyst_prompt, ANALYST_SYSTEM_PROMPT))["issues"]
+        issues = issues or [{"issue_id": f"load-{i}", "type": "CLARITY_RISK", "severity": "LOW", "title": "-",
+                             "description": "-", "evidence": [], "page_references": []}]
+        if role == "reviewer":
+            issue = issues[0]
+            user_prompt = format_reviewer_prompt(
+                model.name, issue["issue_id"], issue["type"], issue["severity"], issue["title"],
+                issue["description"], "\n".join(issue["evidence"]), content
+            )
+            load.append((model, user_prompt, REVIEWER_SYSTEM_PROMPT))
+        else:
+            user_prompt = format_judge_chunk_prompt(
+                content, i + 1, page_start, page_end, json.dumps(issues, indent=2, ensure_ascii=False), len(issues)
+            )
+            load.append((model, user_prompt, JUDGE_SYSTEM_PROMPT))
+    return load
+
+
+def drive(config: Any, num_requests: int, max_workers: Optional[int] = None, seed: int = 0) -> Dict[str, Any]:
+    """
+    Send a load through LLMClient + generate_with_retry (behind the endpoint
+    rate limiter) and measure client-side throughput and latency.
+    """
+    from csrd_council_2.models.llm_client import LLMClient
+    from csrd_council_2.utils.helpers import parse_llm_response
+    from csrd_council_2.utils.concurrency import run_units, get_max_workers, EndpointRateLimiter, generate_with_retry
+    from csrd_council_2.utils.telemetry import TracingLLMClient, reset_telemetry
+
+    telemetry = reset_telemetry()
+    llm_client = TracingLLMClient(LLMClient())
+    rate_limiter = EndpointRateLimiter()
+    load = build_load(config, num_requests, seed)
+    latencies: List[float] = []
+    lock = threading.Lock()
+
+    def call(model: Any, payload: Tuple[str, str]) -> str:
+        start = time.perf_counter()
+        response = generate_with_retry(llm_client, model, payload[0], payload[1], rate_limiter)
+        elapsed = (time.perf_counter() - start) * 1000
+        with lock:
+            latencies.append(elapsed)
+        if not response.success:
+            return "failed"
+        return "invalid_json" if parse_llm_response(response.answer).get("parse_error") else "ok"
+
+    workers = get_max_workers(config, max_workers)
+    start = time.perf_counter()
+    outcomes = run_units([(model, (user, system)) for model, user, system in load], call, max_workers=workers)
+    wall = time.perf_counter() - start
+
+    attempts = [e for e in telemetry.events if e["category"] == "llm" and e["duration"] is not None]
+    return {
+        "requests": num_requests,
+        "workers": workers,
+        "wall_s": round(wall, 3),
+        "throughput_rps": round(num_requests / wall, 2) if wall else 0.0,
+        "outcomes": {o: outcomes.count(o) for o in sorted(set(outcomes))},
+        "attempts": len(attempts),
+        "retries": sum(1 for e in telemetry.events if e["name"] == "retry"),
+        "call_latency_ms": _percentiles(latencies),
+        "attempt_latency_ms": _percentiles([e["duration"] * 1000 for e in attempts])
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI-compatible stub LLM server for load and failure testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--latency", default="const:0", help='"const:MS", "uniform:LO:HI", "lognormal:MEDIAN:SIGMA" or "exp:MEAN"')
+    parser.add_argument("--rate-limit-rpm", type=int, default=0, help="Requests per minute before 429s (0 = unlimited)")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share of requests answered 429 at random")
+    parser.add_argument("--error-burst-rate", type=float, default=0.0, help="Chance a request starts a burst of 503s")
+    parser.add_argument("--error-burst-length", type=int, default=5, help="503 responses per burst")
+    parser.add_argument("--truncate-rate", type=float, default=0.0, help="Share of answers cut short")
+    parser.add_argument("--stream-delay-ms", type=float, default=0.0, help="Delay between streamed pieces")
+    parser.add_argument("--stream-chunk-chars", type=int, default=64, help="Characters per streamed piece")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--drive", action="store_true", help="Run a load through LLMClient, then exit")
+    parser.add_argument("-c", "--config", help="Council config whose endpoints point at this server (--drive)")
+    parser.add_argument("--requests", type=int, default=200, help="Calls to send (--drive)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker pool size (--drive)")
+    parser.add_argument("-o", "--output", default=None, help="Save the --drive results to this JSON file")
+    args = parser.parse_args()
+
+    profile = FailureProfile(
+        latency=args.latency,
+        rate_limit_rpm=args.rate_limit_rpm,
+        rate_limit_rate=args.rate_limit_rate,
+        error_burst_rate=args.error_burst_rate,
+        error_burst_length=args.error_burst_length,
+        truncate_rate=args.truncate_rate,
+        stream_delay_ms=args.stream_delay_ms,
+        stream_chunk_chars=args.stream_chunk_chars
+    )
+    server = StubLLMServer(args.host, args.port, profile, seed=args.seed)
+
+    if not args.drive:
+        print(f"🧪 Stub LLM server on {server.url} (stats: {server.url}/stats)")
+        try:
+            server.httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.httpd.server_close()
+        return 0
+
+    if not args.config:
+        parser.error("--drive requires --config")
+
+    from csrd_council_2.config.models import CouncilConfig
+    config = CouncilConfig.from_json(args.config)
+
+    with server:
+        print(f"🧪 Stub LLM server on {server.url}, driving {args.requests} call(s)...")
+        results = drive(config, args.requests, args.workers, args.seed)
+        results["server"] = server.stats()
+
+    print(f"   Throughput: {results['throughput_rps']} req/s over {results['wall_s']}s ({results['workers']} worker(s))")
+    print(f"   Outcomes: {results['outcomes']}  attempts: {results['attempts']}  retries: {results['retries']}")
+    latency = results["call_latency_ms"]
+    print(f"   Call latency ms: p50 {latency['p50']}  p95 {latency['p95']}  p99 {latency['p99']}  max {latency['max']}")
+    print(f"   Server outcomes: {results['server']['outcomes']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 Saved: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,326 @@
+"""
+Run Telemetry
+=============
+
+Per-call and per-stage timing for a whole pipeline run.
+
+Two kinds of spans are recorded into one process-wide Telemetry:
+- LLM calls, via TracingLLMClient (the outermost wrapper built by
+  create_llm_client): model, phase, prompt/completion tokens, outcome,
+  whether the answer came from the response cache and, for streamed
+  answers, time to first token;
+- local stages (chunk planning, overlap resolution, issue clustering,
+  enrichment, filtering, HTML rendering, ...), via ``span()``.
+
+Retries in generate_with_retry are recorded as instant events.
+
+At the end of a run, ``save_trace`` writes trace.json in the Chrome trace
+event format (open it in chrome://tracing or https://ui.perfetto.dev),
+and ``summarize`` aggregates the spans per phase and actor (model name
+for LLM calls, stage name for local work).
+
+Usage:
+    with span("enrichment", phase="phase3"):
+        enriched = enrich_issues_with_reviews(...)
+    save_trace(output_dir)
+    print_summary(summarize())
+"""
+
+import os
+import json
+import time
+import asyncio
+import threading
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Dict, Iterator, List, Optional
+
+from csrd_council_2.config.models import ModelConfig
+from csrd_council_2.config.prompts_v5 import (
+    ANALYST_SYSTEM_PROMPT, REVIEWER_SYSTEM_PROMPT, JUDGE_SYSTEM_PROMPT, JSON_REPAIR_SYSTEM_PROMPT
+)
+from csrd_council_2.models.llm_client import LLMClient
+from csrd_council_2.utils.chunking import count_tokens
+
+
+TRACE_FILENAME = "trace.json"
+
+# Phase of an LLM call, recognized from its system prompt
+SYSTEM_PROMPT_PHASES = {
+    ANALYST_SYSTEM_PROMPT: "phase1",
+    REVIEWER_SYSTEM_PROMPT: "phase2",
+    JUDGE_SYSTEM_PROMPT: "phase3",
+    JSON_REPAIR_SYSTEM_PROMPT: "json_repair",
+}
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+class Telemetry:
+    """Thread-safe recorder of spans and instant events (times relative to its creation)."""
+
+    def __init__(self):
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self.events: List[Dict[str, Any]] = []
+        self._threads: Dict[int, str] = {}
+
+    def _thread(self) -> int:
+        thread = threading.current_thread()
+        with self._lock:
+            self._threads.setdefault(thread.ident, thread.name)
+        return thread.ident
+
+    def now(self) -> float:
+        """Seconds since this recorder was created."""
+        return time.perf_counter() - self._origin
+
+    def add_span(self, name: str, category: str, start: float, end: float, **args: Any) -> None:
+        """Record a completed span (``start``/``end`` from ``self.now()``)."""
+        event = {
+            "name": name, "category": category, "start": start,
+            "duration": max(0.0, end - start), "thread": self._thread(), "args": args
+        }
+        with self._lock:
+            self.events.append(event)
+
+    @contextmanager
+    def span(self, name: str, category: str = "stage", **args: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Time the enclosed block. The yielded dict can be filled with extra
+        args; an exception marks the span with ``outcome="error"``.
+        
+        Phase spans (``category="phase"``, which never overlap) also
+        record the process CPU time spent in the block as ``cpu_s``.
+        """
+        start = self.now()
+        cpu_start = time.process_time() if category == "phase" else None
+        extra: Dict[str, Any] = {}
+        try:
+            yield extra
+        except BaseException as e:
+            extra.setdefault("outcome", "error")
+            extra.setdefault("error", f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            extra.setdefault("outcome", "ok")
+            if cpu_start is not None:
+                extra["cpu_s"] = round(time.process_time() - cpu_start, 3)
+            self.add_span(name, category, start, self.now(), **args, **extra)
+
+    def instant(self, name: str, category: str, **args: Any) -> None:
+        """Record a point-in-time event (e.g. a retry)."""
+        event = {
+            "name": name, "category": category, "start": self.now(),
+            "duration": None, "thread": self._thread(), "args": args
+        }
+        with self._lock:
+            self.events.append(event)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Copy of the events recorded so far."""
+        with self._lock:
+            return list(self.events)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Events in the Chrome trace event format (microseconds)."""
+        pid = os.getpid()
+        with self._lock:
+            events = list(self.events)
+            threads = dict(self._threads)
+
+        trace = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "csrd_council"}}]
+        for tid, thread_name in threads.items():
+            trace.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread_name}})
+        for event in sorted(events, key=lambda e: e["start"]):
+            entry = {
+                "name": event["name"], "cat": event["category"], "pid": pid, "tid": event["thread"],
+                "ts": round(event["start"] * 1e6, 1), "args": event["args"]
+            }
+            if event["duration"] is None:
+                entry.update(ph="i", s="t")
+            else:
+                entry.update(ph="X", dur=round(event["duration"] * 1e6, 1))
+            trace.append(entry)
+        return {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+    def summarize(self) -> List[Dict[str, Any]]:
+        """
+        Aggregate spans per (phase, actor).
+
+        Returns:
+            Rows sorted by phase then actor: phase, actor, kind ("llm" or
+            "stage"), calls, total/p50/p95/max seconds, prompt/completion
+            tokens, cached calls, retries, errors and the median time to
+            first token of streamed calls
+        """
+        with self._lock:
+            events = list(self.events)
+
+        rows: Dict[tuple, Dict[str, Any]] = {}
+        durations: Dict[tuple, List[float]] = {}
+        ttfts: Dict[tuple, List[float]] = {}
+        for event in events:
+            if event["category"] == "phase":
+                continue
+            args = event["args"]
+            kind = "llm" if event["category"] == "llm" else "stage"
+            key = (args.get("phase") or "-", args.get("model") if kind == "llm" else event["name"])
+            row = rows.setdefault(key, {
+                "phase": key[0], "actor": key[1], "kind": kind, "calls": 0,
+                "prompt_tokens": 0, "completion_tokens": 0, "cached": 0, "retries": 0, "errors": 0
+            })
+            if event["duration"] is None:
+                if event["name"] == "retry":
+                    row["retries"] += 1
+                continue
+            durations.setdefault(key, []).append(event["duration"])
+            row["calls"] += 1
+            row["prompt_tokens"] += args.get("prompt_tokens", 0) or 0
+            row["completion_tokens"] += args.get("completion_tokens", 0) or 0
+            row["cached"] += 1 if args.get("cached") else 0
+            row["errors"] += 1 if args.get("outcome") == "error" else 0
+            if args.get("ttft_s") is not None:
+                ttfts.setdefault(key, []).append(args["ttft_s"])
+
+        for key, row in rows.items():
+            values = durations.get(key, [])
+            row["total_s"] = round(sum(values), 3)
+            row["p50_s"] = round(_percentile(values, 0.5), 3)
+            row["p95_s"] = round(_percentile(values, 0.95), 3)
+            row["max_s"] = round(max(values), 3) if values else 0.0
+            row["ttft_p50_s"] = round(_percentile(ttfts[key], 0.5), 3) if key in ttfts else None
+        return [rows[key] for key in sorted(rows)]
+
+    def phase_durations(self, key: str = None) -> Dict[str, float]:
+        """
+        Wall-clock seconds of each ``category="phase"`` span (or the
+        span arg ``key`` instead, e.g. "cpu_s").
+        """
+        with self._lock:
+            return {
+                e["name"]: round(e["duration"], 3) if key is None else e["args"].get(key)
+                for e in self.events if e["category"] == "phase" and e["duration"] is not None
+            }
+
+
+# ============================================================================
+# PROCESS-WIDE RECORDER
+# ============================================================================
+
+_telemetry = Telemetry()
+
+
+def get_telemetry() -> Telemetry:
+    """The process-wide recorder."""
+    return _telemetry
+
+
+def reset_telemetry() -> Telemetry:
+    """Start a new recording (e.g. at the start of a run)."""
+    global _telemetry
+    _telemetry = Telemetry()
+    return _telemetry
+
+
+def span(name: str, category: str = "stage", **args: Any):
+    """``get_telemetry().span(...)``; use as a context manager."""
+    return get_telemetry().span(name, category, **args)
+
+
+def summarize() -> List[Dict[str, Any]]:
+    return get_telemetry().summarize()
+
+
+def save_trace(output_dir: str) -> str:
+    """Write the Chrome trace of the current recording to ``output_dir``/trace.json."""
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, TRACE_FILENAME)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(get_telemetry().chrome_trace(), f)
+    return path
+
+
+def print_summary(rows: List[Dict[str, Any]]) -> None:
+    """Print the per-phase / per-actor summary table."""
+    print(f"\n   {'phase':<8} {'actor':<28} {'calls':>5} {'total s':>8} {'p50 s':>7} {'p95 s':>7} "
+          f"{'max s':>7} {'tok in':>8} {'tok out':>8} {'retry':>5} {'err':>4}")
+    for row in rows:
+        print(f"   {row['phase']:<8} {str(row['actor'])[:28]:<28} {row['calls']:>5} {row['total_s']:>8.2f} "
+              f"{row['p50_s']:>7.2f} {row['p95_s']:>7.2f} {row['max_s']:>7.2f} "
+              f"{row['prompt_tokens']:>8} {row['completion_tokens']:>8} {row['retries']:>5} {row['errors']:>4}")
+
+
+# ============================================================================
+# LLM CLIENT WRAPPER
+# ============================================================================
+
+def _usage(response: Any, *names: str) -> Optional[int]:
+    for name in names:
+        value = getattr(response, name, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+class TracingLLMClient:
+    """
+    Drop-in wrapper around LLMClient that records every ``generate`` call
+    as an "llm" span. Token counts come from the response when it reports
+    them, otherwise they are counted locally.
+    """
+
+    def __init__(self, llm_client: LLMClient):
+        self.llm_client = llm_client
+
+    def generate(self, model: ModelConfig, user_prompt: str, system_prompt: str = None):
+        telemetry = get_telemetry()
+        start = telemetry.now()
+        try:
+            response = self.llm_client.generate(model, user_prompt, system_prompt)
+        except Exception as e:
+            telemetry.add_span(
+                model.name, "llm", start, telemetry.now(), model=model.name,
+                phase=SYSTEM_PROMPT_PHASES.get(system_prompt, "other"),
+                outcome="error", error=f"{type(e).__name__}: {e}"
+            )
+            raise
+        end = telemetry.now()
+
+        answer = getattr(response, "answer", None) or ""
+        prompt_tokens = _usage(response, "prompt_tokens", "input_tokens")
+        if prompt_tokens is None:
+            prompt_tokens = count_tokens(system_prompt or "") + count_tokens(user_prompt)
+        completion_tokens = _usage(response, "completion_tokens", "output_tokens")
+        if completion_tokens is None:
+            completion_tokens = count_tokens(answer)
+
+        args = {
+            "model": model.name,
+            "phase": SYSTEM_PROMPT_PHASES.get(system_prompt, "other"),
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "cached": getattr(response, "cached", False) is True,
+            "outcome": "ok" if getattr(response, "success", False) else "error"
+        }
+        for name in ("ttft_s", "generation_s"):
+            value = getattr(response, name, None)
+            if isinstance(value, float):
+                args[name] = value
+        if args["outcome"] == "error":
+            args["error"] = str(getattr(response, "error", ""))[:200]
+        telemetry.add_span(model.name, "llm", start, end, **args)
+        return response
+
+    async def agenerate(self, model: ModelConfig, user_prompt: str, system_prompt: str = None):
+        """asyncio version of ``generate`` (the call runs on a worker thread)."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self.generate, model, user_prompt, system_prompt))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.llm_client, name)
@@ -0,0 +1,47 @@
+"""
+Test Setup
+==========
+
+The modules in sad/ are the flat sources of the ``csrd_council_2``
+package (phase*.py and pipelined.py live in csrd_council_2/phases,
+prompts_v5.py in csrd_council_2/config, the rest in csrd_council_2/utils).
+This maps that package onto sad/ so the tests import it as the code does:
+
+    cd sad && python -m pytest tests
+
+Modules that are not in this tree (config/models.py,
+models/llm_client.py, utils/helpers.py) come from a full checkout when
+CSRD_COUNCIL_2_HOME points at its csrd_council_2 directory; without it,
+tests that need them are skipped.
+"""
+
+import os
+import sys
+import types
+
+
+SOURCE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+UPSTREAM_DIR = os.environ.get("CSRD_COUNCIL_2_HOME")
+
+SUBPACKAGES = ["config", "models", "phases", "utils"]
+
+
+def _package(name: str, path: list) -> types.ModuleType:
+    package = types.ModuleType(name)
+    package.__path__ = path
+    sys.modules[name] = package
+    return package
+
+
+def _install_package() -> None:
+    if "csrd_council_2" in sys.modules:
+        return
+    root = _package("csrd_council_2", [SOURCE_DIR] + ([UPSTREAM_DIR] if UPSTREAM_DIR else []))
+    for sub in SUBPACKAGES:
+        path = [SOURCE_DIR]
+        if UPSTREAM_DIR:
+            path.append(os.path.join(UPSTREAM_DIR, sub))
+        setattr(root, sub, _package(f"csrd_council_2.{sub}", path))
+
+
+_install_package()
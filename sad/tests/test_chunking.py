@@ -0,0 +1,106 @@
+"""
+Tests: Chunk Planning
+=====================
+
+Page packing and overlap ownership (utils/chunking.py).
+"""
+
+import pytest
+
+# chunking reads ModelConfig and the helpers from the full package (see conftest.py)
+chunking = pytest.importorskip("csrd_council_2.utils.chunking")
+
+
+# =============================================================================
+# PAGE PACKING
+# =============================================================================
+
+def test_oversized_pages_get_a_chunk_of_their_own():
+    # A page over budget is never merged with its neighbours, nor split
+    assert chunking.pack_pages([10, 50, 10, 10], 20, 0) == [(0, 1), (1, 2), (2, 4)]
+    assert chunking.pack_pages([30, 30], 20, 10) == [(0, 1), (1, 2)]
+
+
+def test_overlap_repeats_whole_pages_but_never_a_whole_chunk():
+    assert chunking.pack_pages([10, 10, 10, 10], 20, 10) == [(0, 2), (1, 3), (2, 4)]
+    # Less than one page of overlap budget: no page is repeated
+    assert chunking.pack_pages([10, 10, 10, 10], 20, 9) == [(0, 2), (2, 4)]
+    # An overlap as large as the chunk would never advance
+    assert chunking.pack_pages([10, 10, 10], 10, 100) == [(0, 1), (1, 2), (2, 3)]
+
+
+# =============================================================================
+# OVERLAP OWNERSHIP
+# =============================================================================
+
+# Chunk 1 holds pages 1-5, chunk 2 pages 3-7. Page 3 belongs to chunk 1,
+# page 5 to chunk 2, and page 4 is a tie (one page from either edge).
+CHUNKS = [
+    {"chunk_id": 1, "page_start": 1, "page_end": 5},
+    {"chunk_id": 2, "page_start": 3, "page_end": 7},
+]
+
+
+def _issue(issue_id, pages, issue_type="DATA_INTEGRITY", title="Emissions scope 3 non ventilées par catégorie"):
+    return {
+        "issue_id": issue_id,
+        "type": issue_type,
+        "title": title,
+        "page_references": [f"p. {page}" for page in pages],
+        "evidence": ["Les émissions du scope 3 sont estimées à 1,2 Mt CO2e au total."]
+    }
+
+
+def _kept(resolved):
+    return {issue["issue_id"]: issue for issues in resolved for issue in issues}
+
+
+def test_tie_page_goes_to_the_earlier_chunk():
+    resolved, stats = chunking.resolve_overlap_issues([[], [_issue("b", [4])]], CHUNKS)
+
+    issue = _kept(resolved)["b"]
+    assert (issue["source_chunk"], issue["overlap_source_chunk"]) == (1, 2)
+    assert stats == {1: {"overlap_issues_reassigned": 1, "overlap_issues_removed": 0}}
+
+
+def test_moved_issue_joins_the_owner_list_so_lists_stay_in_chunk_order():
+    chunks = CHUNKS + [{"chunk_id": 3, "page_start": 6, "page_end": 9}]
+    other = dict(evidence=["Aucun objectif chiffré n'est fixé pour 2030."])
+    issues_by_chunk = [
+        [dict(_issue("a", [2], title="Objectif 2030 absent"), **other)],
+        [_issue("b", [4]), _issue("c", [6])],
+        [dict(_issue("d", [8], title="Objectif 2030 absent"), **other)]
+    ]
+
+    resolved, stats = chunking.resolve_overlap_issues(issues_by_chunk, chunks)
+
+    # b (page 4, tie) moves back to chunk 1, after chunk 1's own issue
+    assert [[issue["issue_id"] for issue in issues] for issues in resolved] == [["a", "b"], ["c"], ["d"]]
+    assert [issue.get("source_chunk", chunk["chunk_id"]) for issues, chunk in zip(resolved, chunks)
+            for issue in issues] == [1, 1, 2, 3]
+    assert stats == {1: {"overlap_issues_reassigned": 1, "overlap_issues_removed": 0}}
+
+
+def test_finding_reported_by_both_chunks_is_kept_once_by_the_owner():
+    resolved, stats = chunking.resolve_overlap_issues([[_issue("a", [5])], [_issue("b", [5])]], CHUNKS)
+
+    assert list(_kept(resolved)) == ["b"]
+    assert "overlap_source_chunk" not in _kept(resolved)["b"]
+    assert stats == {1: {"overlap_issues_reassigned": 0, "overlap_issues_removed": 1}}
+
+
+def test_only_the_same_finding_counts_as_a_duplicate():
+    other_type = _issue("b", [4], issue_type="GREENWASHING")
+    other_text = dict(_issue("c", [4], title="Objectif 2030 absent"), evidence=["Aucun objectif chiffré."])
+    resolved, _ = chunking.resolve_overlap_issues([[_issue("a", [4])], [other_type, other_text]], CHUNKS)
+
+    assert sorted(_kept(resolved)) == ["a", "b", "c"]
+
+
+def test_first_page_in_the_chunk_decides_and_outside_pages_are_ignored():
+    resolved, stats = chunking.resolve_overlap_issues([[], [_issue("b", [1, 4, 6]), _issue("c", [12])]], CHUNKS)
+
+    kept = _kept(resolved)
+    assert kept["b"]["source_chunk"] == 1
+    assert "source_chunk" not in kept["c"]
+    assert stats[1]["overlap_issues_reassigned"] == 1
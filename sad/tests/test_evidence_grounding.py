@@ -0,0 +1,72 @@
+"""
+Tests: Evidence Grounding
+=========================
+
+Checking evidence quotes against the cited pages (utils/evidence_grounding.py).
+"""
+
+import pytest
+
+# evidence_grounding reads CouncilConfig and the helpers from the full package (see conftest.py)
+grounding = pytest.importorskip("csrd_council_2.utils.evidence_grounding")
+page_index_module = pytest.importorskip("csrd_council_2.utils.page_index")
+
+
+PAGES = [
+    {"page_number": 1, "content": "Sommaire du rapport de durabilité et présentation du groupe."},
+    {"page_number": 2, "content": "Les émissions du **scope 3** sont estimées à 1,2 Mt CO2e au total pour l'exercice."},
+    {"page_number": 3, "content": "Le conseil d'administration a validé la politique climat en mars."},
+    {"page_number": 4, "content": "Annexes méthodologiques et tableaux de correspondance ESRS."},
+    {"page_number": 5, "content": "La flotte de véhicules sera entièrement électrique d'ici 2030 selon la direction."},
+]
+
+
+@pytest.fixture
+def index():
+    return page_index_module.PageIndex(PAGES)
+
+
+def _issue(evidence, pages):
+    return {"issue_id": "i1", "evidence": evidence, "page_references": [f"p. {page}" for page in pages]}
+
+
+def test_quote_on_the_cited_page_is_grounded_with_its_location(index):
+    result = grounding.ground_issue(_issue(["émissions du scope 3 sont estimées à 1,2 Mt"], [2]), index)
+
+    assert result["status"] == "grounded" and result["score"] == 1.0
+    quote = result["quotes"][0]
+    assert index.matched_text(quote["page"], quote["start"], quote["end"]) == "émissions du scope 3 sont estimées à 1,2 Mt"
+
+
+def test_page_off_by_one_is_still_grounded(index):
+    assert grounding.ground_issue(_issue(["émissions du scope 3 sont estimées"], [3]), index)["status"] == "grounded"
+
+
+def test_paraphrased_quote_scores_below_an_exact_one(index):
+    quote = "les émissions du scope 3 sont évaluées à 1,2 Mt CO2e au total"
+    result = grounding.ground_issue(_issue([quote], [2]), index)
+
+    assert result["status"] == "grounded"
+    assert 0.6 <= result["score"] < 1.0
+
+
+def test_quote_from_another_part_of_the_document_is_ungrounded(index):
+    issue = _issue(["la flotte de véhicules sera entièrement électrique"], [2])
+    grounding.ground_issues([issue], index)
+
+    assert grounding.is_ungrounded(issue)
+    assert "best match 0.00 < 0.6" in grounding.ungrounded_reason(issue)
+
+
+def test_nothing_to_check_stays_unverified(index):
+    assert grounding.ground_issue(_issue([], [2]), index)["status"] == "unverified"
+    # Too short for a word n-gram and not found verbatim
+    assert grounding.ground_issue(_issue(["chiffre absent"], [2]), index)["status"] == "unverified"
+
+
+def test_existing_annotations_are_kept_unless_overwritten(index):
+    issue = dict(_issue(["la flotte de véhicules sera entièrement électrique"], [5]),
+                 evidence_grounding={"status": "ungrounded", "score": 0.1})
+
+    assert grounding.ground_issues([issue], index)["ungrounded"] == 1
+    assert grounding.ground_issues([issue], index, overwrite=True)["grounded"] == 1
@@ -0,0 +1,46 @@
+"""
+Tests: JSON Repair
+==================
+
+Local repair of unreadable LLM answers (utils/json_repair.py).
+"""
+
+import pytest
+
+# json_repair reads ModelConfig and parse_llm_response from the full package (see conftest.py)
+json_repair = pytest.importorskip("csrd_council_2.utils.json_repair")
+
+repair_json_text = json_repair.repair_json_text
+
+
+def test_truncated_answer_keeps_only_complete_issues():
+    answer = '{"issues": [{"title": "A", "pages": [1, 2]}, {"title": "B", "pages": [3'
+
+    assert repair_json_text(answer) == {"issues": [{"title": "A", "pages": [1, 2]}]}
+
+
+def test_truncated_inside_a_string_drops_the_unfinished_element():
+    answer = '{"summary": "ok", "issues": [{"title": "A"}, {"title": "Objectif non chi'
+
+    assert repair_json_text(answer) == {"summary": "ok", "issues": [{"title": "A"}]}
+
+
+def test_trailing_commas_are_removed():
+    assert repair_json_text('{"issues": [{"title": "A",}, {"title": "B"},],}') == {
+        "issues": [{"title": "A"}, {"title": "B"}]
+    }
+
+
+def test_text_around_the_object_is_ignored():
+    answer = 'Voici l\'analyse :\n```json\n{"issues": [], "note": "a } in a string"}\n```\nCordialement'
+
+    assert repair_json_text(answer) == {"issues": [], "note": "a } in a string"}
+
+
+def test_mismatched_closer_is_treated_as_truncation():
+    assert repair_json_text('{"issues": [{"title": "A"}, {"title": "B"]') == {"issues": [{"title": "A"}]}
+
+
+def test_answer_without_an_object_is_not_repaired():
+    assert repair_json_text("Je ne peux pas analyser ce document.") is None
+    assert repair_json_text('["not", "an", "object"]') is None
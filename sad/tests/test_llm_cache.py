@@ -0,0 +1,112 @@
+"""
+Tests: LLM Response Cache
+=========================
+
+What the response cache stores and how it serves it (utils/llm_cache.py).
+"""
+
+import threading
+import types
+
+import pytest
+
+# llm_cache reads ModelConfig, LLMClient and the helpers from the full package (see conftest.py)
+llm_cache = pytest.importorskip("csrd_council_2.utils.llm_cache")
+
+MODEL = types.SimpleNamespace(name="R1", model_id="m1")
+
+
+class ScriptedClient:
+    """Returns the scripted answers in turn and counts the calls."""
+
+    def __init__(self, *answers):
+        self.answers = list(answers)
+        self.calls = 0
+
+    def generate(self, model, user_prompt, system_prompt=None):
+        self.calls += 1
+        answer = self.answers.pop(0)
+        if answer is None:
+            return types.SimpleNamespace(success=False, answer="", error="HTTP 503")
+        return types.SimpleNamespace(success=True, answer=answer, error=None)
+
+
+def _client(tmp_path, *answers):
+    cache = llm_cache.LLMResponseCache(str(tmp_path / "cache"))
+    return llm_cache.CachedLLMClient(ScriptedClient(*answers), cache), cache
+
+
+def test_parseable_answer_is_stored_and_served_from_disk(tmp_path):
+    client, cache = _client(tmp_path, '```json\n{"issues": []}\n```')
+
+    first = client.generate(MODEL, "prompt", "system")
+    second = client.generate(MODEL, "prompt", "system")
+
+    assert client.llm_client.calls == 1
+    assert second.cached and second.answer == first.answer
+    # A new cache on the same directory serves it too
+    reopened = llm_cache.CachedLLMClient(ScriptedClient(), llm_cache.LLMResponseCache(cache.cache_dir))
+    assert reopened.generate(MODEL, "prompt", "system").answer == first.answer
+
+
+def test_unparseable_or_failed_answers_are_not_stored(tmp_path):
+    client, cache = _client(tmp_path, '{"issues": [{"title": "tronqué', None, '{"issues": []}')
+
+    assert client.generate(MODEL, "prompt", "system").answer.startswith('{"issues": [{')
+    assert not client.generate(MODEL, "prompt", "system").success
+    assert client.generate(MODEL, "prompt", "system").answer == '{"issues": []}'
+
+    assert client.llm_client.calls == 3
+    assert cache.stats()["writes"] == 1 and cache.stats()["entries"] == 1
+
+
+def test_unreadable_entry_is_dropped_as_a_miss(tmp_path):
+    cache = llm_cache.LLMResponseCache(str(tmp_path))
+    cache.put("ab12", "m1", '{"ok": true}')
+    with open(cache._path("ab12"), "w", encoding="utf-8") as f:
+        f.write("{not json")
+
+    assert cache.get("ab12") is None
+    assert cache.stats()["entries"] == 0 and cache.stats()["misses"] == 1
+    assert cache.get("ab12") is None
+
+
+def test_entry_files_are_read_outside_the_lock(tmp_path, monkeypatch):
+    cache = llm_cache.LLMResponseCache(str(tmp_path))
+    cache.put("aa01", "m1", "slow")
+    cache.put("bb02", "m1", "fast")
+
+    reading_slow = threading.Event()
+    release_slow = threading.Event()
+
+    def slow_open(path, *args, **kwargs):
+        if "aa01" in path:
+            reading_slow.set()
+            release_slow.wait(5)
+        return open(path, *args, **kwargs)
+
+    monkeypatch.setattr(llm_cache, "open", slow_open, raising=False)
+    slow = threading.Thread(target=cache.get, args=("aa01",))
+    slow.start()
+    try:
+        assert reading_slow.wait(5)
+        fast = []
+        reader = threading.Thread(target=lambda: fast.append(cache.get("bb02")))
+        reader.start()
+        reader.join(2)
+        assert fast == ["fast"]
+    finally:
+        release_slow.set()
+        slow.join()
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = llm_cache.LLMResponseCache(str(tmp_path), max_mb=250 / (1024 * 1024))
+    for n, key in enumerate(["aa01", "bb02", "cc03"]):
+        cache.put(key, "m1", "x" * 60)
+        if n == 1:
+            cache.get("aa01")
+
+    assert cache.get("bb02") is None
+    assert cache.get("aa01") == "x" * 60 and cache.get("cc03") == "x" * 60
+    assert cache.stats()["evictions"] == 1
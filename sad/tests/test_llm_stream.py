@@ -0,0 +1,90 @@
+"""
+Tests: Streamed LLM Responses
+=============================
+
+Incremental JSON scanning of streamed completions (utils/llm_stream.py).
+"""
+
+import types
+
+import pytest
+
+# llm_stream reads ModelConfig and LLMClient from the full package (see conftest.py)
+llm_stream = pytest.importorskip("csrd_council_2.utils.llm_stream")
+
+
+class FakeStreamingClient:
+    """Streams the given pieces and records how many were pulled."""
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.pulled = 0
+
+    def generate(self, model, user_prompt, system_prompt=None):
+        raise AssertionError("streaming client should not fall back to generate")
+
+    def generate_stream(self, model, user_prompt, system_prompt=None):
+        for piece in self.pieces:
+            self.pulled += 1
+            yield piece
+
+
+def _feed(scanner, pieces):
+    for piece in pieces:
+        if scanner.feed(piece) != "pending":
+            break
+    return scanner.state
+
+
+# =============================================================================
+# SCANNER
+# =============================================================================
+
+def test_object_split_across_pieces_completes_at_its_closing_brace():
+    text = 'Voici : {"issues": [{"t": "a}b]"}, {"q": "\\"}"}]} merci'
+    scanner = llm_stream.JSONStreamScanner()
+
+    assert _feed(scanner, [text[i:i + 3] for i in range(0, len(text), 3)]) == "complete"
+    # Brackets inside strings (escaped quote included) do not close the object
+    assert text[scanner.start:scanner.end] == '{"issues": [{"t": "a}b]"}, {"q": "\\"}"}]}'
+
+
+def test_brace_in_prose_is_not_taken_for_the_object():
+    scanner = llm_stream.JSONStreamScanner()
+
+    assert _feed(scanner, ['Le {résultat} suit : ', '{"ok": true}']) == "complete"
+    assert scanner.start == len('Le {résultat} suit : ')
+
+
+def test_mismatched_bracket_is_malformed():
+    scanner = llm_stream.JSONStreamScanner()
+
+    assert _feed(scanner, ['{"issues": [1, 2}']) == "malformed"
+    assert "unexpected '}'" in scanner.error
+
+
+def test_preamble_longer_than_the_limit_is_malformed():
+    scanner = llm_stream.JSONStreamScanner(max_preamble_chars=10)
+
+    assert _feed(scanner, ["0123456789"]) == "pending"
+    assert _feed(scanner, ["x{}"]) == "malformed"
+
+
+# =============================================================================
+# STREAMING CLIENT
+# =============================================================================
+
+def test_stream_stops_at_the_end_of_the_object():
+    client = FakeStreamingClient(['{"a": ', '1}', ' trailing', ' text'])
+    response = llm_stream.StreamingLLMClient(client).generate(types.SimpleNamespace(), "prompt")
+
+    assert response.success and response.answer == '{"a": 1}'
+    assert client.pulled == 2
+
+
+def test_malformed_stream_is_aborted_and_retryable():
+    client = FakeStreamingClient(['{"a": [1', '}', ' never read'])
+    response = llm_stream.StreamingLLMClient(client).generate(types.SimpleNamespace(), "prompt")
+
+    assert not response.success and response.retryable
+    assert client.pulled == 2
@@ -0,0 +1,72 @@
+"""
+Tests: Phase 1 Analysis
+=======================
+
+Analyst calls of a single chunk (phases/phase1_analysis.py).
+"""
+
+import types
+
+import pytest
+
+# phase1_analysis reads ModelConfig, the LLM client and the helpers from the full package (see conftest.py)
+phase1 = pytest.importorskip("csrd_council_2.phases.phase1_analysis")
+concurrency = pytest.importorskip("csrd_council_2.utils.concurrency")
+
+ANALYST = types.SimpleNamespace(name="A1", model_id="m1")
+CHUNK = {"chunk_id": 2, "page_start": 11, "page_end": 20, "text": "Rapport de durabilité"}
+ANSWER = '{"issues": [{"type": "GREENWASHING", "title": "Neutralité carbone", "page_references": ["p. 12"]}]}'
+
+
+class ScriptedClient:
+    """Returns the scripted responses in turn and records every call."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def generate(self, model, user_prompt, system_prompt=None):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+class CountingLimiter:
+    def __init__(self):
+        self.acquired = []
+
+    def acquire(self, model):
+        self.acquired.append(model.name)
+        return 0.0
+
+
+def _response(answer="", error=None, retryable=None):
+    return types.SimpleNamespace(success=error is None, answer=answer, error=error, retryable=retryable)
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(concurrency.time, "sleep", lambda seconds: None)
+
+
+def test_aborted_malformed_stream_is_retried():
+    client = ScriptedClient(
+        _response('{"issues": [}', error="Malformed JSON stream aborted after 13 characters", retryable=True),
+        _response(ANSWER)
+    )
+    limiter = CountingLimiter()
+
+    output = phase1.analyze_chunk(ANALYST, CHUNK, client, verbose=False, rate_limiter=limiter)
+
+    assert client.calls == 2
+    assert limiter.acquired == ["A1", "A1"]
+    assert [issue["source_chunk"] for issue in output["issues"]] == [2]
+    assert "error" not in output["chunk_detail"]
+
+
+def test_non_retryable_error_is_recorded_on_the_chunk():
+    client = ScriptedClient(_response(error="Invalid API key", retryable=False))
+
+    output = phase1.analyze_chunk(ANALYST, CHUNK, client, verbose=False)
+
+    assert client.calls == 1
+    assert output["issues"] == [] and output["chunk_detail"]["error"] == "Invalid API key"
@@ -0,0 +1,86 @@
+"""
+Tests: Pipelined Execution
+==========================
+
+Scheduling order of the pipelined runner (phases/pipelined.py).
+"""
+
+import threading
+import types
+
+import pytest
+
+# pipelined reads the phase modules from the full package (see conftest.py)
+pipelined = pytest.importorskip("csrd_council_2.phases.pipelined")
+
+MODEL = types.SimpleNamespace(name="m", concurrency=None)
+
+
+def _pipeline(scheduler, log, num_chunks, hold=None):
+    """Queue one analysis per chunk; each submits its review, which submits its judgment."""
+    lock = threading.Lock()
+
+    def record(event):
+        with lock:
+            log.append(event)
+
+    def judge(chunk):
+        record(f"judge {chunk}")
+
+    def review(chunk):
+        record(f"review {chunk}")
+        scheduler.submit(MODEL, lambda: judge(chunk), pipelined.PRIORITY_JUDGE)
+
+    def analyze(chunk):
+        record(f"analysis {chunk} start")
+        if hold is not None and chunk > 0:
+            hold.wait(5)
+        scheduler.submit(MODEL, lambda: review(chunk), pipelined.PRIORITY_REVIEW)
+        record(f"analysis {chunk} end")
+
+    for chunk in range(num_chunks):
+        scheduler.submit(MODEL, lambda c=chunk: analyze(c), pipelined.PRIORITY_ANALYSIS)
+
+
+def test_reviews_and_judgments_run_before_the_remaining_analyses():
+    scheduler = pipelined._Scheduler(1)
+    log = []
+    _pipeline(scheduler, log, 3)
+    scheduler.wait()
+
+    assert log == [
+        "analysis 0 start", "analysis 0 end", "review 0", "judge 0",
+        "analysis 1 start", "analysis 1 end", "review 1", "judge 1",
+        "analysis 2 start", "analysis 2 end", "review 2", "judge 2",
+    ]
+
+
+def test_chunk_review_starts_before_the_last_analysis_finishes():
+    # Two workers, four analyses: the later analyses are held until chunk 0 is judged
+    scheduler = pipelined._Scheduler(2)
+    log = []
+    hold = threading.Event()
+    _pipeline(scheduler, log, 4, hold)
+    threading.Timer(0.2, hold.set).start()
+    scheduler.wait()
+
+    assert log.index("judge 0") < log.index("analysis 3 end")
+    assert log.index("review 0") < log.index("analysis 2 start")
+    assert sorted(log) == sorted(
+        event for chunk in range(4)
+        for event in (f"analysis {chunk} start", f"analysis {chunk} end", f"review {chunk}", f"judge {chunk}")
+    )
+
+
+def test_task_errors_are_raised_after_the_other_tasks_finish():
+    scheduler = pipelined._Scheduler(2)
+    done = []
+
+    def fail():
+        raise ValueError("boom")
+
+    scheduler.submit(MODEL, fail)
+    scheduler.submit(MODEL, lambda: done.append(True))
+    with pytest.raises(ValueError):
+        scheduler.wait()
+    assert done == [True]
@@ -0,0 +1,77 @@
+"""
+Tests: Sequential Review
+========================
+
+Early stopping of the reviewer rounds once an issue's Phase 3 outcome is
+settled (phases/phase2_review.py).
+"""
+
+import types
+
+import pytest
+
+# phase2_review reads ModelConfig, the LLM client and the helpers from the full package (see conftest.py)
+phase2 = pytest.importorskip("csrd_council_2.phases.phase2_review")
+
+
+def _review(score, risk="LOW"):
+    return {"evaluation": {"validity_score": score, "cross_section_risk": risk}}
+
+
+def _reviewers(*names):
+    return [types.SimpleNamespace(name=name) for name in names]
+
+
+GREENWASHING = {"issue_id": "i1", "type": "GREENWASHING"}
+MISSING = {"issue_id": "i2", "type": "MISSING_INFORMATION"}
+
+
+def test_two_reviewers_never_stop_without_a_margin():
+    # One reviewer left can always move the average across a threshold
+    for score in (0.0, 0.5, 1.0):
+        assert phase2.review_outcome_settled(GREENWASHING, [_review(score)], remaining=1) is None
+
+
+def test_guaranteed_outcome_stops_without_a_margin():
+    reviews = [_review(0.0), _review(0.1)]
+
+    assert phase2.review_outcome_settled(GREENWASHING, reviews, remaining=1) == "dismissed"
+    # Two high scores are not enough: a 0 from the last reviewer still drops the average below 0.7
+    assert phase2.review_outcome_settled(GREENWASHING, [_review(0.95), _review(0.95)], remaining=1) is None
+
+
+def test_margin_settles_scores_far_from_the_thresholds():
+    assert phase2.review_outcome_settled(GREENWASHING, [_review(0.9)], remaining=1, margin=0.1) == "confirmed"
+    assert phase2.review_outcome_settled(GREENWASHING, [_review(0.72)], remaining=1, margin=0.1) is None
+
+
+def test_high_fp_risk_type_stays_open_while_a_high_risk_can_still_demote_it():
+    assert phase2.review_outcome_settled(MISSING, [_review(0.9)], remaining=1, margin=0.1) is None
+    # No reviewer left: the risks already reported decide
+    assert phase2.review_outcome_settled(MISSING, [_review(0.9), _review(0.9, "HIGH")], remaining=0) == \
+        "needs_verification"
+
+
+def test_settle_batch_records_skipped_reviews_for_the_remaining_reviewers():
+    r1, r2, r3 = _reviewers("R1", "R2", "R3")
+    issues = [GREENWASHING, dict(GREENWASHING, issue_id="i3")]
+    reviews_by_reviewer = {
+        "R1": [_review(0.0), _review(0.7)],
+        "R2": [None, None],
+        "R3": [None, None]
+    }
+
+    still_open = phase2.settle_batch([0, 1], issues, reviews_by_reviewer, [r1], [r2, r3], margin=0.05)
+
+    assert still_open == [1]
+    for name in ("R2", "R3"):
+        skipped = reviews_by_reviewer[name][0]
+        assert skipped["skipped"] and skipped["evaluation"] is None
+        assert (skipped["issue_id"], skipped["reviewer_id"]) == ("i1", name)
+        assert reviews_by_reviewer[name][1] is None
+
+
+def test_batches_rotate_through_the_reviewers():
+    reviewers = _reviewers("R1", "R2", "R3")
+
+    assert [[r.name for r in phase2.review_order(reviewers, b)][0] for b in range(4)] == ["R1", "R2", "R3", "R1"]
@@ -0,0 +1,140 @@
+"""
+Tests: Streaming JSON Loading
+=============================
+
+Phase file readers and writers (utils/streaming.py): element-by-element
+decoding, chunk-by-chunk access to Phase 1 issues and Phase 2 reviews,
+and the array writer Phase 2 saves with.
+"""
+
+import json
+
+import pytest
+
+from csrd_council_2.utils import streaming
+from csrd_council_2.utils.streaming import (
+    ChunkReviews, JSONLSpill, Phase1Files, Phase2Files, iter_json_array, write_json_array
+)
+
+
+def _write(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    return str(path)
+
+
+def _phase1(path, analyst, chunks):
+    issues = [
+        {"issue_id": f"{analyst}-{n}", "source_chunk": chunk, "type": "GREENWASHING", "title": "Émissions"}
+        for n, chunk in enumerate(chunks)
+    ]
+    return _write(path, {"analyst": analyst, "total_issues": len(issues), "issues": issues})
+
+
+def _phase2(path, reviewer, issue_ids):
+    reviews = [{"reviewer_id": reviewer, "issue_id": issue_id} for issue_id in issue_ids]
+    return _write(path, {"reviewer": reviewer, "reviews": reviews, "stats": {"total": len(reviews)}})
+
+
+# =============================================================================
+# READING
+# =============================================================================
+
+def test_iter_json_array_reads_across_small_blocks(tmp_path, monkeypatch):
+    # Values much larger than the read block must still decode whole
+    monkeypatch.setattr(streaming, "READ_BLOCK_SIZE", 8)
+    issues = [{"issue_id": str(n), "description": "texte " * 50, "score": n / 3} for n in range(5)]
+    path = _write(tmp_path / "phase1.json", {"analyst": "A1", "issues": issues, "after": True})
+
+    header = {}
+    assert list(iter_json_array(path, "issues", header)) == issues
+    assert header == {"analyst": "A1"}
+
+
+def test_iter_json_array_bare_array_and_missing_key(tmp_path):
+    assert list(iter_json_array(_write(tmp_path / "a.json", [1, 2.5, "x"]), "issues")) == [1, 2.5, "x"]
+    assert list(iter_json_array(_write(tmp_path / "b.json", {"other": []}), "issues")) == []
+
+
+# =============================================================================
+# CHUNK-BY-CHUNK ACCESS
+# =============================================================================
+
+def test_iter_chunks_merges_files_in_chunk_order(tmp_path):
+    files = [_phase1(tmp_path / "phase1_A1.json", "A1", [1, 1, 3]), _phase1(tmp_path / "phase1_A2.json", "A2", [1, 2, 3])]
+    layout = Phase1Files(files)
+
+    assert layout.chunk_ordered
+    assert [(chunk, [index for index, _ in entries]) for chunk, entries in layout.iter_chunks()] == [
+        (1, [0, 1, 3]), (2, [4]), (3, [2, 5])
+    ]
+    # Issues come back tagged like iter_phase1_issues
+    _, entries = next(layout.iter_chunks())
+    assert entries[2][1]["_source_analyst"] == "A2"
+
+
+def test_unordered_file_is_flagged_and_regrouped(tmp_path):
+    files = [_phase1(tmp_path / "phase1_A1.json", "A1", [2, 1]), _phase1(tmp_path / "phase1_A2.json", "A2", [1])]
+    layout = Phase1Files(files)
+
+    assert layout.unordered == {0}
+    assert [(chunk, [index for index, _ in entries]) for chunk, entries in layout.iter_chunks()] == [
+        (1, [1, 2]), (2, [0])
+    ]
+
+
+def test_chunk_reviews_are_streamed_when_aligned(tmp_path):
+    layout = Phase1Files([_phase1(tmp_path / "phase1_A1.json", "A1", [1, 2, 2])])
+    phase2 = Phase2Files([
+        _phase2(tmp_path / "phase2_R1.json", "R1", ["A1-0", "A1-1", "A1-2"]),
+        _phase2(tmp_path / "phase2_R2.json", "R2", ["A1-0", "A1-1", "A1-2"]),
+    ])
+    chunk_reviews = ChunkReviews(phase2, layout)
+
+    assert chunk_reviews.streamed
+    assert [
+        [(review["reviewer_id"], review["issue_id"]) for review in chunk_reviews.reviews_for(entries)]
+        for _, entries in layout.iter_chunks()
+    ] == [
+        [("R1", "A1-0"), ("R2", "A1-0")],
+        [("R1", "A1-1"), ("R1", "A1-2"), ("R2", "A1-1"), ("R2", "A1-2")],
+    ]
+
+
+def test_chunk_reviews_fall_back_to_index_when_not_aligned(tmp_path):
+    layout = Phase1Files([_phase1(tmp_path / "phase1_A1.json", "A1", [1, 2])])
+    phase2 = Phase2Files([_phase2(tmp_path / "phase2_R1.json", "R1", ["A1-1", "A1-0"])])
+    chunk_reviews = ChunkReviews(phase2, layout)
+
+    assert not chunk_reviews.streamed
+    assert [
+        [review["issue_id"] for review in chunk_reviews.reviews_for(entries)]
+        for _, entries in layout.iter_chunks()
+    ] == [["A1-0"], ["A1-1"]]
+
+
+# =============================================================================
+# WRITING
+# =============================================================================
+
+@pytest.mark.parametrize("items", [[], [{"a": [1, {"b": "é"}]}, 2, "x"]])
+def test_write_json_array_matches_json_dump(tmp_path, items):
+    path = tmp_path / "out.json"
+    count = write_json_array(str(path), {"name": "R1", "meta": {"k": [1]}}, "reviews", iter(items),
+                             lambda: {"stats": {"total": len(items)}})
+
+    expected = {"name": "R1", "meta": {"k": [1]}, "reviews": items, "stats": {"total": len(items)}}
+    assert count == len(items)
+    assert path.read_text(encoding="utf-8") == json.dumps(expected, indent=2, ensure_ascii=False)
+
+
+def test_spill_view_is_reiterable_in_key_order(tmp_path):
+    spill = JSONLSpill(str(tmp_path))
+    try:
+        spill.extend(("R1", 1), [{"n": 3}])
+        spill.extend(("R1", 0), [{"n": 1}, {"n": 2}])
+        view = spill.view(("R1", 0), ("R1", 1), ("R1", 2))
+        assert list(view) == list(view) == [{"n": 1}, {"n": 2}, {"n": 3}]
+    finally:
+        spill.close()
+    assert not list(tmp_path.iterdir())